@@ -1,5 +1,4 @@
 import asyncio
-import hashlib
 import logging
 import tempfile
 
@@ -8,8 +7,11 @@ import synapse.common as s_common
 
 import synapse.lib.cell as s_cell
 import synapse.lib.base as s_base
+import synapse.lib.coro as s_coro
 import synapse.lib.const as s_const
 import synapse.lib.share as s_share
+import synapse.lib.hashset as s_hashset
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.slabseqn as s_slabseqn
 
@@ -18,6 +20,9 @@ logger = logging.getLogger(__name__)
 CHUNK_SIZE = 16 * s_const.mebibyte
 MAX_SPOOL_SIZE = CHUNK_SIZE * 32  # 512 mebibytes
 
+# upload writes of at least this size are hashed in a worker thread
+HASH_THREAD_SIZE = s_const.mebibyte
+
 class UpLoad(s_base.Base):
 
     async def __anit__(self, axon):  # type: ignore
@@ -27,7 +32,7 @@ class UpLoad(s_base.Base):
         self.axon = axon
         self.fd = tempfile.SpooledTemporaryFile(max_size=MAX_SPOOL_SIZE)
         self.size = 0
-        self.sha256 = hashlib.sha256()
+        self.hashset = s_hashset.HashSet()
         self.onfini(self._uploadFini)
 
     def _uploadFini(self):
@@ -42,19 +47,29 @@ class UpLoad(s_base.Base):
             self.fd.truncate(0)
             self.fd.seek(0)
         self.size = 0
-        self.sha256 = hashlib.sha256()
+        self.hashset = s_hashset.HashSet()
 
     async def write(self, byts):
+
+        # the fd is only used from the ioloop, so fini may close it at any time
         self.size += len(byts)
-        self.sha256.update(byts)
         self.fd.write(byts)
 
+        # hashing releases the GIL, so large writes do not block the ioloop
+        if len(byts) >= HASH_THREAD_SIZE:
+            return await s_coro.executor(self.hashset.update, byts)
+
+        self.hashset.update(byts)
+
     async def save(self):
 
-        sha256 = self.sha256.digest()
+        hashes = dict(self.hashset.digests())
+
+        sha256 = hashes['sha256']
         rsize = self.size
 
         if await self.axon.has(sha256):
+            self.axon._saveHashes(sha256, hashes)
             self._reset()
             return rsize, sha256
 
@@ -73,7 +88,7 @@ class UpLoad(s_base.Base):
 
                 yield byts
 
-        await self.axon.save(sha256, genr())
+        await self.axon.save(sha256, genr(), hashes=hashes)
 
         self._reset()
         return rsize, sha256
@@ -91,9 +106,9 @@ class AxonApi(s_cell.CellApi, s_share.Share):  # type: ignore
         await s_cell.CellApi.__anit__(self, cell, link, user)
         await s_share.Share.__anit__(self, link, None)
 
-    async def get(self, sha256):
+    async def get(self, sha256, offs=None, size=None):
         await self._reqUserAllowed(('axon', 'get'))
-        async for byts in self.cell.get(sha256):
+        async for byts in self.cell.get(sha256, offs=offs, size=size):
             yield byts
 
     async def has(self, sha256):
@@ -114,6 +129,10 @@ class AxonApi(s_cell.CellApi, s_share.Share):  # type: ignore
         await self._reqUserAllowed(('axon', 'has'))
         return await self.cell.wants(sha256s)
 
+    async def hashset(self, sha256):
+        await self._reqUserAllowed(('axon', 'has'))
+        return await self.cell.hashset(sha256)
+
     async def put(self, byts):
         await self._reqUserAllowed(('axon', 'upload'))
         return await self.cell.put(byts)
@@ -145,6 +164,7 @@ class Axon(s_cell.Cell):
         path = s_common.gendir(self.dirn, 'axon.lmdb')
         self.axonslab = await s_lmdbslab.Slab.anit(path)
         self.sizes = self.axonslab.initdb('sizes')
+        self.hashdb = self.axonslab.initdb('hashes')
         self.onfini(self.axonslab.fini)
 
         self.axonhist = s_lmdbslab.Hist(self.axonslab, 'history')
@@ -167,6 +187,7 @@ class Axon(s_cell.Cell):
         path = s_common.gendir(self.dirn, 'blob.lmdb')
         self.blobslab = await s_lmdbslab.Slab.anit(path)
         self.blobs = self.blobslab.initdb('blobs')
+        self.offsets = self.blobslab.initdb('offsets')
         self.onfini(self.blobslab.fini)
 
     def _addSyncItem(self, item):
@@ -181,13 +202,69 @@ class Axon(s_cell.Cell):
         for item in self.axonseqn.iter(offs):
             yield item
 
-    async def get(self, sha256):
+    async def get(self, sha256, offs=None, size=None):
+        '''
+        Yield the bytes of a file in chunks.
 
+        Args:
+            sha256 (bytes): The SHA256 hash of the file.
+            offs (int): The byte offset in the file to begin reading from.
+            size (int): The max number of bytes to read.
+
+        Notes:
+            When offs or size is specified the chunks are yielded as memoryview slices of the stored blobs.
+        '''
         if not await self.has(sha256):
             raise s_exc.NoSuchFile(sha256=s_common.ehex(sha256))
 
-        for _, byts in self.blobslab.scanByPref(sha256, db=self.blobs):
-            yield byts
+        if offs is None and size is None:
+            for _, byts in self.blobslab.scanByPref(sha256, db=self.blobs):
+                yield byts
+            return
+
+        if offs is None:
+            offs = 0
+
+        if offs < 0 or (size is not None and size < 0):
+            raise s_exc.BadArg(mesg='Axon read offset and size must not be negative.', offs=offs, size=size)
+
+        if size == 0:
+            return
+
+        # start from the chunk containing offs (or the first chunk for blobs without an offset index)
+        chunkoffs, indx = self._getChunkOffs(sha256, offs)
+
+        lmin = sha256 + indx.to_bytes(8, 'big')
+        lmax = sha256 + b'\xff' * 8
+
+        for _, byts in self.blobslab.scanByRange(lmin, lmax, db=self.blobs):
+
+            nextoffs = chunkoffs + len(byts)
+            if nextoffs <= offs:
+                chunkoffs = nextoffs
+                continue
+
+            view = memoryview(byts)[max(offs - chunkoffs, 0):]
+            chunkoffs = nextoffs
+
+            if size is not None:
+                view = view[:size]
+                size -= len(view)
+
+            yield view
+
+            if size == 0:
+                return
+
+    def _getChunkOffs(self, sha256, offs):
+        '''
+        Return a (chunkoffs, indx) tuple for the blob chunk containing the given file offset.
+        '''
+        lmax = sha256 + offs.to_bytes(8, 'big')
+        for lkey, lval in self.blobslab.scanByRangeBack(lmax, lmin=sha256, db=self.offsets):
+            return int.from_bytes(lkey[32:], 'big'), int.from_bytes(lval, 'big')
+
+        return 0, 0
 
     async def put(self, byts):
         # Use a UpLoad context manager so that we can
@@ -198,7 +275,76 @@ class Axon(s_cell.Cell):
             return await fd.save()
 
     async def puts(self, files):
-        return [await self.put(b) for b in files]
+        '''
+        Save a list of files (bytes) and return a list of (size, sha256) tuples.
+
+        Notes:
+            The files are hashed in a worker thread and new files are stored with a
+            single putmulti per database, which is much faster than put() for many
+            small files.
+        '''
+        hashlist = await s_coro.executor(self._hashFiles, files)
+
+        retn = []
+
+        seen = set()
+        items = []
+
+        blobrows = []
+        offsrows = []
+        sizerows = []
+        hashrows = []
+
+        for byts, hashes in zip(files, hashlist):
+
+            size = len(byts)
+            sha256 = hashes['sha256']
+
+            retn.append((size, sha256))
+
+            if sha256 in seen:
+                continue
+
+            seen.add(sha256)
+
+            if await self.has(sha256):
+                self._saveHashes(sha256, hashes)
+                continue
+
+            view = memoryview(byts)
+            for i, offs in enumerate(range(0, size, CHUNK_SIZE)):
+                indx = i.to_bytes(8, 'big')
+                blobrows.append((sha256 + indx, view[offs:offs + CHUNK_SIZE]))
+                offsrows.append((sha256 + offs.to_bytes(8, 'big'), indx))
+
+            items.append((sha256, size))
+            sizerows.append((sha256, size.to_bytes(8, 'big')))
+            hashrows.append((sha256, s_msgpack.en(hashes)))
+
+        if not items:
+            return retn
+
+        self.blobslab.putmulti(blobrows, db=self.blobs)
+        self.blobslab.putmulti(offsrows, db=self.offsets)
+
+        [self.axonhist.add(item) for item in items]
+        self.axonseqn.save(items)
+
+        await self.axonmetrics.set('file:count', self.axonmetrics.get('file:count') + len(items))
+        await self.axonmetrics.set('size:bytes', self.axonmetrics.get('size:bytes') + sum(i[1] for i in items))
+
+        self.axonslab.putmulti(hashrows, db=self.hashdb)
+        self.axonslab.putmulti(sizerows, db=self.sizes)
+
+        return retn
+
+    def _hashFiles(self, files):
+        retn = []
+        for byts in files:
+            hset = s_hashset.HashSet()
+            hset.update(byts)
+            retn.append(dict(hset.digests()))
+        return retn
 
     async def upload(self):
         return await UpLoad.anit(self)
@@ -206,17 +352,34 @@ class Axon(s_cell.Cell):
     async def has(self, sha256):
         return self.axonslab.get(sha256, db=self.sizes) is not None
 
+    async def hashset(self, sha256):
+        '''
+        Return a dict of the hex digests (md5, sha1, sha256, sha512) for a file or None if they are not known.
+        '''
+        byts = self.axonslab.get(sha256, db=self.hashdb)
+        if byts is None:
+            return None
+
+        return {name: s_common.ehex(valu) for name, valu in s_msgpack.un(byts).items()}
+
+    def _saveHashes(self, sha256, hashes):
+        if hashes is not None:
+            self.axonslab.put(sha256, s_msgpack.en(hashes), db=self.hashdb, overwrite=False)
+
     async def metrics(self):
         return dict(self.axonmetrics.items())
 
-    async def save(self, sha256, genr):
+    async def save(self, sha256, genr, hashes=None):
 
         byts = self.axonslab.get(sha256, db=self.sizes)
         if byts is not None:
+            self._saveHashes(sha256, hashes)
             return int.from_bytes(byts, 'big')
 
         size = await self._saveFileGenr(sha256, genr)
 
+        self._saveHashes(sha256, hashes)
+
         self._addSyncItem((sha256, size))
 
         await self.axonmetrics.set('file:count', self.axonmetrics.get('file:count') + 1)
@@ -229,10 +392,15 @@ class Axon(s_cell.Cell):
     async def _saveFileGenr(self, sha256, genr):
         size = 0
         for i, byts in enumerate(genr):
+
+            indx = i.to_bytes(8, 'big')
+
+            self.blobslab.put(sha256 + indx, byts, db=self.blobs)
+            self.blobslab.put(sha256 + size.to_bytes(8, 'big'), indx, db=self.offsets)
+
             size += len(byts)
-            lkey = sha256 + i.to_bytes(8, 'big')
-            self.blobslab.put(lkey, byts, db=self.blobs)
             await asyncio.sleep(0)
+
         return size
 
     async def wants(self, sha256s):
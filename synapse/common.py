@@ -10,6 +10,7 @@ import shutil
 import struct
 import fnmatch
 import hashlib
+import heapq
 import logging
 import binascii
 import builtins
@@ -512,6 +513,50 @@ async def aspin(genr):
     async for _ in genr:
         pass
 
+async def merggenr(genrs, key=None):
+    '''
+    Merge multiple sorted async generators into a single sorted async generator.
+
+    Args:
+        genrs (list): A list of async generators which each yield items in sorted order.
+        key (function): An optional function used to extract a comparison key from each item.
+
+    Notes:
+        Items which compare equal are yielded in the order of the generators in the genrs list.
+
+    Yields:
+        The items from all the generators, in sorted order.
+    '''
+    if key is None:
+        key = lambda x: x
+
+    heap = []
+
+    try:
+
+        for indx, genr in enumerate(genrs):
+            async for item in genr:
+                heap.append((key(item), indx, item))
+                break
+
+        heapq.heapify(heap)
+
+        while heap:
+
+            _, indx, item = heap[0]
+
+            yield item
+
+            async for item in genrs[indx]:
+                heapq.heapreplace(heap, (key(item), indx, item))
+                break
+            else:
+                heapq.heappop(heap)
+
+    finally:
+        for genr in genrs:
+            await genr.aclose()
+
 def firethread(f):
     '''
     A decorator for making a function fire a thread.
@@ -2,6 +2,7 @@ import os
 import copy
 import asyncio
 import logging
+import itertools
 import contextlib
 import collections
 
@@ -14,6 +15,7 @@ import synapse.common as s_common
 import synapse.telepath as s_telepath
 import synapse.datamodel as s_datamodel
 
+import synapse.lib.ast as s_ast
 import synapse.lib.cell as s_cell
 import synapse.lib.coro as s_coro
 import synapse.lib.hive as s_hive
@@ -33,6 +35,7 @@ import synapse.lib.modules as s_modules
 import synapse.lib.version as s_version
 import synapse.lib.modelrev as s_modelrev
 import synapse.lib.stormsvc as s_stormsvc
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.stormhttp as s_stormhttp
 import synapse.lib.stormwhois as s_stormwhois
@@ -47,6 +50,9 @@ A Cortex implements the synapse hypergraph object.
 
 reqver = '>=0.2.0,<0.3.0'
 
+# the maximum number of parsed storm queries persisted to disk
+STORM_QUERY_CACHE_SIZE = 100000
+
 class CoreApi(s_cell.CellApi):
     '''
     The CoreApi is exposed when connecting to a Cortex over Telepath.
@@ -712,6 +718,16 @@ class Cortex(s_cell.Cell):  # type: ignore
             'description': 'Enable cron jobs running.',
             'type': 'boolean'
         },
+        'cron:maxjobs': {
+            'default': 0,
+            'description': 'The max number of cron jobs which may run at once (0 for no limit). Others wait to run.',
+            'type': 'integer'
+        },
+        'cron:maxjobs:user': {
+            'default': 0,
+            'description': 'The max number of cron jobs for a single user which may run at once (0 for no limit).',
+            'type': 'integer'
+        },
         'trigger:enable': {
             'default': True,
             'description': 'Enable triggers running.',
@@ -747,6 +763,11 @@ class Cortex(s_cell.Cell):  # type: ignore
             'description': 'The max number of spare processes to keep around in the storm spawn pool.',
             'type': 'integer'
         },
+        'spawn:poolsize:min': {
+            'default': 0,
+            'description': 'The number of processes to keep warmed up in the storm spawn pool.',
+            'type': 'integer'
+        },
         'storm:log': {
             'default': False,
             'description': 'Log storm queries via system logger.',
@@ -830,6 +851,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.onfini(self._onCoreFini)
 
         await self._initCoreHive()
+        await self._initStormQueryCache()
         self._initSplicers()
         self._initStormLibs()
         self._initFeedFuncs()
@@ -848,11 +870,11 @@ class Cortex(s_cell.Cell):  # type: ignore
         # Initialize our storage and views
         await self._initCoreAxon()
 
+        await self._initCoreQueues()
         await self._initCoreLayers()
         await self._initCoreViews()
         self.onfini(self._finiStor)
         await self._checkLayerModels()
-        await self._initCoreQueues()
 
         self.addHealthFunc(self._cortexHealth)
 
@@ -860,7 +882,6 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.onfini(self.stormdmons)
         self.agenda = await s_agenda.Agenda.anit(self)
         self.onfini(self.agenda)
-        await self._initStormDmons()
 
         self.trigson = self.conf.get('trigger:enable')
 
@@ -880,6 +901,9 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.onfini(self.spawnpool)
         self.on('user:mod', self._onEvtBumpSpawnPool)
 
+        # spawn dmons require the spawn pool
+        await self._initStormDmons()
+
         self.dynitems.update({
             'cron': self.agenda,
             'cortex': self,
@@ -924,9 +948,15 @@ class Cortex(s_cell.Cell):  # type: ignore
     async def _onEvtBumpSpawnPool(self, evnt):
         await self.bumpSpawnPool()
 
-    async def bumpSpawnPool(self):
+    async def bumpSpawnPool(self, update=None):
+        '''
+        Update or retire the processes in the storm spawn pool.
+
+        Args:
+            update ((str, tuple)): An optional (name, args) change which spawned processes may apply incrementally.
+        '''
         if self.spawnpool is not None:
-            await self.spawnpool.bump()
+            await self.spawnpool.bump(update=update)
 
     async def addCoreQueue(self, name, info):
 
@@ -1111,6 +1141,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.onfini(slab.fini)
 
         self.multiqueue = await slab.getMultiQueue('cortex:queue', nexsroot=self.nexsroot)
+        self.trigqueue = await slab.getMultiQueue('cortex:trigqueue')
 
     @s_nexus.Pusher.onPushAuto('cmd:set')
     async def setStormCmd(self, cdef):
@@ -1206,13 +1237,13 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.stormcmds[name] = ctor
         self.storm_cmd_cdefs[name] = cdef
 
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('cmd:set', (cdef,)))
 
         await self.fire('core:cmd:change', cmd=name, act='add')
 
     async def _popStormCmd(self, name):
         self.stormcmds.pop(name, None)
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('cmd:pop', (name,)))
 
         await self.fire('core:cmd:change', cmd=name, act='del')
 
@@ -1240,7 +1271,7 @@ class Cortex(s_cell.Cell):  # type: ignore
 
         await self.cmdhive.pop(name)
         self.stormcmds.pop(name, None)
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('cmd:pop', (name,)))
 
         await self.fire('core:cmd:change', cmd=name, act='del')
 
@@ -1353,7 +1384,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         for cdef in cmds:
             await self._setStormCmd(cdef)
 
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('pkg:load', (pkgdef,)))
 
     async def _dropStormPkg(self, pkgdef):
         '''
@@ -1367,7 +1398,7 @@ class Cortex(s_cell.Cell):  # type: ignore
             name = cdef.get('name')
             await self._popStormCmd(name)
 
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('pkg:drop', (pkgdef,)))
 
     def getStormSvc(self, name):
 
@@ -1407,7 +1438,7 @@ class Cortex(s_cell.Cell):  # type: ignore
 
         ssvc = await self._setStormSvc(sdef)
         await self.stormservices.set(iden, sdef)
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('svc:add', (sdef,)))
 
         return ssvc.sdef
 
@@ -1635,6 +1666,7 @@ class Cortex(s_cell.Cell):  # type: ignore
 
         await self.extunivs.set(name, (name, tdef, info))
         await self.fire('core:extmodel:change', prop=name, act='add', type='univ')
+        await self.bumpSpawnPool(('model:univ:add', (name, tdef, info)))
 
     @s_nexus.Pusher.onPushAuto('model:prop:add')
     async def addFormProp(self, form, prop, tdef, info):
@@ -1646,7 +1678,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         await self.extprops.set(f'{form}:{prop}', (form, prop, tdef, info))
         await self.fire('core:extmodel:change',
                         form=form, prop=prop, act='add', type='formprop')
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('model:prop:add', (form, prop, tdef, info)))
 
     async def delFormProp(self, form, prop):
         full = f'{form}:{prop}'
@@ -1678,7 +1710,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         await self.extprops.pop(full, None)
         await self.fire('core:extmodel:change',
                         form=form, prop=prop, act='del', type='formprop')
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('model:prop:del', (form, prop)))
 
     async def delUnivProp(self, prop):
         udef = self.extunivs.get(prop)
@@ -1706,7 +1738,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         self.model.delUnivProp(prop)
         await self.extunivs.pop(prop, None)
         await self.fire('core:extmodel:change', name=prop, act='del', type='univ')
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('model:univ:del', (prop,)))
 
     async def addTagProp(self, name, tdef, info):
         if self.exttagprops.get(name) is not None:
@@ -1723,7 +1755,7 @@ class Cortex(s_cell.Cell):  # type: ignore
 
         await self.exttagprops.set(name, (name, tdef, info))
         await self.fire('core:tagprop:change', name=name, act='add')
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('model:tagprop:add', (name, tdef, info)))
 
     async def delTagProp(self, name):
         pdef = self.exttagprops.get(name)
@@ -1748,7 +1780,7 @@ class Cortex(s_cell.Cell):  # type: ignore
 
         await self.exttagprops.pop(name, None)
         await self.fire('core:tagprop:change', name=name, act='del')
-        await self.bumpSpawnPool()
+        await self.bumpSpawnPool(('model:tagprop:del', (name,)))
 
     async def addNodeTag(self, user, iden, tag, valu=(None, None)):
         '''
@@ -2175,6 +2207,7 @@ class Cortex(s_cell.Cell):  # type: ignore
     async def _loadView(self, node):
 
         view = await self.viewctor(self, node)
+        await view.initTrigQueue()
 
         self.views[view.iden] = view
         self.dynitems[view.iden] = view
@@ -2805,12 +2838,7 @@ class Cortex(s_cell.Cell):  # type: ignore
         opts = self._initStormOpts(opts)
 
         view = self._viewFromOpts(opts)
-
-        i = 0
-        async for _ in view.eval(text, opts=opts):
-            i += 1
-
-        return i
+        return await view.count(text, opts=opts)
 
     async def storm(self, text, opts=None):
         '''
@@ -2853,12 +2881,85 @@ class Cortex(s_cell.Cell):  # type: ignore
     async def stormlist(self, text, opts=None):
         return [m async for m in self.storm(text, opts=opts)]
 
+    async def _initStormQueryCache(self, readonly=False):
+        '''
+        Open the persistent cache of parsed storm queries which is shared with spawn processes.
+        '''
+        path = os.path.join(self.dirn, 'slabs', 'queries.lmdb')
+
+        self.queryslab = await s_lmdbslab.Slab.anit(path, readonly=readonly)
+        self.onfini(self.queryslab.fini)
+
+        vers = s_common.guid((s_version.version, s_parser.grammarhash))
+
+        self.querymeta = self.queryslab.initdb('meta')
+        self.querydb = self.queryslab.initdb('queries')
+
+        if readonly:
+            return
+
+        if self.queryslab.get(b'vers', db=self.querymeta) != vers.encode():
+            self.queryslab.dropdb('queries')
+            self.querydb = self.queryslab.initdb('queries')
+            self.queryslab.put(b'vers', vers.encode(), db=self.querymeta)
+
+    def _getCachedStormQuery(self, lkey):
+
+        byts = self.queryslab.get(lkey, db=self.querydb)
+        if byts is None:
+            return None
+
+        try:
+            return s_ast.unpack(s_msgpack.un(byts))
+
+        except Exception as e:
+            logger.warning(f'Invalid cached storm query ({s_common.ehex(lkey)}): {e}')
+            return None
+
+    def _putCachedStormQuery(self, lkey, byts):
+
+        if self.queryslab.readonly:
+            return
+
+        # evict a slice of the (hash ordered, so effectively random) entries when full
+        size = self.queryslab.stat(db=self.querydb)['entries']
+        if size >= STORM_QUERY_CACHE_SIZE:
+            count = size - STORM_QUERY_CACHE_SIZE + max(1, STORM_QUERY_CACHE_SIZE // 10)
+            lkeys = list(itertools.islice(self.queryslab.scanKeys(db=self.querydb), count))
+            [self.queryslab.delete(lkey, db=self.querydb) for lkey in lkeys]
+
+        self.queryslab.put(lkey, byts, db=self.querydb)
+
     @s_cache.memoize(size=10000)
     def getStormQuery(self, text):
         '''
         Parse storm query text and return a Query object.
+
+        Notes:
+            Parsed queries are persisted by the hash of their text so the
+            query is only parsed once for the cortex and its spawn processes.
         '''
-        query = copy.deepcopy(s_parser.parseQuery(text))
+        lkey = s_common.buid(text)
+
+        query = self._getCachedStormQuery(lkey)
+        if query is None:
+
+            # the parser memoizes its results, so never init() the parsed query itself
+            query = s_parser.parseQuery(text)
+
+            try:
+                item = query.pack()
+                byts = s_msgpack.en(item)
+
+            except Exception as e:
+                # not every valid query is msgpack safe (e.g. large integer constants)
+                logger.warning(f'Unable to cache storm query ({s_common.ehex(lkey)}): {e}')
+                query = copy.deepcopy(query)
+
+            else:
+                self._putCachedStormQuery(lkey, byts)
+                query = s_ast.unpack(item)
+
         query.init(self)
         return query
 
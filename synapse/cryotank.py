@@ -8,18 +8,29 @@ import synapse.common as s_common
 
 import synapse.lib.base as s_base
 import synapse.lib.cell as s_cell
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.slabseqn as s_slabseqn
 import synapse.lib.slaboffs as s_slaboffs
 
 logger = logging.getLogger(__name__)
 
+def unpackBatch(byts):
+    '''
+    Unpack a batch of (indx, item) tuples yielded by CryoTank.batches().
+    '''
+    return list(s_msgpack.iterbyts(byts))
+
 class TankApi(s_cell.CellApi):
 
     async def slice(self, offs, size=None, iden=None):
         async for item in self.cell.slice(offs, size=size, iden=iden):
             yield item
 
+    async def batches(self, offs, size=None, iden=None, batch=1000, fields=None):
+        async for byts in self.cell.batches(offs, size=size, iden=iden, batch=batch, fields=fields):
+            yield byts
+
     async def puts(self, items, seqn=None):
         return await self.cell.puts(items, seqn=seqn)
 
@@ -165,6 +176,58 @@ class CryoTank(s_base.Base):
 
             yield indx, item
 
+    async def batches(self, offs, size=None, iden=None, batch=1000, fields=None):
+        '''
+        Yield batches of items from the CryoTank starting at a given offset.
+
+        Args:
+            offs (int): The index of the desired datum (starts at 0)
+            size (int): The max number of items to yield.
+            batch (int): The max number of items in each batch.
+            fields (list): Only include these keys from dict items.
+
+        Notes:
+            Without fields, items are copied into the batch as raw msgpack bytes
+            without being decoded.  Use unpackBatch() to decode a batch.
+
+        Yields:
+            (bytes): Concatenated msgpacked (indx, item) tuples.
+        '''
+        if iden is not None:
+            self.setOffset(iden, offs)
+
+        if size is not None and size <= 0:
+            return
+
+        count = 0
+
+        for chunk in s_common.chunks(self._items.rows(offs), batch):
+
+            if size is not None:
+                chunk = chunk[:size - count]
+
+            if fields is None:
+                # a msgpack fixarray header for each (indx, item) tuple
+                byts = b''.join(b'\x92' + s_msgpack.en(indx) + lval for indx, lval in chunk)
+            else:
+                byts = b''.join(s_msgpack.en((indx, self._project(lval, fields))) for indx, lval in chunk)
+
+            yield byts
+
+            count += len(chunk)
+            if size is not None and count >= size:
+                return
+
+            await asyncio.sleep(0)
+
+    def _project(self, byts, fields):
+
+        item = s_msgpack.un(byts)
+        if not isinstance(item, dict):
+            return item
+
+        return {name: item[name] for name in fields if name in item}
+
     async def rows(self, offs, size=None, iden=None):
         '''
         Yield a number of raw items from the CryoTank starting at a given offset.
@@ -211,6 +274,11 @@ class CryoApi(s_cell.CellApi):
         async for item in tank.slice(offs, size=size, iden=iden):
             yield item
 
+    async def batches(self, name, offs, size=None, iden=None, batch=1000, fields=None):
+        tank = await self.cell.init(name)
+        async for byts in tank.batches(offs, size=size, iden=iden, batch=batch, fields=fields):
+            yield byts
+
     async def list(self):
         return await self.cell.list()
 
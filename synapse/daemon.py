@@ -1,3 +1,4 @@
+import time
 import types
 import asyncio
 import logging
@@ -13,6 +14,7 @@ import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
 import synapse.lib.scope as s_scope
 import synapse.lib.share as s_share
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.certdir as s_certdir
 import synapse.lib.urlhelp as s_urlhelp
 import synapse.lib.reflect as s_reflect
@@ -28,6 +30,8 @@ class Sess(s_base.Base):
         self.user = None
         self.conninfo = {}
 
+        self.tasksema = asyncio.Semaphore(T2_MUX_TASKS)
+
     def getSessItem(self, name):
         return self.items.get(name)
 
@@ -113,16 +117,152 @@ class AsyncGenr(s_share.Share):
             await self.link.tx(mesg)
             await self.fini()
 
+# t2:yields frames are sent at this many items, bytes or seconds since the first buffered item
+T2_YIELDS_COUNT = 1000
+T2_YIELDS_SIZE = 1024 * 1024
+T2_YIELDS_TIME = 0.05
+
+class T2Yields:
+    '''
+    Batches the items from a telepath task v2 generator into t2:yields frames.
+
+    Notes:
+        Each frame consumes one credit which the client returns with a
+        t2:credit message once it has consumed the frame.
+    '''
+    def __init__(self, link, credit):
+
+        self.link = link
+
+        self.size = 0
+        self.tick = 0
+        self.items = []
+
+        self.lock = asyncio.Lock()
+        self.credit = asyncio.Semaphore(credit)
+
+        # the number of frames sent which the client has not returned credit for
+        self.unacked = 0
+
+    async def add(self, item):
+
+        byts = s_msgpack.en(item)
+
+        if not self.items:
+            self.tick = time.monotonic()
+
+        self.items.append(byts)
+        self.size += len(byts)
+
+        if len(self.items) >= T2_YIELDS_COUNT or self.size >= T2_YIELDS_SIZE:
+            await self.flush()
+            return
+
+        if time.monotonic() - self.tick >= T2_YIELDS_TIME:
+            await self.flush()
+
+    async def flush(self):
+
+        async with self.lock:
+
+            if not self.items:
+                return
+
+            items = self.items
+
+            self.size = 0
+            self.items = []
+
+            await self.credit.acquire()
+            self.unacked += 1
+
+            await self.link.tx(('t2:yields', {'items': items}))
+
+    def release(self, frames):
+        '''
+        Return the credit for frames which the client has consumed.
+
+        Notes:
+            Credit is only returned for frames which have been sent, so the
+            client can not grow the window past its initial credit.
+        '''
+        frames = min(frames, self.unacked)
+        self.unacked -= frames
+
+        for _ in range(frames):
+            self.credit.release()
+
+    async def flushloop(self):
+        '''
+        Flush buffered items which have waited too long for a slow generator.
+        '''
+        while True:
+
+            await asyncio.sleep(T2_YIELDS_TIME)
+
+            if self.items and time.monotonic() - self.tick >= T2_YIELDS_TIME:
+                await self.flush()
+
+# the number of multiplexed task v2 calls a session may run at once
+T2_MUX_TASKS = 256
+
+class TaskLink:
+    '''
+    Adapts the main link of a session for a multiplexed telepath task v2 call.
+
+    Messages sent via the TaskLink are tagged with the task iden so the
+    client may demultiplex them from other tasks sharing the link.
+    '''
+    def __init__(self, link, iden):
+
+        self.link = link
+        self.iden = iden
+
+        self.info = {}
+        self.task = None
+
+    @property
+    def isfini(self):
+        return self.link.isfini
+
+    async def tx(self, mesg):
+        name, info = mesg
+        await self.link.tx((name, dict(info, task=self.iden)))
+
+    def get(self, name, defval=None):
+        if name in self.info:
+            return self.info.get(name)
+        return self.link.get(name, defval)
+
+    def set(self, name, valu):
+        self.info[name] = valu
+
+    def schedCoro(self, coro):
+        return self.link.schedCoro(coro)
+
+    def getSpawnInfo(self):
+        mesg = 'Spawned tasks require a dedicated telepath link.'
+        raise s_exc.BadArg(mesg=mesg)
+
+    async def fini(self):
+        # a multiplexed task may only cancel itself
+        if self.task is not None:
+            self.task.cancel()
+
 dmonwrap = (
     (s_coro.GenrHelp, AsyncGenr),
     (types.AsyncGeneratorType, AsyncGenr),
     (types.GeneratorType, Genr),
 )
 
-async def t2call(link, meth, args, kwargs):
+async def t2call(link, meth, args, kwargs, credit=None):
     '''
     Call the given meth(*args, **kwargs) and handle the response
     to provide telepath task v2 events to the given link.
+
+    Notes:
+        If the client provided a credit for t2:yields frames, generator
+        items are sent in batches rather than one t2:yield per item.
     '''
     try:
 
@@ -131,6 +271,12 @@ async def t2call(link, meth, args, kwargs):
         if s_coro.iscoro(valu):
             valu = await valu
 
+        yields = None
+        if credit is not None and isinstance(valu, (types.AsyncGeneratorType, types.GeneratorType)):
+            yields = T2Yields(link, credit)
+            link.set('t2:yields', yields)
+            flushtask = link.schedCoro(yields.flushloop())
+
         try:
 
             first = True
@@ -142,11 +288,18 @@ async def t2call(link, meth, args, kwargs):
                         await link.tx(('t2:genr', {}))
                         first = False
 
+                    if yields is not None:
+                        await yields.add(item)
+                        continue
+
                     await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                if yields is not None:
+                    await yields.flush()
+
                 await link.tx(('t2:yield', {'retn': None}))
                 return
 
@@ -158,11 +311,18 @@ async def t2call(link, meth, args, kwargs):
                         await link.tx(('t2:genr', {}))
                         first = False
 
+                    if yields is not None:
+                        await yields.add(item)
+                        continue
+
                     await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                if yields is not None:
+                    await yields.flush()
+
                 await link.tx(('t2:yield', {'retn': None}))
                 return
 
@@ -186,11 +346,22 @@ async def t2call(link, meth, args, kwargs):
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                # send the items yielded before the exception
+                if yields is not None:
+                    await yields.flush()
+
                 retn = s_common.retnexc(e)
                 await link.tx(('t2:yield', {'retn': retn}))
 
             return
 
+        finally:
+            if yields is not None:
+                flushtask.cancel()
+                # the pool link may already be running the next task
+                if link.get('t2:yields') is yields:
+                    link.set('t2:yields', None)
+
         if isinstance(valu, s_share.Share):
 
             info = s_reflect.getShareInfo(valu)
@@ -239,6 +410,8 @@ class Daemon(s_base.Base):
 
             # task version 2 API
             't2:init': self._onTaskV2Init,
+            't2:credit': self._onTaskV2Credit,
+            't2:cancel': self._onTaskV2Cancel,
         }
 
         self.onfini(self._onDmonFini)
@@ -416,6 +589,7 @@ class Daemon(s_base.Base):
             sess.conninfo = link.getAddrInfo()
 
             link.set('sess', sess)
+            link.set('t2:tasks', {})
 
             if isinstance(item, s_telepath.Aware):
                 item = await s_coro.ornot(item.getTeleApi, link, mesg, path)
@@ -427,6 +601,9 @@ class Daemon(s_base.Base):
             sess.setSessItem(None, item)
             reply[1]['sess'] = sess.iden
 
+            # clients may multiplex t2:init calls over this link
+            reply[1]['mux'] = {'tasks': T2_MUX_TASKS}
+
         except Exception as e:
             logger.exception('tele:syn error')
             reply[1]['retn'] = s_common.retnexc(e)
@@ -459,11 +636,40 @@ class Daemon(s_base.Base):
     async def _onTaskV2Init(self, link, mesg):
 
         # t2:init is used by the pool sockets on the client
+        # or multiplexed over the main link with a task iden
+
+        iden = mesg[1].get('task')
+        if iden is None:
+            return await self._runTaskV2(link, mesg)
+
+        tasklink = TaskLink(link, iden)
+
+        tasks = link.get('t2:tasks')
+        if tasks is None:
+            retn = s_common.retnexc(s_exc.NoSuchObj(name=mesg[1].get('name')))
+            await tasklink.tx(('t2:fini', {'retn': retn}))
+            return
+
+        tasklink.task = asyncio.current_task()
+
+        tasks[iden] = tasklink
+
+        try:
+            async with link.get('sess').tasksema:
+                await self._runTaskV2(tasklink, mesg)
+
+        finally:
+            tasks.pop(iden, None)
+
+    async def _runTaskV2(self, link, mesg):
 
         name = mesg[1].get('name')
         sidn = mesg[1].get('sess')
         todo = mesg[1].get('todo')
 
+        # clients which support t2:yields frames provide an initial credit
+        credit = mesg[1].get('yields', {}).get('credit')
+
         try:
 
             if sidn is None or todo is None:
@@ -490,7 +696,7 @@ class Daemon(s_base.Base):
                 logger.warning('%r has no method: %r', item, methname)
                 raise s_exc.NoSuchMeth(name=methname)
 
-            sessitem = await t2call(link, meth, args, kwargs)
+            sessitem = await t2call(link, meth, args, kwargs, credit=credit)
             if sessitem is not None:
                 sess.onfini(sessitem)
 
@@ -500,6 +706,40 @@ class Daemon(s_base.Base):
                 retn = s_common.retnexc(e)
                 await link.tx(('t2:fini', {'retn': retn}))
 
+    def _getTaskLink(self, link, mesg):
+
+        iden = mesg[1].get('task')
+        if iden is None:
+            return link
+
+        return link.get('t2:tasks', {}).get(iden)
+
+    async def _onTaskV2Credit(self, link, mesg):
+
+        link = self._getTaskLink(link, mesg)
+        if link is None:
+            return
+
+        yields = link.get('t2:yields')
+        if yields is None:
+            return
+
+        frames = mesg[1].get('frames', 1)
+        if not isinstance(frames, int) or isinstance(frames, bool) or frames < 1:
+            logger.warning('t2:credit with invalid frames: %r', frames)
+            return
+
+        yields.release(frames)
+
+    async def _onTaskV2Cancel(self, link, mesg):
+
+        # the client abandoned a multiplexed task ( such as a generator )
+        tasklink = self._getTaskLink(link, mesg)
+        if tasklink is None or tasklink is link:
+            return
+
+        await tasklink.fini()
+
     async def _onTaskInit(self, link, mesg):
 
         task = mesg[1].get('task')
@@ -2,11 +2,13 @@ import enum
 import time
 import heapq
 import asyncio
+import bisect
 import logging
 import calendar
 import datetime
 import functools
 import itertools
+import contextlib
 from datetime import timezone as tz
 from collections.abc import Iterable, Mapping
 
@@ -21,10 +23,14 @@ import synapse.lib.provenance as s_provenance
 
 logger = logging.getLogger(__name__)
 
+# upper bounds (in seconds) of the run time histogram buckets for each appointment
+RUNTIME_BUCKETS = (1, 10, 60, 300, 900, 3600, 14400)
+
 reqValidCdef = s_config.getJsValidator({
     'type': 'object',
     'properties': {
         'storm': {'type': 'string'},
+        'spawn': {'type': 'boolean'},
         'creator': {'type': 'string', 'pattern': s_config.re_iden},
         'incunit': {
             'oneOf': [
@@ -329,6 +335,8 @@ class _Appt:
         self.lastfinishtime = None
         self.lastresult = None
         self.enabled = True
+        self.spawn = False  # whether to run the query in a spawn process
+        self.runtimes = [0] * (len(RUNTIME_BUCKETS) + 1)  # counts of run times per RUNTIME_BUCKETS entry
 
     def getStorNode(self, form):
         ndef = (form.name, form.type.norm(self.iden)[0])
@@ -376,7 +384,9 @@ class _Appt:
             'isrunning': self.isrunning,
             'laststarttime': self.laststarttime,
             'lastfinishtime': self.lastfinishtime,
-            'lastresult': self.lastresult
+            'lastresult': self.lastresult,
+            'spawn': self.spawn,
+            'runtimes': self.runtimes,
         }
 
     @classmethod
@@ -392,9 +402,20 @@ class _Appt:
         appt.lastfinishtime = val['lastfinishtime']
         appt.lastresult = val['lastresult']
         appt.enabled = val['enabled']
+        appt.spawn = val.get('spawn', False)
+
+        runtimes = val.get('runtimes')
+        if runtimes is not None and len(runtimes) == len(appt.runtimes):
+            appt.runtimes = list(runtimes)
 
         return appt
 
+    def addRunTime(self, took):
+        '''
+        Record the run time (in seconds) of a single run in the run time histogram.
+        '''
+        self.runtimes[bisect.bisect_left(RUNTIME_BUCKETS, took)] += 1
+
     def updateNexttime(self, now):
         '''
         Find the next time this appointment should be scheduled.
@@ -472,6 +493,16 @@ class Agenda(s_base.Base):
         self._schedtask = None  # The task of the scheduler loop.  Doesn't run until we're enabled
 
         self._running_tasks = []  # The actively running cron job tasks
+
+        # Limits on concurrently running cron jobs.  Jobs past a limit wait for a slot.
+        self._jobsema = None
+        maxjobs = core.conf.get('cron:maxjobs')
+        if maxjobs:
+            self._jobsema = asyncio.Semaphore(maxjobs)
+
+        self._maxuserjobs = core.conf.get('cron:maxjobs:user')
+        self._usersemas = {}  # Dict[str: asyncio.Semaphore] of per-user limits
+
         await self._load_all()
 
     async def start(self):
@@ -629,6 +660,7 @@ class Agenda(s_base.Base):
         self._addappt(iden, appt)
 
         appt.doc = cdef.get('doc', '')
+        appt.spawn = cdef.get('spawn', False)
 
         await self._storeAppt(appt)
 
@@ -758,12 +790,68 @@ class Agenda(s_base.Base):
         if not self.isfini:
             await self._storeAppt(appt)
 
+    @contextlib.asynccontextmanager
+    async def _jobSlot(self, user):
+        '''
+        Wait for the global and per-user concurrent job limits to allow another job to run.
+        '''
+        async with contextlib.AsyncExitStack() as stack:
+
+            # take the per-user slot first so a user's queued jobs don't hold global slots
+            if self._maxuserjobs:
+                sema = self._usersemas.get(user.iden)
+                if sema is None:
+                    sema = self._usersemas[user.iden] = asyncio.Semaphore(self._maxuserjobs)
+                await stack.enter_async_context(sema)
+
+            if self._jobsema is not None:
+                await stack.enter_async_context(self._jobsema)
+
+            yield
+
     async def _runJob(self, user, appt):
+        '''
+        Wait for a job slot and run the storm query.
+        '''
+        # The appointment counts as running while queued so it is not scheduled again.
+        appt.isrunning = True
+        try:
+            async with self._jobSlot(user):
+                await self._runJobQuery(user, appt)
+        finally:
+            appt.isrunning = False
+
+    async def _spawnJob(self, user, appt):
+        '''
+        Run the storm query in a spawn process and return the number of nodes it yielded.
+        '''
+        if self.core.spawnpool is None:
+            mesg = 'The Cortex spawn pool is not initialized.'
+            raise s_exc.NotReady(mesg=mesg)
+
+        count = 0
+        errinfo = None
+
+        view = self.core._viewFromOpts({'user': user.iden})
+        async for mesg in self.core.spawnpool.storm(appt.query, user, view):
+
+            if mesg[0] == 'node':
+                count += 1
+
+            elif mesg[0] == 'err':
+                errinfo = mesg[1]
+
+        # raise once the query is done so the spawn process goes back to the pool
+        if errinfo is not None:
+            s_common.result((False, errinfo))
+
+        return count
+
+    async def _runJobQuery(self, user, appt):
         '''
         Actually run the storm query, updating the appropriate statistics and results
         '''
         count = 0
-        appt.isrunning = True
         appt.laststarttime = time.time()
         appt.startcount += 1
         await self._storeAppt(appt)
@@ -772,9 +860,12 @@ class Agenda(s_base.Base):
             logger.info('Agenda executing for iden=%s, user=%s, query={%s}', appt.iden, user.name, appt.query)
             starttime = time.time()
             try:
-                opts = {'user': user.iden}
-                async for node in self.core.eval(appt.query, opts=opts):
-                    count += 1
+                if appt.spawn:
+                    count = await self._spawnJob(user, appt)
+                else:
+                    opts = {'user': user.iden}
+                    async for node in self.core.eval(appt.query, opts=opts):
+                        count += 1
             except asyncio.CancelledError:
                 result = 'cancelled'
                 raise
@@ -787,6 +878,7 @@ class Agenda(s_base.Base):
                 finishtime = time.time()
                 logger.info('Agenda completed query for iden=%s with result "%s" took %0.3fs',
                             appt.iden, result, finishtime - starttime)
+                appt.addRunTime(finishtime - starttime)
                 appt.lastfinishtime = finishtime
                 appt.isrunning = False
                 appt.lastresult = result
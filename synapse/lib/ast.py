@@ -1,3 +1,4 @@
+import time
 import types
 import asyncio
 import fnmatch
@@ -14,6 +15,7 @@ import synapse.lib.base as s_base
 import synapse.lib.coro as s_coro
 import synapse.lib.node as s_node
 import synapse.lib.cache as s_cache
+import synapse.lib.layer as s_layer
 import synapse.lib.types as s_types
 import synapse.lib.spooled as s_spooled
 import synapse.lib.provenance as s_provenance
@@ -24,6 +26,19 @@ logger = logging.getLogger(__name__)
 def parseNumber(x):
     return float(x) if '.' in x else s_stormtypes.intify(x)
 
+def unpack(item):
+    '''
+    Reconstruct an un-initialized AST from the output of AstNode.pack().
+    '''
+    name, info, kids = item
+
+    clss = globals().get(name)
+    if not isinstance(clss, type) or not issubclass(clss, AstNode):
+        mesg = f'Invalid AST class name: {name}'
+        raise s_exc.BadArg(mesg=mesg, name=name)
+
+    return clss.unpack(info, [unpack(k) for k in kids])
+
 async def agen(*items):
     for item in items:
         yield item
@@ -56,6 +71,22 @@ class AstNode:
     def __repr__(self):
         return self.repr()
 
+    def pack(self):
+        '''
+        Return a msgpack safe tuple which may be used to reconstruct the un-initialized AST.
+        '''
+        return (self.__class__.__name__, self.getPackInfo(), [k.pack() for k in self.kids])
+
+    def getPackInfo(self):
+        '''
+        Return a dict of the values set by the parser which are needed to reconstruct the node.
+        '''
+        return {}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(kids=kids)
+
     def addKid(self, astn):
 
         indx = len(self.kids)
@@ -146,6 +177,15 @@ class Query(AstNode):
         # for options parsed from the query itself
         self.opts = {}
 
+    def getPackInfo(self):
+        return {'text': self.text}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        query = cls(kids=kids)
+        query.text = info.get('text')
+        return query
+
     async def run(self, runt, genr):
 
         for oper in self.kids:
@@ -195,6 +235,38 @@ class Query(AstNode):
                 await runt.printf('limit reached: %d' % (limit,))
                 break
 
+    async def getLiftCount(self, runt):
+        '''
+        Return the number of nodes a pure lift query yields using only the indexes.
+
+        Notes:
+            Queries other than a single runtime safe lift, optionally followed
+            by count commands, return None and must be run to be counted.
+
+        Returns:
+            (int): The number of nodes or None.
+        '''
+        if runt.getOpt('graph') not in (False, None) or runt.getOpt('limit') is not None:
+            return None
+
+        if runt.inputs or runt.getOpt('ndefs') or runt.getOpt('idens'):
+            return None
+
+        self.optimize()
+
+        opers = list(self.kids)
+        while opers and isinstance(opers[-1], CmdOper) and opers[-1].isCountCmd():
+            opers.pop()
+
+        if len(opers) != 1:
+            return None
+
+        oper = opers[0]
+        if not isinstance(oper, LiftOper) or not oper.isRuntSafe(runt):
+            return None
+
+        return await oper.getLiftCount(runt)
+
 class SubGraph:
     '''
     An Oper like object which generates a subgraph.
@@ -386,6 +458,22 @@ class SubQuery(Oper):
         Oper.__init__(self, kids)
         self.hasyield = False
 
+    def getPackInfo(self):
+        info = {'hasyield': self.hasyield}
+        text = getattr(self, 'text', None)
+        if text is not None:
+            info['text'] = text
+        return info
+
+    @classmethod
+    def unpack(cls, info, kids):
+        subq = cls(kids=kids)
+        subq.hasyield = info.get('hasyield')
+        text = info.get('text')
+        if text is not None:
+            subq.text = text
+        return subq
+
     async def run(self, runt, genr):
 
         subq = self.kids[0]
@@ -631,6 +719,13 @@ async def pullone(genr):
 
 class CmdOper(Oper):
 
+    def isCountCmd(self):
+        '''
+        Return True if the command is a count command with no arguments.
+        '''
+        argv = self.kids[1]
+        return self.kids[0].value() == 'count' and isinstance(argv, Const) and not argv.value()
+
     async def run(self, runt, genr):
 
         name = self.kids[0].value()
@@ -843,6 +938,54 @@ class CaseEntry(AstNode):
 
 class LiftOper(Oper):
 
+    async def getLiftCount(self, runt):
+        '''
+        Return the number of nodes the lift yields using only the indexes, or None.
+        '''
+        return None
+
+    async def getRawFilt(self, runt):
+        '''
+        Return an async function(buid) used to skip lifted nodes before they are joined, or None.
+        '''
+        return None
+
+    async def getRightRawFilt(self, runt, form):
+        '''
+        Return an async function(buid) which combines the filters that follow
+        the lift and may be evaluated from the layer storage, or None.
+
+        Notes:
+            Only the leading run of such filters is used so any errors from
+            the filters are still raised in query order.
+        '''
+        filts = []
+        for oper in self.iterright():
+
+            # we can skip other lifts but that's it...
+            if isinstance(oper, LiftOper):
+                continue
+
+            if not isinstance(oper, FiltOper):
+                break
+
+            filt = await oper.getRawFilt(runt, form)
+            if filt is None:
+                break
+
+            filts.append(filt)
+
+        if not filts:
+            return None
+
+        async def filt(buid):
+            for func in filts:
+                if not await func(buid):
+                    return False
+            return True
+
+        return filt
+
     async def run(self, runt, genr):
 
         if self.isRuntSafe(runt):
@@ -851,7 +994,13 @@ class LiftOper(Oper):
             async for item in genr:
                 yield item
 
-            async for node in self.lift(runt):
+            filt = await self.getRawFilt(runt)
+            if filt is None:
+                genr = self.lift(runt)
+            else:
+                genr = self.lift(runt, filt=filt)
+
+            async for node in genr:
                 yield node, runt.initPath(node)
 
             return
@@ -961,6 +1110,17 @@ class LiftTag(LiftOper):
         async for node in runt.snap.nodesByTag(tag):
             yield node
 
+    async def getLiftCount(self, runt):
+
+        tag = await self.kids[0].compute(runt)
+
+        if len(self.kids) == 3:
+            cmpr = await self.kids[1].compute(runt)
+            valu = await self.kids[2].compute(runt)
+            return await runt.snap.countByTagValu(tag, cmpr, valu)
+
+        return await runt.snap.countByTag(tag)
+
 class LiftByArray(LiftOper):
     '''
     :prop*[range=(200, 400)]
@@ -1068,7 +1228,7 @@ class LiftTagTag(LiftOper):
 
 class LiftFormTag(LiftOper):
 
-    async def lift(self, runt):
+    async def lift(self, runt, filt=None):
 
         form = self.kids[0].value()
         if not runt.model.form(form):
@@ -1081,17 +1241,43 @@ class LiftFormTag(LiftOper):
             cmpr = self.kids[2].value()
             valu = await self.kids[3].compute(runt)
 
-            async for node in runt.snap.nodesByTagValu(tag, cmpr, valu, form=form):
+            async for node in runt.snap.nodesByTagValu(tag, cmpr, valu, form=form, filt=filt):
                 yield node
 
             return
 
-        async for node in runt.snap.nodesByTag(tag, form=form):
+        async for node in runt.snap.nodesByTag(tag, form=form, filt=filt):
             yield node
 
+    async def getRawFilt(self, runt):
+
+        form = runt.model.form(self.kids[0].value())
+        if form is None:
+            return None
+
+        return await self.getRightRawFilt(runt, form)
+
+    async def getLiftCount(self, runt):
+
+        form = self.kids[0].value()
+        if not runt.model.form(form):
+            raise s_exc.NoSuchProp(name=form)
+
+        tag = await self.kids[1].compute(runt)
+
+        if len(self.kids) == 4:
+            cmpr = self.kids[2].value()
+            valu = await self.kids[3].compute(runt)
+            return await runt.snap.countByTagValu(tag, cmpr, valu, form=form)
+
+        return await runt.snap.countByTag(tag, form=form)
+
+# the max number of index rows counted when estimating the size of a hinted prop value lift
+PLAN_PROBE_LIMIT = 1000
+
 class LiftProp(LiftOper):
 
-    async def lift(self, runt):
+    async def lift(self, runt, filt=None):
 
         name = await self.kids[0].compute(runt)
 
@@ -1101,20 +1287,120 @@ class LiftProp(LiftOper):
 
         assert len(self.kids) == 1
 
-        # check if we can optimize a form lift with a tag filter...
-        if prop.isform:
-            for hint in self.getRightHints():
-                if hint[0] == 'tag':
-                    tagname = hint[1].get('name')
-                    async for node in runt.snap.nodesByTag(tagname, form=name):
-                        yield node
-                    return
+        # check if we can optimize a form lift with a following filter...
+        if prop.isform and not prop.isrunt:
+            hints = self.getRightHints()
+            if hints:
+                async for node in await self.getLiftPlan(runt, prop, hints, filt=filt):
+                    yield node
+                return
 
-        async for node in runt.snap.nodesByProp(name):
+        async for node in runt.snap.nodesByProp(name, filt=filt):
             yield node
 
+    async def getRawFilt(self, runt):
+
+        name = await self.kids[0].compute(runt)
+
+        prop = runt.model.prop(name)
+        if prop is None or prop.isrunt:
+            return None
+
+        form = prop
+        if not prop.isform:
+            form = prop.form
+
+        # universal props may be lifted from any form
+        if form is None:
+            return None
+
+        return await self.getRightRawFilt(runt, form)
+
+    async def getLiftCount(self, runt):
+
+        name = await self.kids[0].compute(runt)
+
+        prop = runt.model.prop(name)
+        if prop is None:
+            raise s_exc.NoSuchProp(name=name)
+
+        if prop.isrunt:
+            return None
+
+        return await runt.snap.countByProp(name)
+
+    async def getLiftPlan(self, runt, form, hints, filt=None):
+        '''
+        Return a node generator for the most selective of the form lift and the
+        lifts hinted by the filters which follow it.
+
+        Notes:
+            The filters still run on the lifted nodes so any hinted lift may be
+            used in place of the form lift.
+        '''
+        best = runt.snap.getFormCount(form.name)
+        genr = None
+
+        for hint in hints:
+
+            if best == 0:
+                break
+
+            if hint[0] == 'tag':
+
+                tagname = hint[1].get('name')
+
+                size = runt.snap.getTagCount(tagname, form.name)
+                if size < best:
+                    best = size
+                    genr = runt.snap.nodesByTag(tagname, form=form.name, filt=filt)
+
+                continue
+
+            if hint[0] == 'prop':
+
+                prop = form.prop(hint[1].get('name'))
+                if prop is None:
+                    continue
+
+                size = runt.snap.getPropCount(prop.full)
+                if size < best:
+                    best = size
+                    genr = runt.snap.nodesByProp(prop.full, filt=filt)
+
+                continue
+
+            if hint[0] == 'relprop':
+
+                prop = form.prop(hint[1].get('name'))
+                if prop is None:
+                    continue
+
+                cmpr = hint[1].get('cmpr')
+                valu = hint[1].get('valu')
+
+                # only probe a small sample so an unselective filter does not scan the index twice
+                limit = min(best, PLAN_PROBE_LIMIT)
+
+                try:
+                    size = await runt.snap.getPropValuCount(prop.full, cmpr, valu, limit=limit)
+                except s_exc.SynErr:
+                    # let the filter raise any errors for bad values
+                    continue
+
+                # a probe which reaches the limit is not known to be more selective
+                if size < limit:
+                    best = size
+                    genr = runt.snap.nodesByPropValu(prop.full, cmpr, valu, filt=filt)
+
+        if genr is None:
+            genr = runt.snap.nodesByProp(form.name, filt=filt)
+
+        return genr
+
     def getRightHints(self):
 
+        hints = []
         for oper in self.iterright():
 
             # we can skip other lifts but that's it...
@@ -1122,23 +1408,216 @@ class LiftProp(LiftOper):
                 continue
 
             if isinstance(oper, FiltOper):
-                return oper.getLiftHints()
+                hints.extend(oper.getLiftHints())
+                continue
 
-            return []
+            break
 
-        return []
+        return hints
 
 class LiftPropBy(LiftOper):
 
-    async def lift(self, runt):
+    async def lift(self, runt, filt=None):
 
         cmpr = self.kids[1].value()
         name = await self.kids[0].compute(runt)
         valu = await self.kids[2].compute(runt)
 
-        async for node in runt.snap.nodesByPropValu(name, cmpr, valu):
+        async for node in runt.snap.nodesByPropValu(name, cmpr, valu, filt=filt):
             yield node
 
+    async def getRawFilt(self, runt):
+
+        cmpr = self.kids[1].value()
+        name = await self.kids[0].compute(runt)
+
+        prop = runt.model.prop(name)
+        if prop is None or prop.isrunt or cmpr == 'type=':
+            return None
+
+        form = prop
+        if not prop.isform:
+            form = prop.form
+
+        if form is None:
+            return None
+
+        return await self.getRightRawFilt(runt, form)
+
+    async def getLiftCount(self, runt):
+
+        cmpr = self.kids[1].value()
+        name = await self.kids[0].compute(runt)
+
+        prop = runt.model.prop(name)
+        if prop is None or prop.isrunt or cmpr == 'type=':
+            return None
+
+        valu = await self.kids[2].compute(runt)
+        return await runt.snap.countByPropValu(name, cmpr, valu)
+
+# the number of pivots to collect from inbound nodes before running them as set-based lifts
+PIVOT_WINDOW_SIZE = 1000
+
+# the max number of seconds to hold collected pivots while waiting for more inbound nodes
+PIVOT_WINDOW_TIME = 0.1
+
+class PivotWindow:
+    '''
+    Collects the pivots for a window of inbound nodes so they may be run as set-based lifts.
+    '''
+    def __init__(self, runt):
+        self.runt = runt
+        self.size = 0
+
+        self.norms = {}
+        self.genrs = []
+        self.buids = collections.defaultdict(list)
+        self.walks = collections.defaultdict(list)
+        self.lifts = collections.defaultdict(lambda: collections.defaultdict(list))
+
+    def addBuid(self, buid, path):
+        self.size += 1
+        self.buids[buid].append(path)
+
+    def addWalkBuid(self, buid, path):
+        '''
+        Add a light edge walk which is run after the other pivots in the window.
+        '''
+        self.size += 1
+        self.walks[buid].append(path)
+
+    def addNdef(self, ndef, path):
+        self.addBuid(s_common.buid(ndef), path)
+
+    def addGenr(self, path, func, *args, **kwargs):
+        '''
+        Add a pivot which is run per-node using the given lift function.
+        '''
+        self.size += 1
+        self.genrs.append((path, func, args, kwargs))
+
+    def addPropValu(self, prop, valu, path):
+        '''
+        Add a pivot to nodes where the prop equals the given value.
+
+        Notes:
+            Values are normalized once per window and equality lifts are
+            deduplicated so each prop is lifted with a single ordered scan.
+        '''
+        try:
+            normkey = (prop.full, valu)
+            cmprvals = self.norms.get(normkey)
+        except TypeError:
+            normkey = None
+            cmprvals = None
+
+        if cmprvals is None:
+            cmprvals = prop.type.getStorCmprs('=', valu)
+            if normkey is not None:
+                self.norms[normkey] = cmprvals
+
+        if not cmprvals:
+            return
+
+        if prop.isrunt or not self._isExactCmpr(cmprvals):
+            self.addGenr(path, self.runt.snap.nodesByPropValu, prop.full, '=', valu)
+            return
+
+        self.size += 1
+        self.lifts[prop.full][cmprvals[0][1]].append(path)
+
+    def _isExactCmpr(self, cmprvals):
+
+        if len(cmprvals) != 1:
+            return False
+
+        cmpr, norm, stortype = cmprvals[0]
+        if cmpr != '=':
+            return False
+
+        try:
+            hash(norm)
+        except TypeError:
+            return False
+
+        # fqdn wild cards are expressed as an = lift on the storage layer
+        if stortype == s_layer.STOR_TYPE_FQDN and norm.startswith('*'):
+            return False
+
+        return True
+
+    async def execute(self):
+        '''
+        Run the pivots in the window.
+
+        Notes:
+            Edge walks are yielded after the other pivots in the window to
+            match the order used for each node by the walk pivot operators.
+        '''
+        snap = self.runt.snap
+
+        async for item in self._joinBuids(self.buids):
+            yield item
+
+        for full, norms in self.lifts.items():
+
+            prop = self.runt.model.prop(full)
+
+            async for pivo in snap.nodesByPropValus(full, list(norms.keys())):
+
+                if prop.isform:
+                    valu = pivo.ndef[1]
+                else:
+                    valu = pivo.get(prop.name)
+
+                for path in norms.get(valu, ()):
+                    yield pivo, path.fork(pivo)
+
+        for path, func, args, kwargs in self.genrs:
+            async for pivo in func(*args, **kwargs):
+                yield pivo, path.fork(pivo)
+
+        async for item in self._joinBuids(self.walks):
+            yield item
+
+    async def _joinBuids(self, buids):
+
+        if not buids:
+            return
+
+        async for pivo in self.runt.snap.getNodesByBuids(list(buids.keys())):
+            for path in buids.get(pivo.buid, ()):
+                yield pivo, path.fork(pivo)
+
+    async def exists(self):
+        '''
+        Return True if any of the pivots in the window would yield a node.
+
+        Notes:
+            Buid and equality pivots are checked using only the storage indexes
+            so no nodes are constructed.
+        '''
+        snap = self.runt.snap
+
+        for buid in self.buids.keys():
+            if snap.hasNodeBuid(buid):
+                return True
+
+        for full, norms in self.lifts.items():
+            if await snap.hasPropValus(full, list(norms.keys())):
+                return True
+
+        for path, func, args, kwargs in self.genrs:
+            async for pivo in func(*args, **kwargs):
+                return True
+
+        for buid in self.walks.keys():
+            if snap.hasNodeBuid(buid):
+                return True
+
+        return False
+
 class PivotOper(Oper):
 
     def __init__(self, kids=(), isjoin=False):
@@ -1151,6 +1630,135 @@ class PivotOper(Oper):
     def __repr__(self):
         return self.repr()
 
+    def getPackInfo(self):
+        return {'isjoin': self.isjoin}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(kids=kids, isjoin=info.get('isjoin'))
+
+    async def getPivotFunc(self, runt):
+        '''
+        Return an async function(window, node, path) which adds the pivots for a node to a PivotWindow.
+
+        Notes:
+            Pivots which are not run using windows return None.
+        '''
+        return None
+
+    async def run(self, runt, genr):
+
+        addfunc = await self.getPivotFunc(runt)
+
+        async for item in self.runPivotWindows(runt, genr, addfunc):
+            yield item
+
+    async def runPivotWindows(self, runt, genr, addfunc):
+        '''
+        Collect the pivots for windows of inbound nodes and run each window as set-based lifts.
+
+        Args:
+            runt (Runtime): The storm runtime.
+            genr (async generator): The inbound (node, path) generator.
+            addfunc (function): An async function(window, node, path) which adds the pivots for a node.
+
+        Notes:
+            The inbound nodes are read on a separate task so a window is also run once its first pivot is
+            PIVOT_WINDOW_TIME seconds old, even if the inbound generator has not yielded again.  The task only
+            reads one node ahead of the window being filled, so upstream edits do not run far past a limit.  The
+            task is cancelled and awaited before returning, so the inbound generator is cleaned up first.
+        '''
+        queue = asyncio.Queue(maxsize=1)
+
+        async def pump():
+            try:
+                try:
+                    async for item in genr:
+                        await queue.put((True, item))
+
+                finally:
+                    await genr.aclose()
+
+                await queue.put((False, None))
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                await queue.put((False, e))
+                raise
+
+        task = runt.snap.schedCoro(pump())
+
+        tick = 0
+        getr = None
+
+        window = PivotWindow(runt)
+
+        try:
+
+            while True:
+
+                if getr is None and not queue.empty():
+                    ok, item = queue.get_nowait()
+
+                else:
+
+                    if getr is None:
+                        getr = asyncio.ensure_future(queue.get())
+
+                    timeout = None
+                    if window.size:
+                        timeout = max(0, tick + PIVOT_WINDOW_TIME - time.monotonic())
+
+                    done, _ = await asyncio.wait((getr,), timeout=timeout)
+                    if not done:
+                        # the inbound nodes are slow to arrive, so run the pivots collected so far
+                        async for pivo in window.execute():
+                            yield pivo
+
+                        window = PivotWindow(runt)
+                        continue
+
+                    ok, item = getr.result()
+                    getr = None
+
+                if not ok:
+                    if item is not None:
+                        raise item
+                    break
+
+                node, path = item
+
+                if self.isjoin:
+                    yield node, path
+
+                if not window.size:
+                    tick = time.monotonic()
+
+                await addfunc(window, node, path)
+
+                if window.size >= PIVOT_WINDOW_SIZE or time.monotonic() - tick >= PIVOT_WINDOW_TIME:
+                    async for pivo in window.execute():
+                        yield pivo
+
+                    window = PivotWindow(runt)
+
+        finally:
+
+            if getr is not None:
+                getr.cancel()
+
+            task.cancel()
+
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        async for item in window.execute():
+            yield item
+
 class RawPivot(PivotOper):
     '''
     -> { <varsfrompath> }
@@ -1176,36 +1784,24 @@ class RawPivot(PivotOper):
 
 class PivotOut(PivotOper):
     '''
-    -> *
-    '''
-    async def run(self, runt, genr):
-
-        async for node, path in genr:
+    -> *
+    '''
+    async def getPivotFunc(self, runt):
 
-            if self.isjoin:
-                yield node, path
+        async def addfunc(window, node, path):
+            self.addPivsOut(runt, window, node, path)
 
-            async for item in self.getPivsOut(runt, node, path):
-                yield item
+        return addfunc
 
-    async def getPivsOut(self, runt, node, path):
+    def addPivsOut(self, runt, window, node, path):
 
         # <syn:tag> -> * is "from tags to nodes with tags"
         if node.form.name == 'syn:tag':
-
-            async for pivo in runt.snap.nodesByTag(node.ndef[1]):
-                yield pivo, path.fork(pivo)
-
+            window.addGenr(path, runt.snap.nodesByTag, node.ndef[1])
             return
 
         if isinstance(node.form.type, s_types.Edge):
-            n2def = node.get('n2')
-            pivo = await runt.snap.getNodeByNdef(n2def)
-            if pivo is None:  # pragma: no cover
-                logger.warning(f'Missing node corresponding to ndef {n2def} on edge')
-                return
-
-            yield pivo, path.fork(pivo)
+            window.addNdef(node.get('n2'), path)
             return
 
         for name, prop in node.form.props.items():
@@ -1216,47 +1812,39 @@ class PivotOut(PivotOper):
 
             # if the outbound prop is an ndef...
             if isinstance(prop.type, s_types.Ndef):
-                pivo = await runt.snap.getNodeByNdef(valu)
-                if pivo is None:
-                    continue
-
-                yield pivo, path.fork(pivo)
+                window.addNdef(valu, path)
                 continue
 
             if isinstance(prop.type, s_types.Array):
                 typename = prop.type.opts.get('type')
-                if runt.model.forms.get(typename) is not None:
+                typeform = runt.model.forms.get(typename)
+                if typeform is not None:
                     for item in valu:
-                        async for pivo in runt.snap.nodesByPropValu(typename, '=', item):
-                            yield pivo, path.fork(pivo)
+                        window.addPropValu(typeform, item, path)
 
             form = runt.model.forms.get(prop.type.name)
             if form is None:
                 continue
 
-            pivo = await runt.snap.getNodeByNdef((form.name, valu))
-            if pivo is None:  # pragma: no cover
-                continue
-
             # avoid self references
-            if pivo.buid == node.buid:
+            ndef = (form.name, valu)
+            if ndef == node.ndef:
                 continue
 
-            yield pivo, path.fork(pivo)
+            window.addNdef(ndef, path)
 
 class N1WalkNPivo(PivotOut):
 
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
 
-        async for node, path in genr:
+        async def addfunc(window, node, path):
 
-            async for item in self.getPivsOut(runt, node, path):
-                yield item
+            self.addPivsOut(runt, window, node, path)
 
             async for (verb, iden) in node.iterEdgesN1():
-                wnode = await runt.snap.getNodeByBuid(s_common.uhex(iden))
-                if wnode is not None:
-                    yield wnode, path.fork(wnode)
+                window.addWalkBuid(s_common.uhex(iden), path)
+
+        return addfunc
 
 class PivotToTags(PivotOper):
     '''
@@ -1329,59 +1917,47 @@ class PivotIn(PivotOper):
     <- *
     '''
 
-    async def run(self, runt, genr):
-
-        async for node, path in genr:
+    async def getPivotFunc(self, runt):
 
-            if self.isjoin:
-                yield node, path
+        async def addfunc(window, node, path):
+            self.addPivsIn(runt, window, node, path)
 
-            async for item in self.getPivsIn(runt, node, path):
-                yield item
+        return addfunc
 
-    async def getPivsIn(self, runt, node, path):
+    def addPivsIn(self, runt, window, node, path):
 
         # if it's a graph edge, use :n1
         if isinstance(node.form.type, s_types.Edge):
-
-            ndef = node.get('n1')
-
-            pivo = await runt.snap.getNodeByNdef(ndef)
-            if pivo is not None:
-                yield pivo, path.fork(pivo)
-
+            window.addNdef(node.get('n1'), path)
             return
 
         name, valu = node.ndef
 
         for prop in runt.model.propsbytype.get(name, ()):
-            async for pivo in runt.snap.nodesByPropValu(prop.full, '=', valu):
-                yield pivo, path.fork(pivo)
+            window.addPropValu(prop, valu, path)
 
         for prop in runt.model.arraysbytype.get(name, ()):
-            async for pivo in runt.snap.nodesByPropArray(prop.full, '=', valu):
-                yield pivo, path.fork(pivo)
+            window.addGenr(path, runt.snap.nodesByPropArray, prop.full, '=', valu)
 
 class N2WalkNPivo(PivotIn):
 
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
 
-        async for node, path in genr:
+        async def addfunc(window, node, path):
 
-            async for item in self.getPivsIn(runt, node, path):
-                yield item
+            self.addPivsIn(runt, window, node, path)
 
             async for (verb, iden) in node.iterEdgesN2():
-                wnode = await runt.snap.getNodeByBuid(s_common.uhex(iden))
-                if wnode is not None:
-                    yield wnode, path.fork(wnode)
+                window.addWalkBuid(s_common.uhex(iden), path)
+
+        return addfunc
 
 class PivotInFrom(PivotOper):
     '''
     <- foo:edge
     '''
 
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
 
         name = self.kids[0].value()
 
@@ -1392,45 +1968,33 @@ class PivotInFrom(PivotOper):
         # <- edge
         if isinstance(form.type, s_types.Edge):
 
-            full = form.name + ':n2'
-
-            async for node, path in genr:
-
-                if self.isjoin:
-                    yield node, path
+            n2prop = runt.model.prop(form.name + ':n2')
 
-                async for pivo in runt.snap.nodesByPropValu(full, '=', node.ndef):
-                    yield pivo, path.fork(pivo)
+            async def addfunc(window, node, path):
+                window.addPropValu(n2prop, node.ndef, path)
 
-            return
+            return addfunc
 
         # edge <- form
-        async for node, path in genr:
-
-            if self.isjoin:
-                yield node, path
+        async def addfunc(window, node, path):
 
             if not isinstance(node.form.type, s_types.Edge):
-                continue
+                return
 
             # dont bother traversing edges to the wrong form
             if node.get('n1:form') != form.name:
-                continue
-
-            n1def = node.get('n1')
+                return
 
-            pivo = await runt.snap.getNodeByNdef(n1def)
-            if pivo is None:
-                continue
+            window.addNdef(node.get('n1'), path)
 
-            yield pivo, path.fork(pivo)
+        return addfunc
 
 class FormPivot(PivotOper):
     '''
     -> foo:bar
     '''
 
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
         warned = False
         name = self.kids[0].value()
 
@@ -1441,30 +2005,22 @@ class FormPivot(PivotOper):
         # -> baz:ndef
         if isinstance(prop.type, s_types.Ndef):
 
-            async for node, path in genr:
-
-                if self.isjoin:
-                    yield node, path
-
-                async for pivo in runt.snap.nodesByPropValu(prop.full, '=', node.ndef):
-                    yield pivo, path.fork(pivo)
+            async def addfunc(window, node, path):
+                window.addPropValu(prop, node.ndef, path)
 
-            return
+            return addfunc
 
         if not prop.isform:
 
             # plain old pivot...
-            async for node, path in genr:
+            async def addfunc(window, node, path):
 
-                if self.isjoin:
-                    yield node, path
+                nonlocal warned
 
                 valu = node.ndef[1]
 
-                # TODO cache/bypass normalization in loop!
                 try:
-                    async for pivo in runt.snap.nodesByPropValu(prop.full, '=', valu):
-                        yield pivo, path.fork(pivo)
+                    window.addPropValu(prop, valu, path)
                 except (s_exc.BadTypeValu, s_exc.BadLiftValu) as e:
                     if not warned:
                         logger.warning(f'Caught error during pivot: {e.items()}')
@@ -1474,52 +2030,39 @@ class FormPivot(PivotOper):
                     mesg = ': '.join((f'{e.__class__.__qualname__} [{repr(valu)}] during pivot', mesg))
                     await runt.snap.fire('warn', mesg=mesg, **items)
 
-            return
+            return addfunc
 
         # if dest form is a subtype of a graph "edge", use N1 automatically
         if isinstance(prop.type, s_types.Edge):
 
-            full = prop.name + ':n1'
-
-            async for node, path in genr:
-
-                if self.isjoin:
-                    yield node, path
+            n1prop = runt.model.prop(prop.name + ':n1')
 
-                async for pivo in runt.snap.nodesByPropValu(full, '=', node.ndef):
-                    yield pivo, path.fork(pivo)
+            async def addfunc(window, node, path):
+                window.addPropValu(n1prop, node.ndef, path)
 
-            return
+            return addfunc
 
         # form -> form pivot is nonsensical. Lets help out...
 
         # form name and type name match
         destform = prop
 
-        async for node, path in genr:
-
-            if self.isjoin:
-                yield node, path
+        async def addfunc(window, node, path):
 
             # <syn:tag> -> <form> is "from tags to nodes" pivot
             if node.form.name == 'syn:tag' and prop.isform:
-                async for pivo in runt.snap.nodesByTag(node.ndef[1], form=prop.name):
-                    yield pivo, path.fork(pivo)
-
-                continue
+                window.addGenr(path, runt.snap.nodesByTag, node.ndef[1], form=prop.name)
+                return
 
             # if the source node is a graph edge, use n2
             if isinstance(node.form.type, s_types.Edge):
 
                 n2def = node.get('n2')
                 if n2def[0] != destform.name:
-                    continue
-
-                pivo = await runt.snap.getNodeByNdef(node.get('n2'))
-                if pivo:
-                    yield pivo, path.fork(pivo)
+                    return
 
-                continue
+                window.addNdef(n2def, path)
+                return
 
             #########################################################################
             # regular "-> form" pivot (ie inet:dns:a -> inet:fqdn)
@@ -1535,8 +2078,7 @@ class FormPivot(PivotOper):
 
                 refsvalu = node.get(refsname)
                 if refsvalu is not None:
-                    async for pivo in runt.snap.nodesByPropValu(refsform, '=', refsvalu):
-                        yield pivo, path.fork(pivo)
+                    window.addPropValu(destform, refsvalu, path)
 
             for refsname, refsform in refs.get('array'):
 
@@ -1548,8 +2090,7 @@ class FormPivot(PivotOper):
                 refsvalu = node.get(refsname)
                 if refsvalu is not None:
                     for refselem in refsvalu:
-                        async for pivo in runt.snap.nodesByPropValu(destform.name, '=', refselem):
-                            yield pivo, path.fork(pivo)
+                        window.addPropValu(destform, refselem, path)
 
             for refsname in refs.get('ndef'):
 
@@ -1557,9 +2098,7 @@ class FormPivot(PivotOper):
 
                 refsvalu = node.get(refsname)
                 if refsvalu is not None and refsvalu[0] == destform.name:
-                    pivo = await runt.snap.getNodeByNdef(refsvalu)
-                    if pivo is not None:
-                        yield pivo, path.fork(pivo)
+                    window.addNdef(refsvalu, path)
 
             #########################################################################
             # reverse "-> form" pivots (ie inet:fqdn -> inet:dns:a)
@@ -1574,8 +2113,7 @@ class FormPivot(PivotOper):
                 found = True
 
                 refsprop = destform.props.get(refsname)
-                async for pivo in runt.snap.nodesByPropValu(refsprop.full, '=', node.ndef[1]):
-                    yield pivo, path.fork(pivo)
+                window.addPropValu(refsprop, node.ndef[1], path)
 
             # "reverse" array references...
             for refsname, refsform in refs.get('array'):
@@ -1586,8 +2124,7 @@ class FormPivot(PivotOper):
                 found = True
 
                 destprop = destform.props.get(refsname)
-                async for pivo in runt.snap.nodesByPropArray(destprop.full, '=', node.ndef[1]):
-                    yield pivo, path.fork(pivo)
+                window.addGenr(path, runt.snap.nodesByPropArray, destprop.full, '=', node.ndef[1])
 
             # "reverse" ndef references...
             for refsname in refs.get('ndef'):
@@ -1595,55 +2132,56 @@ class FormPivot(PivotOper):
                 found = True
 
                 refsprop = destform.props.get(refsname)
-                async for pivo in runt.snap.nodesByPropValu(refsprop.full, '=', node.ndef):
-                    yield pivo, path.fork(pivo)
+                window.addPropValu(refsprop, node.ndef, path)
 
             if not found:
                 mesg = f'No pivot found for {node.form.name} -> {destform.name}.'
                 raise s_exc.NoSuchPivot(n1=node.form.name, n2=destform.name, mesg=mesg)
 
+        return addfunc
+
 class PropPivotOut(PivotOper):
     '''
     :prop -> *
     '''
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
 
         warned = False
-        async for node, path in genr:
+
+        async def addfunc(window, node, path):
+
+            nonlocal warned
+
             name = await self.kids[0].compute(path)
 
             prop = node.form.props.get(name)
             if prop is None:
-                continue
+                return
 
             valu = node.get(name)
             if valu is None:
-                continue
+                return
 
             if isinstance(prop.type, s_types.Array):
                 fname = prop.type.arraytype.name
-                if runt.model.forms.get(fname) is None:
+                form = runt.model.forms.get(fname)
+                if form is None:
                     if not warned:
                         mesg = f'The source property "{name}" array type "{fname}" is not a form. Cannot pivot.'
                         await runt.snap.warn(mesg)
                         warned = True
-                    continue
+                    return
 
                 for item in valu:
-                    async for pivo in runt.snap.nodesByPropValu(fname, '=', item):
-                        yield pivo, path.fork(pivo)
+                    window.addPropValu(form, item, path)
 
-                continue
+                return
 
             # ndef pivot out syntax...
             # :ndef -> *
             if isinstance(prop.type, s_types.Ndef):
-                pivo = await runt.snap.getNodeByNdef(valu)
-                if pivo is None:
-                    logger.warning(f'Missing node corresponding to ndef {valu}')
-                    continue
-                yield pivo, path.fork(pivo)
-                continue
+                window.addNdef(valu, path)
+                return
 
             # :prop -> *
             fname = prop.type.name
@@ -1651,19 +2189,17 @@ class PropPivotOut(PivotOper):
                 if warned is False:
                     await runt.snap.warn(f'The source property "{name}" type "{fname}" is not a form. Cannot pivot.')
                     warned = True
-                continue
+                return
 
-            ndef = (fname, valu)
-            pivo = await runt.snap.getNodeByNdef(ndef)
             # A node explicitly deleted in the graph or missing from a underlying layer
-            # could cause this lift to return None.
-            if pivo:
-                yield pivo, path.fork(pivo)
+            # will simply be absent from the window results.
+            window.addNdef((fname, valu), path)
 
+        return addfunc
 
 class PropPivot(PivotOper):
 
-    async def run(self, runt, genr):
+    async def getPivotFunc(self, runt):
         warned = False
         name = self.kids[1].value()
 
@@ -1673,19 +2209,16 @@ class PropPivot(PivotOper):
 
         # TODO if we are pivoting to a form, use ndef!
 
-        async for node, path in genr:
+        async def addfunc(window, node, path):
 
-            if self.isjoin:
-                yield node, path
+            nonlocal warned
 
             valu = await self.kids[0].compute(path)
             if valu is None:
-                continue
+                return
 
-            # TODO cache/bypass normalization in loop!
             try:
-                async for pivo in runt.snap.nodesByPropValu(prop.full, '=', valu):
-                    yield pivo, path.fork(pivo)
+                window.addPropValu(prop, valu, path)
             except (s_exc.BadTypeValu, s_exc.BadLiftValu) as e:
                 if not warned:
                     logger.warning(f'Caught error during pivot: {e.items()}')
@@ -1695,6 +2228,8 @@ class PropPivot(PivotOper):
                 mesg = ': '.join((f'{e.__class__.__qualname__} [{repr(valu)}] during pivot', mesg))
                 await runt.snap.fire('warn', mesg=mesg, **items)
 
+        return addfunc
+
 class Cond(AstNode):
 
     def getLiftHints(self):
@@ -1703,6 +2238,62 @@ class Cond(AstNode):
     async def getCondEval(self, runt): # pragma: no cover
         raise s_exc.NoSuchImpl(name=f'{self.__class__.__name__}.getCondEval()')
 
+    async def getRawCond(self, runt, form):
+        '''
+        Return an async function(buid) which evaluates the condition for a node
+        of the given form from the layer storage without joining it, or None.
+        '''
+        return None
+
+    def getCmprGetter(self, ctor, kid):
+        '''
+        Return an async function(path) which returns the comparator for the value of kid.
+
+        Notes:
+            The comparator for a constant value is built once on first use so
+            bad values still raise from the first node rather than up front.
+        '''
+        if not isinstance(kid, Const):
+
+            async def getcmpr(path):
+                return ctor(await kid.compute(path))
+
+            return getcmpr
+
+        func = None
+
+        async def getcmpr(path):
+            nonlocal func
+            if func is None:
+                func = ctor(kid.value())
+            return func
+
+        return getcmpr
+
+    def getRawPropCond(self, runt, prop, cmpr, valu):
+        '''
+        Return an async function(buid) which compares the stored value of a prop.
+        '''
+        ctor = prop.type.getCmprCtor(cmpr)
+        if ctor is None:
+            return None
+
+        func = None
+
+        async def cond(buid):
+            nonlocal func
+
+            curv = await runt.snap.getStorPropValu(buid, prop.name)
+            if curv is None:
+                return False
+
+            if func is None:
+                func = ctor(valu)
+
+            return func(curv)
+
+        return cond
+
 class SubqCond(Cond):
 
     def __init__(self, kids=()):
@@ -1817,6 +2408,19 @@ class SubqCond(Cond):
 
         subq = self.kids[0]
 
+        # a lone pivot may be checked for existence without joining nodes
+        if len(subq.kids) == 1 and isinstance(subq.kids[0], PivotOper) and not subq.kids[0].isjoin:
+
+            addfunc = await subq.kids[0].getPivotFunc(runt)
+            if addfunc is not None:
+
+                async def cond(node, path):
+                    window = PivotWindow(runt)
+                    await addfunc(window, node, path)
+                    return await window.exists()
+
+                return cond
+
         async def cond(node, path):
             genr = agen((node, path))
             async for _ in subq.run(runt, genr):
@@ -1843,6 +2447,25 @@ class OrCond(Cond):
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        cond0 = await self.kids[0].getRawCond(runt, form)
+        if cond0 is None:
+            return None
+
+        cond1 = await self.kids[1].getRawCond(runt, form)
+        if cond1 is None:
+            return None
+
+        async def cond(buid):
+
+            if await cond0(buid):
+                return True
+
+            return await cond1(buid)
+
+        return cond
+
 class AndCond(Cond):
     '''
     <cond> and <cond>
@@ -1866,6 +2489,25 @@ class AndCond(Cond):
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        cond0 = await self.kids[0].getRawCond(runt, form)
+        if cond0 is None:
+            return None
+
+        cond1 = await self.kids[1].getRawCond(runt, form)
+        if cond1 is None:
+            return None
+
+        async def cond(buid):
+
+            if not await cond0(buid):
+                return False
+
+            return await cond1(buid)
+
+        return cond
+
 class NotCond(Cond):
     '''
     not <cond>
@@ -1880,6 +2522,17 @@ class NotCond(Cond):
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        kidcond = await self.kids[0].getRawCond(runt, form)
+        if kidcond is None:
+            return None
+
+        async def cond(buid):
+            return not await kidcond(buid)
+
+        return cond
+
 class TagCond(Cond):
     '''
     #foo.bar
@@ -1895,9 +2548,9 @@ class TagCond(Cond):
         if not kid.isconst or kid.hasglob():
             return []
 
-        return (
+        return [
             ('tag', {'name': kid.value()}),
-        )
+        ]
 
     async def getCondEval(self, runt):
 
@@ -1956,6 +2609,16 @@ class TagCond(Cond):
 
 class HasRelPropCond(Cond):
 
+    def getLiftHints(self):
+
+        relprop = self.kids[0]
+        if not relprop.isconst:
+            return []
+
+        return [
+            ('prop', {'name': relprop.value()}),
+        ]
+
     async def getCondEval(self, runt):
 
         relprop = self.kids[0]
@@ -1977,6 +2640,21 @@ class HasRelPropCond(Cond):
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        relprop = self.kids[0]
+        if not relprop.isconst:
+            return None
+
+        name = relprop.value()
+        if form.props.get(name) is None:
+            return None
+
+        async def cond(buid):
+            return await runt.snap.getStorPropValu(buid, name) is not None
+
+        return cond
+
 class HasTagPropCond(Cond):
 
     async def getCondEval(self, runt):
@@ -2061,6 +2739,8 @@ class AbsPropCond(Cond):
         if ctor is None:
             raise s_exc.NoSuchCmpr(cmpr=cmpr, name=prop.type.name)
 
+        getcmpr = self.getCmprGetter(ctor, self.kids[2])
+
         if prop.isform:
 
             async def cond(node, path):
@@ -2069,9 +2749,9 @@ class AbsPropCond(Cond):
                     return False
 
                 val1 = node.ndef[1]
-                val2 = await self.kids[2].compute(path)
+                func = await getcmpr(path)
 
-                return ctor(val2)(val1)
+                return func(val1)
 
             return cond
 
@@ -2080,11 +2760,22 @@ class AbsPropCond(Cond):
             if val1 is None:
                 return False
 
-            val2 = await self.kids[2].compute(path)
-            return ctor(val2)(val1)
+            func = await getcmpr(path)
+            return func(val1)
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        if not isinstance(self.kids[2], Const):
+            return None
+
+        prop = runt.model.props.get(self.kids[0].value())
+        if prop is None or prop.isform or prop.form is None or prop.form.name != form.name:
+            return None
+
+        return self.getRawPropCond(runt, prop, self.kids[1].value(), self.kids[2].value())
+
 class TagValuCond(Cond):
 
     async def getCondEval(self, runt):
@@ -2130,32 +2821,89 @@ class RelPropCond(Cond):
     '''
     :foo:bar <cmpr> <value>
     '''
+    def getLiftHints(self):
+
+        kid = self.kids[0]
+        if not isinstance(kid, RelPropValue) or not isinstance(self.kids[2], Const):
+            return []
+
+        relprop = kid.kids[0]
+        if not relprop.isconst:
+            return []
+
+        name = relprop.value()
+        if name.find('::') != -1:
+            return []
+
+        # only comparisons which lift by index range may be cheaply counted
+        cmpr = self.kids[1].value()
+        if cmpr not in ('=', '^=', '<', '>', '<=', '>=', 'range='):
+            return []
+
+        return [
+            ('relprop', {'name': name, 'cmpr': cmpr, 'valu': self.kids[2].value()}),
+        ]
+
     async def getCondEval(self, runt):
 
         cmpr = self.kids[1].value()
 
+        # comparators for a constant value are built once per prop
+        isconst = isinstance(self.kids[2], Const)
+        funcs = {}
+
         async def cond(node, path):
 
             prop, valu = await self.kids[0].getPropAndValu(path)
             if valu is None:
                 return False
 
-            xval = await self.kids[2].compute(path)
-            ctor = prop.type.getCmprCtor(cmpr)
-            if ctor is None:
-                raise s_exc.NoSuchCmpr(cmpr=cmpr, name=prop.type.name)
-            func = ctor(xval)
+            func = funcs.get(prop.full)
+            if func is None:
+
+                xval = await self.kids[2].compute(path)
+                ctor = prop.type.getCmprCtor(cmpr)
+                if ctor is None:
+                    raise s_exc.NoSuchCmpr(cmpr=cmpr, name=prop.type.name)
+                func = ctor(xval)
+
+                if isconst:
+                    funcs[prop.full] = func
 
             return func(valu)
 
         return cond
 
+    async def getRawCond(self, runt, form):
+
+        kid = self.kids[0]
+        if not isinstance(kid, RelPropValue) or not isinstance(self.kids[2], Const):
+            return None
+
+        relprop = kid.kids[0]
+        if not relprop.isconst:
+            return None
+
+        name = relprop.value()
+        if name.find('::') != -1:
+            return None
+
+        prop = form.props.get(name)
+        if prop is None:
+            return None
+
+        return self.getRawPropCond(runt, prop, self.kids[1].value(), self.kids[2].value())
+
 class TagPropCond(Cond):
 
     async def getCondEval(self, runt):
 
         cmpr = self.kids[1].value()
 
+        # comparators for a constant value are built once per tag prop
+        isconst = isinstance(self.kids[2], Const)
+        funcs = {}
+
         async def cond(node, path):
 
             tag, name = await self.kids[0].compute(path)
@@ -2165,17 +2913,23 @@ class TagPropCond(Cond):
                 mesg = f'No such tag property: {name}'
                 raise s_exc.NoSuchTagProp(name=name, mesg=mesg)
 
-            # TODO cache on (cmpr, valu) for perf?
-            valu = await self.kids[2].compute(path)
+            func = funcs.get(name)
+            if func is None:
 
-            ctor = prop.type.getCmprCtor(cmpr)
-            if ctor is None:
-                raise s_exc.NoSuchCmpr(cmpr=cmpr, name=prop.type.name)
+                valu = await self.kids[2].compute(path)
+
+                ctor = prop.type.getCmprCtor(cmpr)
+                if ctor is None:
+                    raise s_exc.NoSuchCmpr(cmpr=cmpr, name=prop.type.name)
+
+                func = ctor(valu)
+                if isconst:
+                    funcs[name] = func
 
             curv = node.getTagProp(tag, name)
             if curv is None:
                 return False
-            return ctor(valu)(curv)
+            return func(curv)
 
         return cond
 
@@ -2188,6 +2942,23 @@ class FiltOper(Oper):
 
         return self.kids[1].getLiftHints()
 
+    async def getRawFilt(self, runt, form):
+        '''
+        Return an async function(buid) which returns True if a node of the
+        given form would pass the filter, or None if it must be joined.
+        '''
+        cond = await self.kids[1].getRawCond(runt, form)
+        if cond is None:
+            return None
+
+        if self.kids[0].value() == '+':
+            return cond
+
+        async def filt(buid):
+            return not await cond(buid)
+
+        return filt
+
     async def run(self, runt, genr):
 
         must = self.kids[0].value() == '+'
@@ -2239,6 +3010,13 @@ class EmbedQuery(RunValue):
         AstNode.__init__(self, kids=kids)
         self.text = text.strip()
 
+    def getPackInfo(self):
+        return {'text': self.text}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(info.get('text'), kids=kids)
+
     def isRuntSafe(self, runt):
         return True
 
@@ -2259,6 +3037,13 @@ class Value(RunValue):
         RunValue.__init__(self, kids=kids)
         self.valu = valu
 
+    def getPackInfo(self):
+        return {'valu': self.valu}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(info.get('valu'), kids=kids)
+
     def repr(self):
         if self.kids:
             return f'{self.__class__.__name__}: {self.valu}, kids={self.kids}'
@@ -2548,7 +3333,10 @@ class ExprNode(RunValue):
         return self._operfunc(*self._coerce(parm1, parm2))
 
 class VarList(Value):
-    pass
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(list(info.get('valu')), kids=kids)
 
 class TagName(RunValue):
     def __init__(self, kids=()):
@@ -2966,6 +3754,13 @@ class EditEdgeAdd(Edit):
         Edit.__init__(self, kids=kids)
         self.n2 = n2
 
+    def getPackInfo(self):
+        return {'n2': self.n2}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(kids=kids, n2=info.get('n2'))
+
     async def run(self, runt, genr):
 
         # SubQuery -> Query
@@ -3012,6 +3807,13 @@ class EditEdgeDel(Edit):
         Edit.__init__(self, kids=kids)
         self.n2 = n2
 
+    def getPackInfo(self):
+        return {'n2': self.n2}
+
+    @classmethod
+    def unpack(cls, info, kids):
+        return cls(kids=kids, n2=info.get('n2'))
+
     async def run(self, runt, genr):
         query = self.kids[1].kids[0]
 
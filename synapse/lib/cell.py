@@ -3,7 +3,9 @@ import ssl
 import socket
 import asyncio
 import logging
+import shutil
 import argparse
+import tempfile
 import functools
 import contextlib
 
@@ -31,10 +33,15 @@ import synapse.lib.hiveauth as s_hiveauth
 
 import synapse.lib.lmdbslab as s_lmdbslab
 
+import synapse.tools.backup as s_t_backup
+
 logger = logging.getLogger(__name__)
 
 SLAB_MAP_SIZE = 128 * s_const.mebibyte
 
+# the size of file chunks streamed when transferring a snapshot
+SNAPSHOT_CHUNK_SIZE = 16 * s_const.mebibyte
+
 '''
 Base classes for the synapse "cell" microservice architecture.
 '''
@@ -67,6 +74,32 @@ def adminapi(log=False):
 
     return decrfunc
 
+async def bootMirror(url, dirn):
+    '''
+    Initialize the directory for a new mirror from a snapshot of the cell at the given telepath URL.
+
+    Args:
+        url (str): The telepath URL of the leader cell.
+        dirn (str): The (empty) directory for the mirror cell.
+
+    Notes:
+        Start the mirror cell in the directory with nexslog:en and its mirror option set to the URL
+        to follow the leader nexus log from the offset of the snapshot.
+    '''
+    dirn = s_common.gendir(dirn)
+    if os.listdir(dirn):
+        mesg = f'Mirror directory is not empty: {dirn}'
+        raise s_exc.BadArg(mesg=mesg, dirn=dirn)
+
+    async with await s_telepath.openurl(url) as proxy:
+
+        async for relpath, byts in proxy.iterSnapshot():
+
+            path = s_common.genpath(dirn, relpath)
+            s_common.gendir(os.path.dirname(path))
+
+            with open(path, 'ab') as fd:
+                fd.write(byts)
 
 class CellApi(s_base.Base):
 
@@ -459,6 +492,27 @@ class CellApi(s_base.Base):
         async for item in self.cell.getNexusChanges(offs):
             yield item
 
+    @adminapi()
+    async def setNexusAck(self, mirror, offs):
+        return self.cell.setNexusAck(mirror, offs)
+
+    @adminapi(log=True)
+    async def delNexusAck(self, mirror):
+        return self.cell.delNexusAck(mirror)
+
+    @adminapi()
+    async def getNexusAcks(self):
+        return self.cell.getNexusAcks()
+
+    @adminapi(log=True)
+    async def cullNexsLog(self, offs=None):
+        return await self.cell.cullNexsLog(offs=offs)
+
+    @adminapi(log=True)
+    async def iterSnapshot(self):
+        async for item in self.cell.iterSnapshot():
+            yield item
+
     @adminapi()
     async def getDiagInfo(self):
         return {
@@ -588,6 +642,139 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
         async for item in self.nexsroot.iter(offs):
             yield item
 
+    def setNexusAck(self, mirror, offs):
+        self.nexsroot.setMirrorAck(mirror, offs)
+
+    def delNexusAck(self, mirror):
+        self.nexsroot.delMirrorAck(mirror)
+
+    def getNexusAcks(self):
+        return self.nexsroot.getMirrorAcks()
+
+    async def cullNexsLog(self, offs=None):
+        '''
+        Remove nexus log entries which every known mirror has already applied.
+
+        Args:
+            offs (int): The max offset to remove (defaults to every applied entry).
+
+        Returns:
+            (int): The offset up to which entries were removed or -1 if no entries were removed.
+        '''
+        if offs is None:
+            offs = self.nexsroot.getSnapOffs()
+
+        if offs is None:
+            return -1
+
+        return await self.nexsroot.cull(offs)
+
+    async def saveSnapshot(self, dirn):
+        '''
+        Save a consistent copy of the cell directory which a mirror may be started from.
+
+        Args:
+            dirn (str): The directory to save the snapshot in.
+
+        Returns:
+            (int): The nexus log offset the snapshot must be followed from or None without a nexus log.
+
+        Notes:
+            Nexus changes are blocked while each open slab is synced and a read transaction is opened on it, so
+            the copy contains exactly the changes before the returned offset.  Changes after the offset are
+            removed from the copied nexus log and replayed when the mirror follows the leader.
+        '''
+        srcdir = os.path.realpath(self.dirn)
+        dstdir = s_common.gendir(dirn)
+
+        copies = set()
+
+        async with await s_lmdbslab.SnapCopy.anit() as snapcopy:
+
+            async with self.nexsroot.applygate.exclusive():
+
+                offs = self.nexsroot.getSnapOffs()
+
+                for slab in s_lmdbslab.Slab.syncset:
+
+                    if not slab.abspath.startswith(srcdir + os.sep):
+                        continue
+
+                    # sync() fires the commit event so hot counters are flushed with the commit
+                    await slab.sync()
+
+                    dstpath = s_common.genpath(dstdir, os.path.relpath(slab.abspath, start=srcdir))
+                    snapcopy.add(slab, dstpath)
+                    copies.add(slab.abspath)
+
+                await snapcopy.begin()
+
+            for root, dnames, fnames in os.walk(srcdir, topdown=True):
+
+                relpath = os.path.relpath(root, start=srcdir)
+
+                for name in list(dnames):
+
+                    # skip temporary files (including any snapshot in progress)
+                    if name == 'tmp':
+                        dnames.remove(name)
+                        continue
+
+                    srcpath = s_common.genpath(root, name)
+                    dstpath = s_common.genpath(dstdir, relpath, name)
+
+                    if name.endswith('.lmdb'):
+                        dnames.remove(name)
+
+                        if srcpath not in copies:
+                            await s_coro.executor(s_t_backup.backup_lmdb, srcpath, dstpath)
+
+                        continue
+
+                    s_common.gendir(dstpath)
+
+                for name in fnames:
+
+                    srcpath = s_common.genpath(root, name)
+                    if not os.path.isfile(srcpath):
+                        continue
+
+                    shutil.copy(srcpath, s_common.genpath(dstdir, relpath, name))
+
+            await snapcopy.wait()
+
+        if offs is not None:
+            await s_nexus.initSnapLog(dstdir, offs)
+
+        return offs
+
+    async def iterSnapshot(self):
+        '''
+        Save a snapshot of the cell and yield (relpath, byts) chunks of its files.
+        '''
+        tmpdir = s_common.gendir(self.dirn, 'tmp')
+
+        with tempfile.TemporaryDirectory(dir=tmpdir) as dirn:
+
+            await self.saveSnapshot(dirn)
+
+            for root, dnames, fnames in os.walk(dirn):
+
+                for name in fnames:
+
+                    path = os.path.join(root, name)
+                    relpath = os.path.relpath(path, start=dirn)
+
+                    with open(path, 'rb') as fd:
+
+                        byts = fd.read(SNAPSHOT_CHUNK_SIZE)
+                        yield relpath, byts
+
+                        while byts:
+                            byts = fd.read(SNAPSHOT_CHUNK_SIZE)
+                            if byts:
+                                yield relpath, byts
+
     async def isUserAllowed(self, iden, perm, gateiden=None):
         user = self.auth.user(iden)
         if user is None:
@@ -1,4 +1,5 @@
 import json
+import time
 import base64
 import asyncio
 import logging
@@ -12,9 +13,17 @@ import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.base as s_base
+import synapse.lib.msgpack as s_msgpack
 
 logger = logging.getLogger(__name__)
 
+# the content type a client may accept to stream msgpack encoded results
+MSGPACK_CONTENT_TYPE = 'application/x-msgpack'
+
+# buffered msgpack results are flushed at this many bytes or seconds
+STREAM_FLUSH_SIZE = 256 * 1024
+STREAM_FLUSH_TIME = 0.5
+
 class Sess(s_base.Base):
 
     async def __anit__(self, cell, iden):
@@ -264,6 +273,79 @@ class Handler(HandlerBase, t_web.RequestHandler):
 
         return opts
 
+    def acceptsMsgpack(self):
+        '''
+        Return True if the client accepts a msgpack encoded result stream.
+        '''
+        accept = self.request.headers.get('Accept', '')
+        return any(p.split(';')[0].strip() == MSGPACK_CONTENT_TYPE for p in accept.split(','))
+
+    async def streamResults(self, genr):
+        '''
+        Write the items yielded by an async generator to the response.
+
+        Notes:
+            Clients which accept MSGPACK_CONTENT_TYPE receive a stream of
+            msgpack encoded items which is flushed every STREAM_FLUSH_SIZE bytes
+            or once buffered items are STREAM_FLUSH_TIME seconds old, even if
+            the generator has not yielded again.  Otherwise each item is
+            written as JSON and flushed individually.  Waiting on each flush
+            to complete keeps a slow client from buffering results in memory.
+        '''
+        if not self.acceptsMsgpack():
+            async for item in genr:
+                self.write(json.dumps(item))
+                await self.flush()
+            return
+
+        self.set_header('Content-Type', MSGPACK_CONTENT_TYPE)
+
+        size = 0
+        tick = 0
+
+        lock = asyncio.Lock()
+        buffered = asyncio.Event()
+
+        async def flush():
+            nonlocal size
+            async with lock:
+                size = 0
+                buffered.clear()
+                await self.flush()
+
+        async def flushloop():
+            # the generator is read in the handler task, so flush items it is slow to follow from here
+            while True:
+
+                await buffered.wait()
+                await asyncio.sleep(max(0, tick + STREAM_FLUSH_TIME - time.monotonic()))
+
+                if size and time.monotonic() - tick >= STREAM_FLUSH_TIME:
+                    await flush()
+
+        timer = asyncio.ensure_future(flushloop())
+
+        try:
+
+            async for item in genr:
+
+                byts = s_msgpack.en(item)
+
+                if not size:
+                    tick = time.monotonic()
+                    buffered.set()
+
+                self.write(byts)
+                size += len(byts)
+
+                if size >= STREAM_FLUSH_SIZE or time.monotonic() - tick >= STREAM_FLUSH_TIME:
+                    await flush()
+
+        finally:
+            timer.cancel()
+
+        await flush()
+
 class StormNodesV1(Handler):
 
     async def post(self):
@@ -289,9 +371,7 @@ class StormNodesV1(Handler):
         opts = await self._reqValidOpts(opts)
 
         view = self.cell._viewFromOpts(opts)
-        async for pode in view.iterStormPodes(query, opts=opts):
-            self.write(json.dumps(pode))
-            await self.flush()
+        await self.streamResults(view.iterStormPodes(query, opts=opts))
 
 class StormV1(Handler):
 
@@ -318,9 +398,7 @@ class StormV1(Handler):
 
         await self.cell.boss.promote('storm', user=user, info={'query': query})
 
-        async for mesg in self.cell.storm(query, opts=opts):
-            self.write(json.dumps(mesg))
-            await self.flush()
+        await self.streamResults(self.cell.storm(query, opts=opts))
 
 class WatchSockV1(WebSocket):
     '''
@@ -66,6 +66,11 @@ import collections
 import regex
 import xxhash
 
+try:
+    import re._parser as sre_parse
+except ImportError: # pragma: no cover
+    import sre_parse
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 import synapse.telepath as s_telepath
@@ -79,6 +84,7 @@ import synapse.lib.queue as s_queue
 import synapse.lib.config as s_config
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.slabseqn as s_slabseqn
+import synapse.lib.spooled as s_spooled
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +173,9 @@ class LayerApi(s_cell.CellApi):
 
 BUID_CACHE_SIZE = 10000
 
+# the max number of index rows a lift will sort in memory before spooling them to disk
+LIFT_SORT_MAX = 10000
+
 STOR_TYPE_UTF8 = 1
 
 STOR_TYPE_U8 = 2
@@ -215,6 +224,75 @@ EDIT_NODEDATA_DEL = 9 # (<type>, (<name>, <valu>), ())
 EDIT_EDGE_ADD = 10    # (<type>, (<verb>, <destnodeiden>), ())
 EDIT_EDGE_DEL = 11    # (<type>, (<verb>, <destnodeiden>), ())
 
+REGX_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+if hasattr(sre_parse, 'POSSESSIVE_REPEAT'): # pragma: no cover
+    REGX_REPEATS += (sre_parse.POSSESSIVE_REPEAT,)
+
+# regex module only syntax which sre_parse may read as literals ( fuzzy constraints,
+# POSIX classes, branch resets and unicode properties )
+REGX_MODULE_ONLY = regex.compile(r'\{[^{}]*[deis][^{}]*\}|\[:\^?\w+:\]|\(\?\||\\[pP]')
+
+def getTrigrams(valu):
+    '''
+    Return the set of utf8 encoded trigrams for a string value.
+    '''
+    return {valu[i:i + 3].encode('utf8', 'surrogatepass') for i in range(len(valu) - 2)}
+
+def _getRegxLits(items, lits, curv=''):
+    # append literal runs which any match must contain and return the open run
+    for oper, argv in items:
+
+        if oper == sre_parse.LITERAL:
+            curv += chr(argv)
+            continue
+
+        # zero width anchors do not break a literal run
+        if oper == sre_parse.AT:
+            continue
+
+        if oper == sre_parse.SUBPATTERN and not argv[1] and not argv[2]:
+            curv = _getRegxLits(argv[3], lits, curv=curv)
+            continue
+
+        lits.append(curv)
+        curv = ''
+
+        if oper in REGX_REPEATS and argv[0] >= 1:
+            lits.append(_getRegxLits(argv[2], lits))
+
+    return curv
+
+def getRegxTrigrams(regx):
+    '''
+    Return the set of trigrams which must be present in any string matched by a regex.
+
+    Args:
+        regx: A regex compiled using the regex module.
+
+    Returns:
+        (set): The trigrams or an empty set if none may be extracted.
+    '''
+    if regx.flags & (regex.IGNORECASE | regex.V1):
+        return set()
+
+    if REGX_MODULE_ONLY.search(regx.pattern):
+        return set()
+
+    # the regex module includes global inline flags in regx.flags
+    try:
+        tree = sre_parse.parse(regx.pattern)
+    except Exception:
+        return set()
+
+    lits = []
+    lits.append(_getRegxLits(tree, lits))
+
+    trigs = set()
+    for lit in lits:
+        trigs.update(getTrigrams(lit))
+
+    return trigs
+
 class IndxBy:
     '''
     IndxBy sub-classes encapsulate access methods and encoding details for
@@ -256,6 +334,11 @@ class IndxBy:
         for item in self.layr.layrslab.scanByDups(self.abrv + indx, db=self.db):
             yield item
 
+    def scanByKeys(self, indxs):
+        lkeys = [self.abrv + indx for indx in indxs]
+        for item in self.layr.layrslab.scanByKeys(lkeys, db=self.db):
+            yield item
+
     def scanByPref(self, indx=b''):
         for item in self.layr.layrslab.scanByPref(self.abrv + indx, db=self.db):
             yield item
@@ -392,6 +475,21 @@ class StorType:
         async for item in self.indxBy(indxby, cmpr, valu):
             yield item
 
+    async def indxByValus(self, liftby, valus):
+        '''
+        Yield the (lkey, buid) rows which exactly match any of the given norm values.
+
+        Note:
+            The index bytes are deduplicated and sorted so each layer is
+            read using one ordered scan for the entire set of values.
+        '''
+        indxs = set()
+        for valu in valus:
+            indxs.update(self.indx(valu))
+
+        for item in liftby.scanByKeys(sorted(indxs)):
+            yield item
+
     def indx(self, valu):
         raise NotImplementedError
 
@@ -408,21 +506,29 @@ class StorTypeUtf8(StorType):
 
     async def _liftUtf8Eq(self, liftby, valu):
         indx = self._getIndxByts(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftUtf8Range(self, liftby, valu):
         minindx = self._getIndxByts(valu[0])
         maxindx = self._getIndxByts(valu[1])
-        for item in liftby.buidsByRange(minindx, maxindx):
+        for item in liftby.scanByRange(minindx, maxindx):
             yield item
 
     async def _liftUtf8Regx(self, liftby, valu):
 
         regx = regex.compile(valu)
+
+        if isinstance(liftby, (IndxByForm, IndxByProp)) and liftby.abrv in self.layr.trigabrvs:
+            trigs = getRegxTrigrams(regx)
+            if trigs:
+                async for item in self._liftUtf8RegxTrig(liftby, regx, trigs):
+                    yield item
+                return
+
         lastbuid = None
 
-        for buid in liftby.buidsByPref():
+        for lkey, buid in liftby.scanByPref():
             if buid == lastbuid:
                 continue
 
@@ -434,16 +540,37 @@ class StorTypeUtf8(StorType):
             if isinstance(storvalu, (tuple, list)):
                 for sv in storvalu:
                     if regx.search(sv) is not None:
-                        yield buid
+                        yield lkey, buid
                         break
             else:
                 if regx.search(storvalu) is None:
                     continue
-                yield buid
+                yield lkey, buid
+
+    async def _liftUtf8RegxTrig(self, liftby, regx, trigs):
+        '''
+        Yield the index rows of the trigram candidates which match the regex in index order.
+
+        Notes:
+            More than LIFT_SORT_MAX rows are spooled to disk to be sorted.
+        '''
+        async with await s_spooled.Sorted.anit(dirn=self.layr.dirn, size=LIFT_SORT_MAX) as rows:
+
+            async for buid in self.layr.iterTrigramBuids(liftby.abrv, trigs):
+
+                storvalu = liftby.getNodeValu(buid)
+                if not isinstance(storvalu, str) or regx.search(storvalu) is None:
+                    continue
+
+                await rows.add(liftby.abrv + self.indx(storvalu)[0], buid)
+
+            # sort in index order to allow merge sorting rows from multiple layers
+            for item in rows.items():
+                yield item
 
     async def _liftUtf8Prefix(self, liftby, valu):
         indx = self._getIndxByts(valu)
-        for item in liftby.buidsByPref(indx):
+        for item in liftby.scanByPref(indx):
             yield item
 
     def _getIndxByts(self, valu):
@@ -485,12 +612,12 @@ class StorTypeHier(StorType):
 
     async def _liftHierEq(self, liftby, valu):
         indx = self.getHierIndx(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftHierPref(self, liftby, valu):
         indx = self.getHierIndx(valu)
-        for item in liftby.buidsByPref(indx):
+        for item in liftby.scanByPref(indx):
             yield item
 
 class StorTypeLoc(StorTypeHier):
@@ -548,7 +675,7 @@ class StorTypeFqdn(StorTypeUtf8):
 
         if valu[0] == '*':
             indx = self._getIndxByts(valu[1:][::-1])
-            for item in liftby.buidsByPref(indx):
+            for item in liftby.scanByPref(indx):
                 yield item
             return
 
@@ -574,13 +701,13 @@ class StorTypeIpv6(StorType):
 
     async def _liftIPv6Eq(self, liftby, valu):
         indx = self.getIPv6Indx(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftIPv6Range(self, liftby, valu):
         minindx = self.getIPv6Indx(valu[0])
         maxindx = self.getIPv6Indx(valu[1])
-        for item in liftby.buidsByRange(minindx, maxindx):
+        for item in liftby.scanByRange(minindx, maxindx):
             yield item
 
 class StorTypeInt(StorType):
@@ -611,12 +738,15 @@ class StorTypeInt(StorType):
     def getIntIndx(self, valu):
         return (valu + self.offset).to_bytes(self.size, 'big')
 
+    def getIntValu(self, indx):
+        return int.from_bytes(indx, 'big') - self.offset
+
     def indx(self, valu):
         return (self.getIntIndx(valu),)
 
     async def _liftIntEq(self, liftby, valu):
         indx = (valu + self.offset).to_bytes(self.size, 'big')
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftIntGt(self, liftby, valu):
@@ -626,7 +756,7 @@ class StorTypeInt(StorType):
     async def _liftIntGe(self, liftby, valu):
         pkeymin = (valu + self.offset).to_bytes(self.size, 'big')
         pkeymax = self.fullbyts
-        for item in liftby.buidsByRange(pkeymin, pkeymax):
+        for item in liftby.scanByRange(pkeymin, pkeymax):
             yield item
 
     async def _liftIntLt(self, liftby, valu):
@@ -636,13 +766,13 @@ class StorTypeInt(StorType):
     async def _liftIntLe(self, liftby, valu):
         pkeymin = self.zerobyts
         pkeymax = (valu + self.offset).to_bytes(self.size, 'big')
-        for item in liftby.buidsByRange(pkeymin, pkeymax):
+        for item in liftby.scanByRange(pkeymin, pkeymax):
             yield item
 
     async def _liftIntRange(self, liftby, valu):
         pkeymin = (valu[0] + self.offset).to_bytes(self.size, 'big')
         pkeymax = (valu[1] + self.offset).to_bytes(self.size, 'big')
-        for item in liftby.buidsByRange(pkeymin, pkeymax):
+        for item in liftby.scanByRange(pkeymin, pkeymax):
             yield item
 
 class StorTypeFloat(StorType):
@@ -674,7 +804,7 @@ class StorTypeFloat(StorType):
         return (self.fpack(valu),)
 
     async def _liftFloatEq(self, liftby, valu):
-        for item in liftby.buidsByDups(self.fpack(valu)):
+        for item in liftby.scanByDups(self.fpack(valu)):
             yield item
 
     async def _liftFloatGeCommon(self, liftby, valu):
@@ -693,15 +823,14 @@ class StorTypeFloat(StorType):
 
     async def _liftFloatGe(self, liftby, valu):
         async for item in self._liftFloatGeCommon(liftby, valu):
-            yield item[1]
+            yield item
 
     async def _liftFloatGt(self, liftby, valu):
-        genr = self._liftFloatGeCommon(liftby, valu)
-        valupack = self.fpack(valu)
+        valupack = liftby.abrv + self.fpack(valu)
         async for item in self._liftFloatGeCommon(liftby, valu):
             if item[0] == valupack:
                 continue
-            yield item[1]
+            yield item
 
     async def _liftFloatLeCommon(self, liftby, valu):
         if math.isnan(valu):
@@ -720,15 +849,14 @@ class StorTypeFloat(StorType):
 
     async def _liftFloatLe(self, liftby, valu):
         async for item in self._liftFloatLeCommon(liftby, valu):
-            yield item[1]
+            yield item
 
     async def _liftFloatLt(self, liftby, valu):
-        genr = self._liftFloatLeCommon(liftby, valu)
-        valupack = self.fpack(valu)
+        valupack = liftby.abrv + self.fpack(valu)
         async for item in self._liftFloatLeCommon(liftby, valu):
             if item[0] == valupack:
                 continue
-            yield item[1]
+            yield item
 
     async def _liftFloatRange(self, liftby, valu):
         valumin, valumax = valu
@@ -742,22 +870,22 @@ class StorTypeFloat(StorType):
 
         if math.copysign(1.0, valumin) > 0.0:
             # Entire range is nonnegative
-            for item in liftby.buidsByRange(pkeymin, pkeymax):
+            for item in liftby.keyBuidsByRange(pkeymin, pkeymax):
                 yield item
             return
 
         if math.copysign(1.0, valumax) < 0.0:  # negative values and -0.0
             # Entire range is negative
-            for item in liftby.buidsByRangeBack(pkeymax, pkeymin):
+            for item in liftby.keyBuidsByRangeBack(pkeymax, pkeymin):
                 yield item
             return
 
         # Yield all values between min and -0
-        for item in liftby.buidsByRangeBack(self.FloatPackNegMax, pkeymin):
+        for item in liftby.keyBuidsByRangeBack(self.FloatPackNegMax, pkeymin):
             yield item
 
         # Yield all values between 0 and max
-        for item in liftby.buidsByRange(self.FloatPackPosMin, pkeymax):
+        for item in liftby.keyBuidsByRange(self.FloatPackPosMin, pkeymax):
             yield item
 
 class StorTypeGuid(StorType):
@@ -770,7 +898,7 @@ class StorTypeGuid(StorType):
 
     async def _liftGuidEq(self, liftby, valu):
         indx = s_common.uhex(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     def indx(self, valu):
@@ -787,8 +915,8 @@ class StorTypeTime(StorTypeInt):
     async def _liftAtIval(self, liftby, valu):
         minindx = self.getIntIndx(valu[0])
         maxindx = self.getIntIndx(valu[1] - 1)
-        for _, buid in liftby.scanByRange(minindx, maxindx):
-            yield buid
+        for item in liftby.scanByRange(minindx, maxindx):
+            yield item
 
 class StorTypeIval(StorType):
 
@@ -802,7 +930,7 @@ class StorTypeIval(StorType):
 
     async def _liftIvalEq(self, liftby, valu):
         indx = self.timetype.getIntIndx(valu[0]) + self.timetype.getIntIndx(valu[1])
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftIvalAt(self, liftby, valu):
@@ -822,7 +950,7 @@ class StorTypeIval(StorType):
             if tock <= minindx:
                 continue
 
-            yield buid
+            yield lkey, buid
 
     def indx(self, valu):
         return (self.timetype.getIntIndx(valu[0]) + self.timetype.getIntIndx(valu[1]),)
@@ -837,12 +965,29 @@ class StorTypeMsgp(StorType):
 
     async def _liftMsgpEq(self, liftby, valu):
         indx = s_common.buid(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     def indx(self, valu):
         return (s_common.buid(valu),)
 
+def _spreadByte(byte):
+    bits = 0
+    for i in range(8):
+        bits |= ((byte >> i) & 1) << (i * 2)
+    return bits
+
+# byte -> 16 bits with the byte bits in the even positions
+_zspread = [_spreadByte(i) for i in range(256)]
+# z-order byte -> (odd bits nibble, even bits nibble)
+_zsplit = [
+    (sum(((i >> (j * 2 + 1)) & 1) << j for j in range(4)), sum(((i >> (j * 2)) & 1) << j for j in range(4)))
+    for i in range(256)
+]
+
+ZORD_BITS = 40
+ZORD_CELLS = 64
+
 class StorTypeLatLon(StorType):
 
     def __init__(self, layr):
@@ -859,7 +1004,7 @@ class StorTypeLatLon(StorType):
 
     async def _liftLatLonEq(self, liftby, valu):
         indx = self._getLatLonIndx(valu)
-        for item in liftby.buidsByDups(indx):
+        for item in liftby.scanByDups(indx):
             yield item
 
     async def _liftLatLonNear(self, liftby, valu):
@@ -871,6 +1016,11 @@ class StorTypeLatLon(StorType):
 
         latmin, latmax, lonmin, lonmax = s_gis.bbox(lat, lon, dist)
 
+        if isinstance(liftby, (IndxByForm, IndxByProp)) and self.layr.latlongs:
+            async for item in self._liftLatLonZord(liftby, (lat, lon), dist, (latmin, latmax, lonmin, lonmax)):
+                yield item
+            return
+
         lonminindx = (round(lonmin * self.scale) + self.lonspace).to_bytes(5, 'big')
         lonmaxindx = (round(lonmax * self.scale) + self.lonspace).to_bytes(5, 'big')
 
@@ -897,7 +1047,137 @@ class StorTypeLatLon(StorType):
             lonvalu = (int.from_bytes(lonbyts, 'big') - self.lonspace) / self.scale
 
             if s_gis.haversine((lat, lon), (latvalu, lonvalu)) <= dist:
-                yield buid
+                yield lkey, buid
+
+    async def _liftLatLonZord(self, liftby, latlong, dist, bbox):
+        '''
+        Yield the index rows within dist of latlong from the z-order index in byprop index order.
+
+        Notes:
+            More than LIFT_SORT_MAX rows are spooled to disk to be sorted.
+        '''
+
+        latmin, latmax, lonmin, lonmax = bbox
+
+        latmin = max(round(latmin * self.scale) + self.latspace, 0)
+        latmax = min(round(latmax * self.scale) + self.latspace, self.latspace * 2)
+        lonmin = max(round(lonmin * self.scale) + self.lonspace, 0)
+        lonmax = min(round(lonmax * self.scale) + self.lonspace, self.lonspace * 2)
+
+        async with await s_spooled.Sorted.anit(dirn=self.layr.dirn, size=LIFT_SORT_MAX) as rows:
+
+            for zmin, zmax in self.getZordRanges(lonmin, lonmax, latmin, latmax):
+
+                lmin = liftby.abrv + zmin.to_bytes(10, 'big')
+                lmax = liftby.abrv + zmax.to_bytes(10, 'big')
+
+                for i, (lkey, buid) in enumerate(self.layr.layrslab.scanByRange(lmin, lmax, db=self.layr.bylatlong)):
+
+                    if i % 1000 == 0:
+                        await asyncio.sleep(0)
+
+                    lonint, latint = self.getZordValu(lkey[8:])
+
+                    # limit results to the bounding box before computing distance
+                    if lonint < lonmin or lonint > lonmax or latint < latmin or latint > latmax:
+                        continue
+
+                    latvalu = (latint - self.latspace) / self.scale
+                    lonvalu = (lonint - self.lonspace) / self.scale
+
+                    if s_gis.haversine(latlong, (latvalu, lonvalu)) <= dist:
+                        lkey = liftby.abrv + lonint.to_bytes(5, 'big') + latint.to_bytes(5, 'big')
+                        await rows.add(lkey, buid)
+
+            # sort rows in the same order as the byprop index
+            for item in rows.items():
+                yield item
+
+    def getZordIndx(self, latlong):
+        '''
+        Return the 10 byte z-order curve index for a (lat, lon) tuple.
+        '''
+        indx = self._getLatLonIndx(latlong)
+        lonint = int.from_bytes(indx[:5], 'big')
+        latint = int.from_bytes(indx[5:], 'big')
+
+        zord = 0
+        for i in range(5):
+            zord |= ((_zspread[(lonint >> (i * 8)) & 0xff] << 1) | _zspread[(latint >> (i * 8)) & 0xff]) << (i * 16)
+
+        return zord.to_bytes(10, 'big')
+
+    def getZordValu(self, indx):
+        '''
+        Return the (lonint, latint) scaled integers for a z-order curve index.
+        '''
+        lonint = latint = 0
+        for i, byte in enumerate(reversed(indx)):
+            lonn, latn = _zsplit[byte]
+            lonint |= lonn << (i * 4)
+            latint |= latn << (i * 4)
+        return lonint, latint
+
+    def getZordRanges(self, lonmin, lonmax, latmin, latmax):
+        '''
+        Decompose a bounding box of scaled integers into a sorted list of
+        (zmin, zmax) z-order curve ranges which cover it.
+        '''
+        full = []
+        todo = [(0, 0, 0)]
+
+        for level in range(1, ZORD_BITS + 1):
+
+            # once the box is split into enough cells, scan partial cells entirely
+            if len(todo) * 4 > ZORD_CELLS:
+                break
+
+            shift = ZORD_BITS - level
+            size = 1 << shift
+
+            nexttodo = []
+            for _, lonp, latp in todo:
+                for lonc, latc in ((0, 0), (0, 1), (1, 0), (1, 1)):
+
+                    lonpref = (lonp << 1) | lonc
+                    latpref = (latp << 1) | latc
+
+                    cellonmin = lonpref << shift
+                    cellonmax = cellonmin + size - 1
+                    cellatmin = latpref << shift
+                    cellatmax = cellatmin + size - 1
+
+                    if cellonmin > lonmax or cellonmax < lonmin or cellatmin > latmax or cellatmax < latmin:
+                        continue
+
+                    cell = (level, lonpref, latpref)
+                    if cellonmin >= lonmin and cellonmax <= lonmax and cellatmin >= latmin and cellatmax <= latmax:
+                        full.append(cell)
+                        continue
+
+                    nexttodo.append(cell)
+
+            todo = nexttodo
+
+        ranges = []
+        for level, lonp, latp in sorted(full + todo, key=lambda x: self._getCellZmin(*x)):
+
+            zmin = self._getCellZmin(level, lonp, latp)
+            zmax = zmin + (1 << ((ZORD_BITS - level) * 2)) - 1
+
+            if ranges and ranges[-1][1] + 1 == zmin:
+                ranges[-1] = (ranges[-1][0], zmax)
+                continue
+
+            ranges.append((zmin, zmax))
+
+        return ranges
+
+    def _getCellZmin(self, level, lonp, latp):
+        zord = 0
+        for i in range(level):
+            zord |= (((lonp >> i) & 1) << (i * 2 + 1)) | (((latp >> i) & 1) << (i * 2))
+        return zord << ((ZORD_BITS - level) * 2)
 
     def _getLatLonIndx(self, latlong):
         # yield index bytes in lon/lat order to allow cheap optimal indexing
@@ -975,6 +1255,8 @@ class Layer(s_nexus.Pusher):
             StorTypeFloat(self, STOR_TYPE_FLOAT64, 8),
         ]
 
+        await self._initLayerIndexes()
+
         self.editors = [
             self._editNodeAdd,
             self._editNodeDel,
@@ -1020,6 +1302,7 @@ class Layer(s_nexus.Pusher):
         await self.dataslab.trash()
 
         await self._initLayerStorage()
+        await self._initLayerIndexes()
 
     async def _initLayerStorage(self):
 
@@ -1040,6 +1323,8 @@ class Layer(s_nexus.Pusher):
                                                    readahead=False, readonly=self.readonly)
 
         self.formcounts = await self.layrslab.getHotCount('count:forms')
+        self.propcounts = await self.layrslab.getHotCount('count:props')
+        self.tagcounts = await self.layrslab.getHotCount('count:tags')
 
         path = s_common.genpath(self.dirn, 'nodeedits.lmdb')
         self.nodeeditslab = await s_lmdbslab.Slab.anit(path, readonly=self.readonly)
@@ -1064,7 +1349,19 @@ class Layer(s_nexus.Pusher):
         self.byarray = self.layrslab.initdb('byarray', dupsort=True)
         self.bytagprop = self.layrslab.initdb('bytagprop', dupsort=True)
 
+        # tag intervals indexed by (min, max) and (max, min)
+        self.bytagmin = self.layrslab.initdb('bytagmin', dupsort=True)
+        self.bytagmax = self.layrslab.initdb('bytagmax', dupsort=True)
+
+        # geo:latlong values indexed by z-order curve
+        self.bylatlong = self.layrslab.initdb('bylatlong', dupsort=True)
+
+        self.bytrigram = self.layrslab.initdb('bytrigram', dupsort=True)
+        self.trigprops = self.layrslab.initdb('trigprops')
+        self.trigabrvs = set(self.layrslab.scanKeys(db=self.trigprops))
+
         self.countdb = self.layrslab.initdb('counters')
+        self.layrmeta = s_lmdbslab.SlabDict(self.layrslab, db=self.layrslab.initdb('layrmeta'))
         self.nodedata = self.dataslab.initdb('nodedata')
         self.dataname = self.dataslab.initdb('dataname', dupsort=True)
 
@@ -1072,6 +1369,185 @@ class Layer(s_nexus.Pusher):
         if self.logedits:
             self.nodeeditlog = self.nodeeditctor(self.nodeeditslab, 'nodeedits')
 
+    async def _initLayerIndexes(self):
+
+        if self.fresh and not self.readonly:
+            self.layrmeta.set('tagival:indexed', True)
+            self.layrmeta.set('latlong:indexed', True)
+            self.layrmeta.set('counts:indexed', True)
+
+        if not self.readonly and not self.layrmeta.get('counts:indexed'):
+            await self._initLayerCounts()
+
+        if not self.readonly and not self.layrmeta.get('tagival:indexed'):
+            await self._initTagIvalIndex()
+
+        if not self.readonly and not self.layrmeta.get('latlong:indexed'):
+            await self._initLatLongIndex()
+
+        self.tagivals = self.layrmeta.get('tagival:indexed', False)
+        self.latlongs = self.layrmeta.get('latlong:indexed', False)
+
+    async def _initTagIvalIndex(self):
+
+        logger.warning(f'Indexing tag intervals for layer {self.iden}')
+
+        tagcache = {}
+        for i, (lkey, buid) in enumerate(self.layrslab.scanByFull(db=self.bytag)):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            tagabrv = lkey[:8]
+
+            tenc = tagcache.get(tagabrv)
+            if tenc is None:
+                tenc = tagcache[tagabrv] = self.tagabrv.abrvToByts(tagabrv)
+
+            byts = self.layrslab.get(buid + b'\x02' + tenc, db=self.bybuid)
+            if byts is None: # pragma: no cover
+                continue
+
+            self._putTagIval(tagabrv, lkey[8:], buid, s_msgpack.un(byts))
+
+        self.layrmeta.set('tagival:indexed', True)
+
+        logger.warning(f'Indexing tag intervals for layer {self.iden} complete')
+
+    async def _initLayerCounts(self):
+
+        logger.warning(f'Counting props and tags for layer {self.iden}')
+
+        form = None
+        lastbuid = None
+
+        propcounts = collections.defaultdict(int)
+        for i, lkey in enumerate(self.layrslab.scanKeys(db=self.bybuid)):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            if lkey[32] != 1:
+                continue
+
+            buid = lkey[:32]
+            if buid != lastbuid:
+                lastbuid = buid
+                fenc = self.layrslab.get(buid + b'\x09', db=self.bybuid)
+                form = None if fenc is None else fenc.decode()
+
+            if form is None: # pragma: no cover
+                continue
+
+            propcounts[self._getPropCountName(form, lkey[33:].decode())] += 1
+
+        for name, valu in propcounts.items():
+            self.propcounts.set(name, valu)
+
+        tagcounts = collections.defaultdict(int)
+        for i, (lkey, _) in enumerate(self.layrslab.scanByFull(db=self.bytag)):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            tagcounts[lkey] += 1
+
+        for lkey, valu in tagcounts.items():
+            tag = self.tagabrv.abrvToName(lkey[:8])
+            form = self.getAbrvProp(lkey[8:])[0]
+            self.tagcounts.set(f'{form}#{tag}', valu)
+
+        self.layrmeta.set('counts:indexed', True)
+
+        logger.warning(f'Counting props and tags for layer {self.iden} complete')
+
+    def _getPropCountName(self, form, prop):
+        if prop[0] == '.':
+            return form + prop
+        return f'{form}:{prop}'
+
+    def getPropCount(self, form, prop):
+        '''
+        Return the number of nodes in the layer which have the given prop.
+        '''
+        return self.propcounts.get(self._getPropCountName(form, prop))
+
+    def getTagCount(self, tag, form):
+        '''
+        Return the number of nodes of the given form in the layer which have the given tag.
+        '''
+        return self.tagcounts.get(f'{form}#{tag}')
+
+    async def getPropValuCount(self, form, prop, cmprvals, limit=None):
+        '''
+        Count the index rows which match the given comparisons, stopping at limit.
+
+        Notes:
+            Counting the matching index rows up to a limit gives the planner
+            an exact and bounded cost estimate for selective comparisons.
+        '''
+        if prop is None:
+            genr = self.liftByFormValu(form, cmprvals)
+        else:
+            genr = self.liftByPropValu(form, prop, cmprvals)
+
+        count = 0
+        async for _ in genr:
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+        await genr.aclose()
+        return count
+
+    async def _initLatLongIndex(self):
+
+        logger.warning(f'Indexing geo:latlong values for layer {self.iden}')
+
+        for i, (lkey, lval) in enumerate(self.layrslab.scanByFull(db=self.bybuid)):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            buid = lkey[:32]
+            flag = lkey[32]
+
+            if flag == 0:
+                form, valu, stortype = s_msgpack.un(lval)
+                self._putLatLongIndx(self.setPropAbrv(form, None), buid, valu, stortype)
+                continue
+
+            if flag != 1:
+                continue
+
+            valu, stortype = s_msgpack.un(lval)
+            if stortype != STOR_TYPE_LATLONG:
+                continue
+
+            fenc = self.layrslab.get(buid + b'\x09', db=self.bybuid)
+            if fenc is None: # pragma: no cover
+                continue
+
+            prop = lkey[33:].decode()
+
+            self._putLatLongIndx(self.setPropAbrv(fenc.decode(), prop), buid, valu, stortype)
+            if prop[0] == '.':
+                self._putLatLongIndx(self.setPropAbrv(None, prop), buid, valu, stortype)
+
+        self.layrmeta.set('latlong:indexed', True)
+
+        logger.warning(f'Indexing geo:latlong values for layer {self.iden} complete')
+
+    def _putLatLongIndx(self, abrv, buid, valu, stortype):
+        if stortype == STOR_TYPE_LATLONG:
+            indx = self.stortypes[STOR_TYPE_LATLONG].getZordIndx(valu)
+            self.layrslab.put(abrv + indx, buid, db=self.bylatlong)
+
+    def _delLatLongIndx(self, abrv, buid, valu, stortype):
+        if stortype == STOR_TYPE_LATLONG:
+            indx = self.stortypes[STOR_TYPE_LATLONG].getZordIndx(valu)
+            self.layrslab.delete(abrv + indx, buid, db=self.bylatlong)
+
     def getSpawnInfo(self):
         info = self.pack()
         info['dirn'] = self.dirn
@@ -1110,6 +1586,126 @@ class Layer(s_nexus.Pusher):
     def setPropAbrv(self, form, prop):
         return self.propabrv.setBytsToAbrv(s_msgpack.en((form, prop)))
 
+    @s_nexus.Pusher.onPushAuto('trigram:add')
+    async def addTrigramIndex(self, form, prop=None):
+        '''
+        Enable a trigram index to accelerate regex lifts for the given form or prop.
+
+        Returns:
+            (bool): True if the index was added.
+        '''
+        if form is None:
+            mesg = 'Trigram indexes are not supported for universal props.'
+            raise s_exc.BadArg(mesg=mesg, prop=prop)
+
+        abrv = self.setPropAbrv(form, prop)
+        if abrv in self.trigabrvs:
+            return False
+
+        self.trigabrvs.add(abrv)
+        self.layrslab.put(abrv, s_msgpack.en((form, prop)), db=self.trigprops)
+
+        if prop is None:
+            indxby = IndxByForm(self, form)
+        else:
+            indxby = IndxByProp(self, form, prop)
+
+        # index the existing values ( new edits are indexed by the editors )
+        for i, buid in enumerate(indxby.buidsByPref()):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            self._addTrigrams(abrv, buid, indxby.getNodeValu(buid))
+
+        return True
+
+    @s_nexus.Pusher.onPushAuto('trigram:del')
+    async def delTrigramIndex(self, form, prop=None):
+        '''
+        Remove the trigram index for the given form or prop.
+
+        Returns:
+            (bool): True if the index was removed.
+        '''
+        try:
+            abrv = self.getPropAbrv(form, prop)
+        except s_exc.NoSuchAbrv:
+            return False
+
+        if abrv not in self.trigabrvs:
+            return False
+
+        self.trigabrvs.discard(abrv)
+        self.layrslab.delete(abrv, db=self.trigprops)
+
+        lkeys = []
+        for lkey, _ in self.layrslab.scanByPref(abrv, db=self.bytrigram):
+            if not lkeys or lkeys[-1] != lkey:
+                lkeys.append(lkey)
+
+        for i, lkey in enumerate(lkeys):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            self.layrslab.delete(lkey, db=self.bytrigram)
+
+        return True
+
+    async def getTrigramIndexes(self):
+        '''
+        Return a list of (form, prop) tuples which have a trigram index.
+        '''
+        return [s_msgpack.un(byts) for _, byts in self.layrslab.scanByFull(db=self.trigprops)]
+
+    async def iterTrigramBuids(self, abrv, trigs):
+        '''
+        Yield the buids whose values contain all of the given trigrams.
+
+        Args:
+            abrv (bytes): The abbreviation of the indexed form or prop.
+            trigs (list): A list of trigram bytes.
+
+        Notes:
+            Only the posting list of the rarest trigram is scanned and each
+            candidate is probed for the other trigrams.
+        '''
+        sizes = []
+        for trig in trigs:
+            lkey = abrv + trig
+            count = self.layrslab.countdups(lkey, db=self.bytrigram)
+            if not count:
+                return
+            sizes.append((count, lkey))
+
+        sizes.sort()
+        others = [lkey for _, lkey in sizes[1:]]
+
+        for i, (_, buid) in enumerate(self.layrslab.scanByDups(sizes[0][1], db=self.bytrigram)):
+
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+
+            if all(self.layrslab.hasdup(lkey, buid, db=self.bytrigram) for lkey in others):
+                yield buid
+
+    def _addTrigrams(self, abrv, buid, valu):
+
+        if abrv not in self.trigabrvs or not isinstance(valu, str):
+            return
+
+        for trig in getTrigrams(valu):
+            self.layrslab.put(abrv + trig, buid, db=self.bytrigram)
+
+    def _delTrigrams(self, abrv, buid, valu):
+
+        if abrv not in self.trigabrvs or not isinstance(valu, str):
+            return
+
+        for trig in getTrigrams(valu):
+            self.layrslab.delete(abrv + trig, buid, db=self.bytrigram)
+
     @s_cache.memoize()
     def getTagPropAbrv(self, *args):
         return self.tagpropabrv.bytsToAbrv(s_msgpack.en(args))
@@ -1149,6 +1745,18 @@ class Layer(s_nexus.Pusher):
             return None
         return s_msgpack.un(byts)
 
+    def hasNodeForm(self, buid):
+        return self.layrslab.get(buid + b'\x00', db=self.bybuid) is not None
+
+    def hasNodeProp(self, buid, prop):
+        return self.layrslab.get(buid + b'\x01' + prop.encode(), db=self.bybuid) is not None
+
+    def hasNodeTag(self, buid, tag):
+        return self.layrslab.get(buid + b'\x02' + tag.encode(), db=self.bybuid) is not None
+
+    def hasNodeTagProp(self, buid, tag, prop):
+        return self.layrslab.get(buid + b'\x03' + tag.encode() + b':' + prop.encode(), db=self.bybuid) is not None
+
     async def getStorNode(self, buid):
         '''
         Return a potentially incomplete pode.
@@ -1161,40 +1769,75 @@ class Layer(s_nexus.Pusher):
         self.buidcache[buid] = info
 
         for lkey, lval in self.layrslab.scanByPref(buid, db=self.bybuid):
+            self._addStorRow(info, lkey, lval)
 
-            flag = lkey[32]
+        return (buid, info)
 
-            if flag == 0:
-                form, valu, stortype = s_msgpack.un(lval)
-                info['ndef'] = (form, valu)
-                continue
+    async def getStorNodes(self, buids):
+        '''
+        Yield potentially incomplete podes for a batch of buids.
 
-            if flag == 1:
-                name = lkey[33:].decode()
-                valu, stortype = s_msgpack.un(lval)
-                info['props'][name] = valu
-                continue
+        Note:
+            The buids are sorted and uncached storage rows are read with a
+            single cursor over the bybuid db.  Results are yielded in sorted
+            buid order.
+        '''
+        todo = []
+        infos = {}
 
-            if flag == 2:
-                name = lkey[33:].decode()
-                info['tags'][name] = s_msgpack.un(lval)
-                continue
+        for buid in sorted(set(buids)):
 
-            if flag == 3:
-                tag, prop = lkey[33:].decode().split(':')
-                valu, stortype = s_msgpack.un(lval)
-                info['tagprops'][(tag, prop)] = valu
-                continue
+            info = self.buidcache.get(buid)
+            if info is None:
+                info = collections.defaultdict(dict)
+                todo.append(buid)
 
-            if flag == 9:
-                continue
+            infos[buid] = info
 
-            logger.warning(f'unrecognized storage row: {flag}')
+        for buid, lkey, lval in self.layrslab.scanByPrefs(todo, db=self.bybuid):
+            self._addStorRow(infos[buid], lkey, lval)
 
-        return (buid, info)
+        for buid in todo:
+            self.buidcache[buid] = infos[buid]
 
-    async def liftByTag(self, tag, form=None):
+        for item in infos.items():
+            yield item
+
+    def _addStorRow(self, info, lkey, lval):
+
+        flag = lkey[32]
 
+        if flag == 0:
+            form, valu, stortype = s_msgpack.un(lval)
+            info['ndef'] = (form, valu)
+            return
+
+        if flag == 1:
+            name = lkey[33:].decode()
+            valu, stortype = s_msgpack.un(lval)
+            info['props'][name] = valu
+            return
+
+        if flag == 2:
+            name = lkey[33:].decode()
+            info['tags'][name] = s_msgpack.un(lval)
+            return
+
+        if flag == 3:
+            tag, prop = lkey[33:].decode().split(':')
+            valu, stortype = s_msgpack.un(lval)
+            info['tagprops'][(tag, prop)] = valu
+            return
+
+        if flag == 9:
+            return
+
+        logger.warning(f'unrecognized storage row: {flag}')
+
+    async def liftByTag(self, tag, form=None):
+        '''
+        Yield (<lkey>, <buid>) index rows for nodes with the given tag.
+        '''
         try:
             abrv = self.tagabrv.bytsToAbrv(tag.encode())
             if form is not None:
@@ -1203,8 +1846,8 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return
 
-        for _, buid in self.layrslab.scanByPref(abrv, db=self.bytag):
-            yield await self.getStorNode(buid)
+        async for item in self.layrslab.scanByPrefThread(abrv, db=self.bytag):
+            yield item
 
     async def liftByTagValu(self, tag, cmpr, valu, form=None):
 
@@ -1220,11 +1863,107 @@ class Layer(s_nexus.Pusher):
         if filt is None:
             raise s_exc.NoSuchCmpr(cmpr=cmpr)
 
-        for _, buid in self.layrslab.scanByPref(abrv, db=self.bytag):
+        if self.tagivals and None not in valu:
+            async for item in self._liftByTagIval(abrv[:8], abrv[8:], cmpr, valu, filt):
+                yield item
+            return
+
+        for lkey, buid in self.layrslab.scanByPref(abrv, db=self.bytag):
             # filter based on the ival value before lifting the node...
             valu = await self.getNodeTag(buid, tag)
             if filt(valu):
-                yield await self.getStorNode(buid)
+                yield lkey, buid
+
+    async def _liftByTagIval(self, tagabrv, formabrv, cmpr, valu, filt):
+        '''
+        Yield the bytag index rows for nodes whose tag interval matches the comparison.
+
+        Notes:
+            More than LIFT_SORT_MAX rows are spooled to disk to be sorted.
+        '''
+
+        timetype = self.stortypes[STOR_TYPE_TIME]
+
+        if cmpr == '=':
+            lkey = tagabrv + timetype.getIntIndx(valu[0]) + timetype.getIntIndx(valu[1])
+            genr = self.layrslab.scanByDups(lkey, db=self.bytagmin)
+
+        elif self._useTagMinIndx(tagabrv, valu):
+            # scan the (min, max) index up to the last possible min value
+            lmin = tagabrv
+            lmax = tagabrv + timetype.getIntIndx(valu[1]) + timetype.fullbyts
+            genr = self.layrslab.scanByRange(lmin, lmax, db=self.bytagmin)
+
+        else:
+            # scan the (max, min) index from the first possible max value
+            lmin = tagabrv + timetype.getIntIndx(valu[0])
+            lmax = tagabrv + timetype.fullbyts + timetype.fullbyts
+            genr = ((k[:8] + k[16:] + k[8:16], v) for (k, v) in self.layrslab.scanByRange(lmin, lmax, db=self.bytagmax))
+
+        async with await s_spooled.Sorted.anit(dirn=self.dirn, size=LIFT_SORT_MAX) as rows:
+
+            for i, (lkey, lval) in enumerate(genr):
+
+                if i % 1000 == 0:
+                    await asyncio.sleep(0)
+
+                if formabrv and lval[:8] != formabrv:
+                    continue
+
+                ival = (timetype.getIntValu(lkey[8:16]), timetype.getIntValu(lkey[16:]))
+                if not filt(ival):
+                    continue
+
+                await rows.add(tagabrv + lval[:8], lval[8:])
+
+            # sort rows in the same order as the bytag index
+            for item in rows.items():
+                yield item
+
+    def _useTagMinIndx(self, tagabrv, valu):
+        '''
+        Choose the (min, max) index for an overlap lift if the query is nearer
+        the oldest interval than the newest.
+        '''
+        timetype = self.stortypes[STOR_TYPE_TIME]
+
+        minv = maxv = None
+        for lkey, _ in self.layrslab.scanByPref(tagabrv, db=self.bytagmin):
+            minv = timetype.getIntValu(lkey[8:16])
+            break
+
+        for lkey, _ in self.layrslab.scanByPrefBack(tagabrv, db=self.bytagmax):
+            maxv = timetype.getIntValu(lkey[8:16])
+            break
+
+        if minv is None or maxv is None:
+            return True
+
+        return (valu[1] - minv) <= (maxv - valu[0])
+
+    def _putTagIval(self, tagabrv, formabrv, buid, valu):
+
+        if valu == (None, None):
+            return
+
+        timetype = self.stortypes[STOR_TYPE_TIME]
+        mindx = timetype.getIntIndx(valu[0])
+        maxdx = timetype.getIntIndx(valu[1])
+
+        self.layrslab.put(tagabrv + mindx + maxdx, formabrv + buid, db=self.bytagmin)
+        self.layrslab.put(tagabrv + maxdx + mindx, formabrv + buid, db=self.bytagmax)
+
+    def _delTagIval(self, tagabrv, formabrv, buid, valu):
+
+        if valu == (None, None):
+            return
+
+        timetype = self.stortypes[STOR_TYPE_TIME]
+        mindx = timetype.getIntIndx(valu[0])
+        maxdx = timetype.getIntIndx(valu[1])
+
+        self.layrslab.delete(tagabrv + mindx + maxdx, formabrv + buid, db=self.bytagmin)
+        self.layrslab.delete(tagabrv + maxdx + mindx, formabrv + buid, db=self.bytagmax)
 
     async def hasTagProp(self, name):
         async for _ in self.liftTagProp(name):
@@ -1251,42 +1990,79 @@ class Layer(s_nexus.Pusher):
         except s_exc.NoSuchAbrv:
             return
 
-        for _, buid in self.layrslab.scanByPref(abrv, db=self.bytagprop):
-            yield await self.getStorNode(buid)
+        async for item in self.layrslab.scanByPrefThread(abrv, db=self.bytagprop):
+            yield item
 
     async def liftByTagPropValu(self, form, tag, prop, cmprvals):
         for cmpr, valu, kind in cmprvals:
 
-            async for buid in self.stortypes[kind].indxByTagProp(form, tag, prop, cmpr, valu):
-                yield await self.getStorNode(buid)
+            async for item in self.stortypes[kind].indxByTagProp(form, tag, prop, cmpr, valu):
+                yield item
 
     async def liftByProp(self, form, prop):
+        '''
+        Yield (<lkey>, <buid>) index rows for nodes with the given form or prop.
+
+        Note:
+            Each lkey begins with the (layer specific) prop abrv followed by
+            the index bytes for the value which allows a caller to merge sort
+            index rows lifted from multiple layers.
+        '''
         try:
             abrv = self.getPropAbrv(form, prop)
 
         except s_exc.NoSuchAbrv:
             return
 
-        for _, buid in self.layrslab.scanByPref(abrv, db=self.byprop):
-            yield await self.getStorNode(buid)
+        async for item in self.layrslab.scanByPrefThread(abrv, db=self.byprop):
+            yield item
 
     # NOTE: form vs prop valu lifting is differentiated to allow merge sort
     async def liftByFormValu(self, form, cmprvals):
         for cmpr, valu, kind in cmprvals:
-            async for buid in self.stortypes[kind].indxByForm(form, cmpr, valu):
-                yield await self.getStorNode(buid)
+            async for item in self.stortypes[kind].indxByForm(form, cmpr, valu):
+                yield item
 
     async def liftByPropValu(self, form, prop, cmprvals):
         for cmpr, valu, kind in cmprvals:
             if kind & 0x8000:
                 kind = STOR_TYPE_MSGP
-            async for buid in self.stortypes[kind].indxByProp(form, prop, cmpr, valu):
-                yield await self.getStorNode(buid)
+            async for item in self.stortypes[kind].indxByProp(form, prop, cmpr, valu):
+                yield item
+
+    async def liftByFormValus(self, form, valus, stortype):
+        '''
+        Yield (<lkey>, <buid>) index rows for nodes of the form with any of the given norm values.
+        '''
+        try:
+            indxby = IndxByForm(self, form)
+
+        except s_exc.NoSuchAbrv:
+            return
+
+        async for item in self.stortypes[stortype].indxByValus(indxby, valus):
+            yield item
+
+    async def liftByPropValus(self, form, prop, valus, stortype):
+        '''
+        Yield (<lkey>, <buid>) index rows for nodes where the prop has any of the given norm values.
+        '''
+        if stortype & 0x8000:
+            stortype = STOR_TYPE_MSGP
+
+        try:
+            indxby = IndxByProp(self, form, prop)
+
+        except s_exc.NoSuchAbrv:
+            return
+
+        async for item in self.stortypes[stortype].indxByValus(indxby, valus):
+            yield item
 
     async def liftByPropArray(self, form, prop, cmprvals):
         for cmpr, valu, kind in cmprvals:
-            async for buid in self.stortypes[kind].indxByPropArray(form, prop, cmpr, valu):
-                yield await self.getStorNode(buid)
+            async for item in self.stortypes[kind].indxByPropArray(form, prop, cmpr, valu):
+                yield item
 
     async def liftByDataName(self, name):
         try:
@@ -1330,10 +2106,7 @@ class Layer(s_nexus.Pusher):
         Returns:
             List[Tuple[buid, form, edits]]  Same list, but with only the edits actually applied (plus the old value)
         '''
-        results = []
-
-        for edits in [await self._storNodeEdit(e) for e in nodeedits]:
-            results.extend(edits)
+        results = await self._applyNodeEdits(nodeedits)
 
         if self.logedits:
             changes = [r for r in results if r[2]]
@@ -1346,6 +2119,57 @@ class Layer(s_nexus.Pusher):
 
         return results
 
+    @s_nexus.Pusher.onPushBatch('edits')
+    async def _storNodeEditsBatch(self, items):
+        '''
+        Execute the node edits from consecutive "edits" log entries in a single storage pass.
+
+        Args:
+            items:  List[Tuple[args, kwargs]]  The arguments of each _storNodeEdits call
+
+        Returns:
+            List[List[Tuple[buid, form, edits]]]  The _storNodeEdits results for each entry
+        '''
+        retn = []
+        logs = []
+
+        try:
+
+            for (nodeedits, meta), _ in items:
+
+                results = await self._applyNodeEdits(nodeedits)
+                retn.append(results)
+
+                if self.logedits:
+                    changes = [r for r in results if r[2]]
+                    if changes:
+                        logs.append((changes, meta))
+
+        finally:
+
+            # the entries applied before a failure are re-applied individually
+            # without any changes, so their changes must be logged here
+            if logs:
+
+                offs = self.nodeeditlog.index()
+                self.nodeeditlog.save(logs)
+
+                for indx, (changes, _) in enumerate(logs, start=offs):
+                    [(await wind.put((indx, changes))) for wind in tuple(self.windows)]
+
+        await asyncio.sleep(0)
+
+        return retn
+
+    async def _applyNodeEdits(self, nodeedits):
+
+        results = []
+
+        for edits in [await self._storNodeEdit(e) for e in nodeedits]:
+            results.extend(edits)
+
+        return results
+
     async def _storNodeEdit(self, nodeedit):
         '''
         Execute a series of storage operations for the given node.
@@ -1427,6 +2251,9 @@ class Layer(s_nexus.Pusher):
             for indx in self.getStorIndx(stortype, valu):
                 self.layrslab.put(abrv + indx, buid, db=self.byprop)
 
+            self._addTrigrams(abrv, buid, valu)
+            self._putLatLongIndx(abrv, buid, valu, stortype)
+
         self.formcounts.inc(form)
 
         retn = [(EDIT_NODE_ADD, (valu, stortype), ())]
@@ -1462,6 +2289,9 @@ class Layer(s_nexus.Pusher):
             for indx in self.getStorIndx(stortype, valu):
                 self.layrslab.delete(abrv + indx, buid, db=self.byprop)
 
+            self._delTrigrams(abrv, buid, valu)
+            self._delLatLongIndx(abrv, buid, valu, stortype)
+
         self.formcounts.inc(form, valu=-1)
 
         self._wipeNodeData(buid)
@@ -1534,9 +2364,16 @@ class Layer(s_nexus.Pusher):
                     if univabrv is not None:
                         self.layrslab.delete(univabrv + oldi, buid, db=self.byprop)
 
+                self._delTrigrams(abrv, buid, oldv)
+
+                self._delLatLongIndx(abrv, buid, oldv, oldt)
+                if univabrv is not None:
+                    self._delLatLongIndx(univabrv, buid, oldv, oldt)
+
         else:
             fenc = form.encode()
             self.layrslab.put(buid + b'\x09', fenc, db=self.bybuid, overwrite=False)
+            self.propcounts.inc(self._getPropCountName(form, prop))
 
         if stortype & STOR_FLAG_ARRAY:
 
@@ -1557,6 +2394,12 @@ class Layer(s_nexus.Pusher):
                 if univabrv is not None:
                     self.layrslab.put(univabrv + indx, buid, db=self.byprop)
 
+            self._addTrigrams(abrv, buid, valu)
+
+            self._putLatLongIndx(abrv, buid, valu, stortype)
+            if univabrv is not None:
+                self._putLatLongIndx(univabrv, buid, valu, stortype)
+
         if sode is not None:
             sode['props'][prop] = valu
 
@@ -1581,6 +2424,8 @@ class Layer(s_nexus.Pusher):
         if byts is None:
             return ()
 
+        self.propcounts.inc(self._getPropCountName(form, prop), valu=-1)
+
         valu, stortype = s_msgpack.un(byts)
 
         if stortype & STOR_FLAG_ARRAY:
@@ -1589,7 +2434,7 @@ class Layer(s_nexus.Pusher):
 
             for aval in valu:
                 for indx in self.getStorIndx(realtype, aval):
-                    self.layrslab.put(abrv + indx, buid, db=self.byarray)
+                    self.layrslab.delete(abrv + indx, buid, db=self.byarray)
                     if univabrv is not None:
                         self.layrslab.delete(univabrv + indx, buid, db=self.byarray)
 
@@ -1605,6 +2450,12 @@ class Layer(s_nexus.Pusher):
                 if univabrv is not None:
                     self.layrslab.delete(univabrv + indx, buid, db=self.byprop)
 
+            self._delTrigrams(abrv, buid, valu)
+
+            self._delLatLongIndx(abrv, buid, valu, stortype)
+            if univabrv is not None:
+                self._delLatLongIndx(univabrv, buid, valu, stortype)
+
         if sode is not None:
             sode['props'].pop(prop, None)
 
@@ -1641,11 +2492,15 @@ class Layer(s_nexus.Pusher):
             if oldv == valu:
                 return ()
 
+            self._delTagIval(tagabrv, formabrv, buid, oldv)
+
         else:
             fenc = form.encode()
             self.layrslab.put(buid + b'\x09', fenc, db=self.bybuid, overwrite=False)
+            self.tagcounts.inc(f'{form}#{tag}')
 
         self.layrslab.put(tagabrv + formabrv, buid, db=self.bytag)
+        self._putTagIval(tagabrv, formabrv, buid, valu)
 
         if sode is not None:
             sode['tags'][tag] = valu
@@ -1669,8 +2524,10 @@ class Layer(s_nexus.Pusher):
         tagabrv = self.tagabrv.bytsToAbrv(tenc)
 
         self.layrslab.delete(tagabrv + formabrv, buid, db=self.bytag)
+        self.tagcounts.inc(f'{form}#{tag}', valu=-1)
 
         oldv = s_msgpack.un(oldb)
+        self._delTagIval(tagabrv, formabrv, buid, oldv)
 
         if sode is not None:
             sode['tags'].pop(tag, None)
@@ -1,10 +1,14 @@
 import os
+import time
+import queue
 import shutil
 import asyncio
 import pathlib
 import functools
 import threading
+import contextlib
 import collections
+import multiprocessing
 
 import logging
 logger = logging.getLogger(__name__)
@@ -27,12 +31,27 @@ import synapse.lib.thisplat as s_thisplat
 COPY_CHUNKSIZE = 512
 PROGRESS_PERIOD = COPY_CHUNKSIZE * 1024
 
+# The number of rows read per read-only transaction by the threaded scan methods
+SCAN_CHUNKSIZE = 1000
+
+# The min number of seconds between commits made by the threaded scan methods to read pending writes
+SCAN_SYNC_PERIOD = 1.0
+
+# The number of rows written per write transaction when copying a snapshot transaction
+SNAP_CHUNKSIZE = 10000
+
+# How long to wait on the snapshot copy process before checking that it is still running
+SNAP_POLL_TIMEOUT = 1
+
 # By default, double the map size each time we run out of space, until this amount, and then we only increase by that
 MAX_DOUBLE_SIZE = 100 * s_const.gibibyte
 
 int64min = s_common.int64en(0)
 int64max = s_common.int64en(0xffffffffffffffff)
 
+# the number of queue entries deleted between yields during a MultiQueue cull
+CULL_CHUNKSIZE = 10000
+
 # The paths of all open slabs, to prevent accidental opening of the same slab in two places
 _AllSlabs = set()   # type: ignore
 
@@ -64,6 +83,58 @@ class Hist:
             tick = int.from_bytes(lkey, 'big')
             yield tick, s_msgpack.un(byts)
 
+class ReadGate:
+    '''
+    Allows any number of threads to read from an lmdb environment while
+    blocking reads during operations which require exclusive access (such
+    as changing the map size).
+    '''
+    def __init__(self):
+        self.readers = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+    @contextlib.contextmanager
+    def reading(self):
+
+        self.acquire()
+
+        try:
+            yield
+
+        finally:
+            self.release()
+
+    def acquire(self):
+        with self.cond:
+            while self.closed:
+                self.cond.wait()
+            self.readers += 1
+
+    def release(self):
+        with self.cond:
+            self.readers -= 1
+            self.cond.notify_all()
+
+    @contextlib.contextmanager
+    def exclusive(self):
+
+        with self.cond:
+            while self.closed:
+                self.cond.wait()
+
+            self.closed = True
+            while self.readers:
+                self.cond.wait()
+
+        try:
+            yield
+
+        finally:
+            with self.cond:
+                self.closed = False
+                self.cond.notify_all()
+
 class SlabDict:
     '''
     A dictionary-like object which stores it's props in a slab via a prefix.
@@ -248,6 +319,12 @@ class HotKeyVal(s_base.Base):
         self.slab.putmulti(tups, db=self.db)
         self.dirty.clear()
 
+    def pop(self, name: str, defv=None):
+        byts = name.encode()
+        self.dirty.discard(byts)
+        self.slab.pop(byts, db=self.db)
+        return self.cache.pop(byts, defv)
+
     def pack(self):
         return {n.decode(): v for (n, v) in self.cache.items()}
 
@@ -280,14 +357,65 @@ class MultiQueue(s_base.Base):
         self.abrv = slab.getNameAbrv(f'{name}:abrv')
         self.qdata = self.slab.initdb(f'{name}:qdata')
 
-        self.sizes = SlabDict(self.slab, db=self.slab.initdb(f'{name}:sizes'))
         self.queues = SlabDict(self.slab, db=self.slab.initdb(f'{name}:meta'))
-        self.offsets = SlabDict(self.slab, db=self.slab.initdb(f'{name}:offs'))
+
+        self.sizes = await HotCount.anit(self.slab, f'{name}:qsizes')
+        self.onfini(self.sizes)
+
+        self.offsets = await HotCount.anit(self.slab, f'{name}:qoffs')
+        self.onfini(self.offsets)
+
         self.lastreqid = await HotKeyVal.anit(self.slab, 'reqid')
         self.onfini(self.lastreqid)
 
         self.waiters = collections.defaultdict(asyncio.Event)  # type: ignore
 
+        self._initQueueCounts(name)
+
+    def _initQueueCounts(self, name):
+        '''
+        Check the queue sizes and offsets against the queued items.
+
+        Notes:
+            The counts are only synced on slab commit and may lag the queued
+            items after a crash. Items are always queued at increasing offsets
+            and culled from the front, so the counts may be recomputed from
+            the first and last item in each queue.
+        '''
+        # sizes and offsets were previously stored in SlabDicts
+        oldoffs = {}
+        for oldname in (f'{name}:sizes', f'{name}:offs'):
+            if self.slab.dbexists(oldname):
+                if oldname.endswith(':offs'):
+                    oldoffs = SlabDict(self.slab, db=self.slab.initdb(oldname)).info
+                self.slab.dropdb(oldname)
+
+        for qname in self.queues.keys():
+
+            abrv = self.abrv.nameToAbrv(qname)
+
+            offs = max(self.offsets.get(qname), oldoffs.get(qname, 0))
+            size = 0
+
+            for lkey, _ in self.slab.scanByRangeBack(abrv + int64max, abrv + int64min, db=self.qdata):
+                last = s_common.int64un(lkey[8:])
+                offs = max(offs, last + 1)
+
+                for lkey, _ in self.slab.scanByRange(abrv + int64min, abrv + int64max, db=self.qdata):
+                    size = last - s_common.int64un(lkey[8:]) + 1
+                    break
+
+                break
+
+            if size != self.sizes.get(qname):
+                self.sizes.set(qname, size)
+
+            if offs != self.offsets.get(qname):
+                self.offsets.set(qname, offs)
+
+        self.sizes.sync()
+        self.offsets.sync()
+
     def list(self):
         return [self.status(n) for n in self.queues.keys()]
 
@@ -335,6 +463,7 @@ class MultiQueue(s_base.Base):
         await self.cull(name, 0xffffffffffffffff)
 
         self.queues.pop(name)
+        self.sizes.pop(name)
         self.offsets.pop(name)
 
         evnt = self.waiters.pop(name, None)
@@ -368,12 +497,13 @@ class MultiQueue(s_base.Base):
 
         self.lastreqid.set(name, reqid)
 
-        for item in items:
+        rows = [(abrv + s_common.int64en(offs + i), s_msgpack.en(item)) for (i, item) in enumerate(items)]
+        if rows:
 
-            self.slab.put(abrv + s_common.int64en(offs), s_msgpack.en(item), db=self.qdata)
+            self.slab.putmulti(rows, db=self.qdata)
 
-            self.sizes.inc(name, 1)
-            offs = self.offsets.inc(name, 1)
+            self.sizes.inc(name, len(rows))
+            self.offsets.inc(name, len(rows))
 
         # wake the sleepers
         evnt = self.waiters.get(name)
@@ -437,9 +567,17 @@ class MultiQueue(s_base.Base):
 
         abrv = self.abrv.nameToAbrv(name)
 
-        for lkey, _ in self.slab.scanByRange(abrv + int64min, abrv + indx, db=self.qdata):
-            self.slab.delete(lkey, db=self.qdata)
-            self.sizes.set(name, self.sizes.get(name) - 1)
+        while True:
+
+            count = self.slab.delByRange(abrv + int64min, abrv + indx, limit=CULL_CHUNKSIZE, db=self.qdata)
+            if not count:
+                return
+
+            self.sizes.inc(name, -count)
+
+            if count < CULL_CHUNKSIZE:
+                return
+
             await asyncio.sleep(0)
 
 class GuidStor:
@@ -604,6 +742,8 @@ class Slab(s_base.Base):
         opts.setdefault('max_dbs', 128)
         opts.setdefault('writemap', True)
 
+        self.maxdbs = opts.get('max_dbs')
+
         self.maxsize = opts.pop('maxsize', None)
         self.growsize = opts.pop('growsize', self.DEFAULT_GROWSIZE)
 
@@ -621,6 +761,8 @@ class Slab(s_base.Base):
         _AllSlabs.add(abspath)
 
         self.scans = set()
+        self.scansync = None
+        self.readgate = ReadGate()
 
         self.dirty = False
         if self.readonly:
@@ -741,7 +883,9 @@ class Slab(s_base.Base):
                 continue
             break
 
-        self.lenv.close()
+        with self.readgate.exclusive():
+            self.lenv.close()
+
         _AllSlabs.discard(self.abspath)
         del self.lenv
 
@@ -786,7 +930,9 @@ class Slab(s_base.Base):
 
         logger.warning('lmdbslab %s growing map size to: %d MiB', self.path, mapsize // s_const.mebibyte)
 
-        self.lenv.set_mapsize(mapsize)
+        with self.readgate.exclusive():
+            self.lenv.set_mapsize(mapsize)
+
         self.mapsize = mapsize
 
         self.resizeevent.set()
@@ -976,6 +1122,16 @@ class Slab(s_base.Base):
         with self.xact.cursor(db=realdb) as curs:
             return curs.set_key_dup(lkey, lval)
 
+    def countdups(self, lkey, db=None):
+        '''
+        Return the number of values for the given key in a dupsort db.
+        '''
+        realdb, dupsort = self.dbnames[db]
+        with self.xact.cursor(db=realdb) as curs:
+            if not curs.set_key(lkey):
+                return 0
+            return curs.count()
+
     def prefexists(self, byts, db=None):
         '''
         Returns True if a prefix exists in the db.
@@ -1063,6 +1219,188 @@ class Slab(s_base.Base):
 
                 yield lkey, lval
 
+    def scanByPrefs(self, prefs, db=None):
+        '''
+        Scan the rows for several prefixes using a single cursor.
+
+        Args:
+            prefs (list): A list of prefix bytes in sorted order.
+
+        Yields:
+            ((bytes, bytes, bytes)): A (pref, lkey, lval) tuple for each row.
+        '''
+        with Scan(self, db) as scan:
+
+            for byts in prefs:
+
+                if scan.bumped:
+                    scan.bumped = False
+                    scan.curs = self.xact.cursor(db=scan.db)
+
+                if not scan.set_range(byts):
+                    return
+
+                size = len(byts)
+                for lkey, lval in scan.iternext():
+
+                    if lkey[:size] != byts:
+                        break
+
+                    yield byts, lkey, lval
+
+    def scanByKeys(self, lkeys, db=None):
+        '''
+        Scan the rows (including dups) for several keys using a single cursor.
+
+        Args:
+            lkeys (list): A list of key bytes in sorted order.
+
+        Yields:
+            ((bytes, bytes)): A (lkey, lval) tuple for each row.
+        '''
+        with Scan(self, db) as scan:
+
+            for byts in lkeys:
+
+                if scan.bumped:
+                    scan.bumped = False
+                    scan.curs = self.xact.cursor(db=scan.db)
+
+                if not scan.set_range(byts):
+                    return
+
+                for lkey, lval in scan.iternext():
+
+                    if lkey != byts:
+                        break
+
+                    yield lkey, lval
+
+    async def scanByPrefThread(self, byts, db=None):
+        '''
+        Like scanByPref(), but rows are read in a thread pool using
+        read-only transactions and yielded to the ioloop in chunks.
+
+        Notes:
+            Pending writes are only visible to the write transaction, so
+            they are committed before the first chunk is read.  Those
+            commits are made at most once per SCAN_SYNC_PERIOD, and a scan
+            of a dirty slab within that period reads the write transaction
+            on the ioloop instead.
+
+            Each chunk of rows is read in a new read-only transaction, so
+            the scan is not a consistent snapshot.  Rows written during the
+            scan may or may not be yielded.
+        '''
+        async for item in self._scanThread(byts, pref=byts, db=db):
+            yield item
+
+    async def scanByRangeThread(self, lmin, lmax=None, db=None):
+        '''
+        Like scanByRange(), but rows are read in a thread pool using
+        read-only transactions and yielded to the ioloop in chunks.
+
+        Notes:
+            See scanByPrefThread() for how pending writes are read.
+        '''
+        async for item in self._scanThread(lmin, lmax=lmax, db=db):
+            yield item
+
+    async def _scanThread(self, lmin, lmax=None, pref=None, db=None):
+
+        if self.dirty:
+
+            tick = time.monotonic()
+            if self.scansync is not None and tick - self.scansync < SCAN_SYNC_PERIOD:
+
+                if pref is not None:
+                    genr = self.scanByPref(pref, db=db)
+                else:
+                    genr = self.scanByRange(lmin, lmax=lmax, db=db)
+
+                for i, row in enumerate(genr):
+
+                    if i and i % SCAN_CHUNKSIZE == 0:
+                        await asyncio.sleep(0)
+
+                    yield row
+
+                return
+
+            # commit so the pending writes are visible to the read-only transactions
+            self.scansync = tick
+            await self.sync()
+
+        realdb, dupsort = self.dbnames[db]
+
+        last = None
+        while True:
+
+            rows = await s_coro.executor(self._scanChunk, realdb, dupsort, lmin, lmax, pref, last)
+
+            for row in rows:
+                yield row
+
+            if len(rows) < SCAN_CHUNKSIZE:
+                return
+
+            last = rows[-1]
+
+    def _scanChunk(self, realdb, dupsort, lmin, lmax, pref, last):
+        '''
+        Read up to SCAN_CHUNKSIZE rows after the last row in a read-only transaction.
+        '''
+        rows = []
+
+        with self.readgate.reading():
+
+            if self.isfini:
+                raise s_exc.IsFini()
+
+            with self.lenv.begin(db=realdb) as xact:
+
+                curs = xact.cursor(db=realdb)
+
+                if last is None:
+                    ok = curs.set_range(lmin)
+
+                elif dupsort:
+                    ok = curs.set_range_dup(*last)
+                    if not ok:
+                        ok = curs.set_range(last[0])
+                        if ok and curs.key() == last[0]:
+                            ok = curs.next_nodup()
+
+                else:
+                    ok = curs.set_range(last[0])
+
+                if ok and last is not None and curs.item() == last:
+                    ok = curs.next()
+
+                size = None
+                if pref is not None:
+                    size = len(pref)
+                elif lmax is not None:
+                    size = len(lmax)
+
+                while ok:
+
+                    lkey, lval = curs.item()
+
+                    if pref is not None and lkey[:size] != pref:
+                        break
+
+                    if lmax is not None and lkey[:size] > lmax:
+                        break
+
+                    rows.append((lkey, lval))
+                    if len(rows) >= SCAN_CHUNKSIZE:
+                        break
+
+                    ok = curs.next()
+
+        return rows
+
     def scanByPrefBack(self, byts, db=None):
 
         with ScanBack(self, db) as scan:
@@ -1103,6 +1441,51 @@ class Slab(s_base.Base):
 
                 yield lkey, lval
 
+    def delByRange(self, lmin, lmax, limit=None, db=None):
+        '''
+        Delete the keys from lmin through lmax ( inclusive ) in a single operation.
+
+        Args:
+            lmin (bytes): The first key to delete.
+            lmax (bytes): The last key to delete.
+            limit (int): The maximum number of keys to delete.
+
+        Returns:
+            int: The number of keys deleted.
+        '''
+        if self.readonly:
+            raise s_exc.IsReadOnly()
+
+        realdb, dupsort = self.dbnames[db]
+
+        try:
+            self.dirty = True
+
+            if not self.recovering:
+                self._logXactOper(self.delByRange, lmin, lmax, limit=limit, db=db)
+
+            count = 0
+
+            with self.xact.cursor(db=realdb) as curs:
+
+                if not curs.set_range(lmin):
+                    return 0
+
+                while limit is None or count < limit:
+
+                    lkey = curs.key()
+                    if not lkey or lkey > lmax:
+                        break
+
+                    # the cursor moves to the next key after a delete
+                    curs.delete(dupdata=dupsort)
+                    count += 1
+
+            return count
+
+        except lmdb.MapFullError:
+            return self._handle_mapfull()
+
     def scanByRangeBack(self, lmax, lmin=None, db=None):
 
         with ScanBack(self, db) as scan:
@@ -1299,6 +1682,140 @@ class Slab(s_base.Base):
         self._initCoXact()
         return True
 
+def _copySnapXact(lenv, xact, dstpath, mapsize, maxdbs):
+
+    dstenv = lmdb.open(dstpath, map_size=mapsize, max_dbs=maxdbs, lock=False)
+
+    try:
+
+        # the main db holds a record for each named db as well as the rows of the default db
+        for name, valu in xact.cursor().iternext():
+
+            try:
+                realdb = lenv.open_db(name, txn=xact, create=False)
+
+            except lmdb.IncompatibleError:
+                with dstenv.begin(write=True) as destxact:
+                    destxact.put(name, valu)
+                continue
+
+            flags = realdb.flags(xact)
+            destdb = dstenv.open_db(name, **flags)
+
+            genr = (row for row in xact.cursor(db=realdb).iternext())
+            for rows in s_common.chunks(genr, SNAP_CHUNKSIZE):
+                with dstenv.begin(write=True, db=destdb) as destxact:
+                    destxact.cursor().putmulti(rows, dupdata=flags.get('dupsort'), append=True)
+
+    finally:
+        dstenv.close()
+
+def snapcopy(todo, done):
+    '''
+    Multiprocessing target which copies the slabs of a SnapCopy.
+    '''
+    lenvs = []
+
+    try:
+
+        xacts = []
+        for srcpath, mapsize, maxdbs, dstpath in todo.get():
+
+            lenv = lmdb.open(srcpath, map_size=mapsize, max_dbs=maxdbs, readonly=True)
+            lenvs.append(lenv)
+
+            xacts.append((lenv, lenv.begin(), dstpath, mapsize, maxdbs))
+
+        done.put(None)
+
+        for lenv, xact, dstpath, mapsize, maxdbs in xacts:
+            s_common.gendir(dstpath)
+            _copySnapXact(lenv, xact, dstpath, mapsize, maxdbs)
+            xact.abort()
+
+        done.put(None)
+
+    except Exception as e:
+        done.put(e)
+
+    finally:
+        [lenv.close() for lenv in lenvs]
+
+class SnapCopy(s_base.Base):
+    '''
+    Copy the committed contents of slabs from read transactions which are all opened at the same time.
+
+    Notes:
+        The read transactions are held by a separate process with its own lmdb environments, so the copy never
+        holds a slab ReadGate and a map resize (or fini) of a live slab is not blocked while it runs.
+    '''
+    async def __anit__(self):
+
+        await s_base.Base.__anit__(self)
+
+        self.slabs = []
+
+        mpctx = multiprocessing.get_context('spawn')
+
+        self.todo = mpctx.Queue()
+        self.done = mpctx.Queue()
+        self.proc = mpctx.Process(target=snapcopy, args=(self.todo, self.done))
+
+        # avoid blocking the ioloop during process construction
+        await s_coro.executor(self.proc.start)
+
+        async def fini():
+            if self.proc.is_alive():
+                self.proc.terminate()
+            await s_coro.executor(self.proc.join)
+
+        self.onfini(fini)
+
+    def add(self, slab, dstpath):
+        '''
+        Add a slab to copy to the given lmdb directory.
+
+        Notes:
+            Only the changes committed before begin() is called are copied.
+        '''
+        self.slabs.append((slab.abspath, slab.mapsize, slab.maxdbs, dstpath))
+
+    async def begin(self):
+        '''
+        Open a read transaction on each added slab and start copying them.
+        '''
+        self.todo.put(self.slabs)
+        await self._waitDone()
+
+    async def wait(self):
+        '''
+        Wait for every slab to be copied.
+        '''
+        await self._waitDone()
+
+    async def _waitDone(self):
+        retn = await s_coro.executor(self._getDone)
+        if isinstance(retn, Exception):
+            raise retn
+
+    def _getDone(self):
+
+        while True:
+
+            try:
+                return self.done.get(timeout=SNAP_POLL_TIMEOUT)
+
+            except queue.Empty:
+
+                if self.proc.is_alive():
+                    continue
+
+                # the process may have exited right after its last put
+                try:
+                    return self.done.get(timeout=SNAP_POLL_TIMEOUT)
+                except queue.Empty:
+                    raise s_exc.SpawnExit(code=self.proc.exitcode) from None
+
 class Scan:
     '''
     A state-object used by Slab.  Not to be instantiated directly.
@@ -89,6 +89,21 @@ def iterfd(fd):
     for mesg in unpk:
         yield mesg
 
+def iterbyts(byts):
+    '''
+    Generator which unpacks a buffer of concatenated msgpacked objects.
+
+    Args:
+        byts (bytes): The bytes to unpack.
+
+    Yields:
+        Objects from the msgpack buffer.
+    '''
+    unpk = msgpack.Unpacker(**unpacker_kwargs)
+    unpk.feed(byts)
+    for mesg in unpk:
+        yield mesg
+
 def iterfile(path, since=-1):
     '''
     Generator which yields msgpack objects from a file path.
@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import functools
+import itertools
 import contextlib
 
-from typing import List, Dict, Any, Callable, Tuple, Optional, AsyncIterator
+from typing import List, Dict, Any, Callable, Tuple, Optional, AsyncIterator, Set
 
 import synapse.exc as s_exc
 import synapse.common as s_common
@@ -17,18 +18,31 @@ logger = logging.getLogger(__name__)
 # As a mirror follower, amount of time before giving up on a write request
 FOLLOWER_WRITE_WAIT_S = 30.0
 
+# As a mirror follower, number of applied changes between acknowledgements to the leader
+FOLLOWER_ACK_PERIOD = 1000
+
+# As a mirror follower, max number of changes applied (and recorded) together
+FOLLOWER_WINDOW_SIZE = 1000
+
+# As a mirror follower, max number of windows of changes buffered from the leader
+FOLLOWER_WINDOW_BUFFER = 4
+
 NexusLogEntryT = Tuple[str, str, List[Any], Dict[str, Any], Dict] # (nexsiden, event, args, kwargs, meta)
 
 
 class RegMethType(type):
     '''
     Metaclass that collects all methods in class with _regme prop into a class member called _regclstupls
+    (and methods with a _regbatch prop into _regclsbatch)
     '''
     def __init__(cls, name: str, bases: List[type], attrs: Dict[str, Any]):
         # Start with my parents' definitions
         cls._regclstupls: List[Tuple[str, Callable, bool]] = \
             sum((getattr(scls, '_regclstupls', []) for scls in bases), [])
 
+        cls._regclsbatch: List[Tuple[str, Callable]] = \
+            sum((getattr(scls, '_regclsbatch', []) for scls in bases), [])
+
         # Add my own definitions
         for meth in attrs.values():
 
@@ -36,6 +50,54 @@ class RegMethType(type):
             if prop is not None:
                 cls._regclstupls.append(prop)
 
+            prop = getattr(meth, '_regbatch', None)
+            if prop is not None:
+                cls._regclsbatch.append(prop)
+
+class ApplyGate:
+    '''
+    Allows any number of tasks to apply changes while blocking new changes during operations which require every
+    change to be fully applied (such as starting a snapshot).
+    '''
+    def __init__(self):
+        self.appliers = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.opened = asyncio.Event()
+        self.opened.set()
+        self.exlock = asyncio.Lock()
+
+    @contextlib.asynccontextmanager
+    async def applying(self):
+
+        while not self.opened.is_set():
+            await self.opened.wait()
+
+        self.appliers += 1
+        self.idle.clear()
+
+        try:
+            yield
+
+        finally:
+            self.appliers -= 1
+            if not self.appliers:
+                self.idle.set()
+
+    @contextlib.asynccontextmanager
+    async def exclusive(self):
+
+        async with self.exlock:
+
+            self.opened.clear()
+
+            try:
+                await self.idle.wait()
+                yield
+
+            finally:
+                self.opened.set()
+
 class ChangeDist(s_base.Base):
     '''
     A utility class to distribute new change entries to mirrors/followers
@@ -72,6 +134,28 @@ class ChangeDist(s_base.Base):
         self.event.set()
         return True
 
+async def initSnapLog(dirn: str, offs: int) -> None:
+    '''
+    Prepare the nexus log in a snapshot copy of a cell directory to be followed from the given offset.
+    '''
+    import synapse.lib.lmdbslab as s_lmdbslab  # avoid import cycle
+    import synapse.lib.slabseqn as s_slabseqn  # avoid import cycle
+
+    path = s_common.genpath(dirn, 'slabs', 'nexus.lmdb')
+
+    async with await s_lmdbslab.Slab.anit(path, map_async=False) as slab:
+
+        # changes from offs onward will be replayed from the leader
+        s_slabseqn.SlabSeqn(slab, 'nexuslog').trim(offs)
+
+        # mirror acknowledgements and identity belong to the source cell
+        slab.dropdb('nexsacks')
+        slab.dropdb('nexsmeta')
+
+        # every change before offs is in the snapshot, so recover() has nothing to replay
+        nexsmeta = s_lmdbslab.SlabDict(slab, db=slab.initdb('nexsmeta'))
+        nexsmeta.set('applied', offs)
+
 class NexsRoot(s_base.Base):
 
     async def __anit__(self, dirn: str, donexslog: bool = True):  # type: ignore
@@ -98,11 +182,21 @@ class NexsRoot(s_base.Base):
         # Used to match pending follower write requests with the responses arriving on the log
         self._futures: Dict[str, asyncio.Future] = {}
 
+        # Log offsets which have been recorded but not yet fully applied
+        self._applying: Set[int] = set()
+
+        # Entered while changes are recorded and applied, so a consistent snapshot may be taken
+        self.applygate = ApplyGate()
+
         if self.donexslog:
             path = s_common.genpath(self.dirn, 'slabs', 'nexus.lmdb')
             self._nexusslab = await s_lmdbslab.Slab.anit(path, map_async=False)
             self._nexuslog = s_slabseqn.SlabSeqn(self._nexusslab, 'nexuslog')
 
+            # mirror iden -> the log offset up to which the mirror has applied changes
+            self._nexsacks = s_lmdbslab.SlabDict(self._nexusslab, db=self._nexusslab.initdb('nexsacks'))
+            self._nexsmeta = s_lmdbslab.SlabDict(self._nexusslab, db=self._nexusslab.initdb('nexsmeta'))
+
         async def fini():
             if self._looptask:
                 self._looptask.cancel()
@@ -141,31 +235,43 @@ class NexsRoot(s_base.Base):
 
     async def recover(self) -> None:
         '''
-        Replays the last entry in the nexus log in case we crashed between writing the log and applying it.
+        Replays the log entries which may have been recorded but not applied in case we crashed between writing
+        the log and applying it.
 
         Notes:
             This must be called at cell startup after subsystems are initialized but before any write transactions
             might happen.
 
-            The log can only have recorded 1 entry ahead of what is applied.  All log actions are idempotent, so
-            replaying the last action that (might have) already happened is harmless.
+            A leader can only have recorded 1 entry ahead of what is applied, so only the last entry is replayed.
+            A mirror records a window of entries from the leader before applying them, so every entry from the
+            start of the last window which was not fully applied is replayed.
         '''
         if not self.donexslog:
             return
 
-        indxitem: Optional[Tuple[int, NexusLogEntryT]] = self._nexuslog.last()
-        if indxitem is None:
-            # We have a brand new log
-            return
+        offs = self._nexsmeta.get('applied')
+        if offs is None:
 
-        try:
-            await self._apply(*indxitem)
+            indxitem: Optional[Tuple[int, NexusLogEntryT]] = self._nexuslog.last()
+            if indxitem is None:
+                # We have a brand new log
+                return
 
-        except asyncio.CancelledError:  # pragma: no cover
-            raise
+            offs = indxitem[0]
 
-        except Exception:
-            logger.exception('Exception while replaying log')
+        for indxitem in self._nexuslog.iter(offs):
+
+            try:
+                await self._apply(*indxitem)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+
+            except Exception:
+                logger.exception('Exception while replaying log')
+
+        if self._nexsmeta.get('applied') is not None:
+            self._nexsmeta.set('applied', self._nexuslog.index())
 
     async def issue(self, nexsiden: str, event: str, args: List[Any], kwargs: Dict[str, Any],
                     meta: Optional[Dict] = None) -> Any:
@@ -200,16 +306,26 @@ class NexsRoot(s_base.Base):
 
         item: NexusLogEntryT = (nexsiden, event, args, kwargs, meta)
 
-        if self.donexslog:
-            indx = self._nexuslog.add(item)
-        else:
-            indx = None
+        async with self.applygate.applying():
+
+            if self.donexslog:
+
+                # a former mirror recovers the last entry like any other leader
+                if self._nexsmeta.get('applied') is not None:
+                    self._nexsmeta.pop('applied')
 
-        [dist.update() for dist in tuple(self._mirrors)]
+                indx = self._nexuslog.add(item)
+                self._applying.add(indx)
+            else:
+                indx = None
 
-        retn = await self._apply(indx, item)
+            [dist.update() for dist in tuple(self._mirrors)]
 
-        return retn
+            try:
+                return await self._apply(indx, item)
+
+            finally:
+                self._applying.discard(indx)
 
     async def _apply(self, indx: Optional[int], item: NexusLogEntryT):
         nexsiden, event, args, kwargs, _ = item
@@ -221,6 +337,73 @@ class NexsRoot(s_base.Base):
 
         return await func(nexus, *args, **kwargs)
 
+    def getSnapOffs(self) -> Optional[int]:
+        '''
+        Return the log offset below which every change has been fully applied.
+
+        Notes:
+            While the applygate is held exclusively, no changes are being applied, so a copy of the cell state committed and
+            read before the lock is released contains exactly the changes before this offset.
+        '''
+        if not self.donexslog:
+            return None
+
+        offs = min(self._applying, default=self._nexuslog.index())
+        return min(offs, self._nexsmeta.get('applied', offs))
+
+    def getMirrorIden(self) -> str:
+        '''
+        Return the persistent iden this nexus uses to acknowledge changes when following a leader.
+        '''
+        iden = self._nexsmeta.get('mirror')
+        if iden is None:
+            iden = s_common.guid()
+            self._nexsmeta.set('mirror', iden)
+        return iden
+
+    def setMirrorAck(self, mirror: str, offs: int) -> None:
+        '''
+        Record that a mirror has applied every change before the given log offset.
+        '''
+        self._nexsacks.set(mirror, offs)
+
+    def delMirrorAck(self, mirror: str) -> None:
+        '''
+        Stop retaining log entries on behalf of a mirror which has been decommissioned.
+        '''
+        self._nexsacks.pop(mirror)
+
+    def getMirrorAcks(self) -> Dict[str, int]:
+        return dict(self._nexsacks.items())
+
+    async def cull(self, offs: int) -> int:
+        '''
+        Remove log entries up to (and including) offs which are no longer needed.
+
+        Notes:
+            Entries which any known mirror has not acknowledged, entries which may not yet be fully applied, and
+            the last entry in the log (for use by recover()) are always retained.
+
+        Returns:
+            The offset up to which entries were removed or -1 if no entries were removed.
+        '''
+        if not self.donexslog:
+            return -1
+
+        offs = min(offs, self.getSnapOffs() - 2)
+
+        acks = self.getMirrorAcks()
+        if acks:
+            offs = min(offs, min(acks.values()) - 1)
+
+        if offs < 0:
+            return -1
+
+        if not await self._nexuslog.cull(offs):
+            return -1
+
+        return offs
+
     async def iter(self, offs: int) -> AsyncIterator[Any]:
         '''
         Returns an iterator of change entries in the log
@@ -231,6 +414,11 @@ class NexsRoot(s_base.Base):
         if self.isfini:
             raise s_exc.IsFini()
 
+        first = self._nexuslog.first()
+        if first is not None and offs < first[0]:
+            mesg = f'Nexus log entries before {first[0]} have been culled.  Bootstrap from a snapshot.'
+            raise s_exc.BadArg(mesg=mesg, offs=offs, first=first[0])
+
         maxoffs = offs
 
         for item in self._nexuslog.iter(offs):
@@ -327,51 +515,193 @@ class NexsRoot(s_base.Base):
 
                 logger.info(f'mirror loop ready ({self._ldrurl})')
 
+                mirriden = self.getMirrorIden()
+
                 while not proxy.isfini:
 
                     offs = self._nexuslog.index()
+                    doack = await self._setLeaderAck(proxy, mirriden, offs)
 
                     genr = proxy.getNexusChanges(offs)
-                    async for item in genr:
+                    async for window in self._iterFollowWindows(genr):
 
                         if proxy.isfini:
                             break
 
-                        offs, args = item
-                        if offs != self._nexuslog.index():  # pragma: nocover
+                        if window[0][0] != self._nexuslog.index():  # pragma: nocover
                             logger.error('mirror desync')
                             await self.fini()
                             return
 
-                        meta = args[-1]
-                        respiden = meta.get('resp')
-                        respfutu = self._futures.get(respiden)
+                        await self._eatWindow(window)
+
+                        nextoffs = self._nexuslog.index()
+                        if doack and nextoffs // FOLLOWER_ACK_PERIOD != offs // FOLLOWER_ACK_PERIOD:
+                            doack = await self._setLeaderAck(proxy, mirriden, nextoffs)
+
+                        offs = nextoffs
+
+            except asyncio.CancelledError: # pragma: no cover
+                return
+
+            except Exception:
+                logger.exception('error in initCoreMirror loop')
+
+            self._ldrready.clear()
+            await self.waitfini(1)
+
+    async def _setLeaderAck(self, proxy, mirriden, offs):
+        '''
+        Tell the leader the offset this mirror has applied the nexus log up to.
+
+        Returns:
+            (bool): False if the leader is too old to accept mirror acks.
+        '''
+        try:
+            await proxy.setNexusAck(mirriden, offs)
+            return True
+
+        except s_exc.NoSuchMeth:
+            logger.warning(f'leader does not support mirror acks ({self._ldrurl})')
+            return False
+
+    async def _iterFollowWindows(self, genr):
+        '''
+        Yield lists of up to FOLLOWER_WINDOW_SIZE (offs, item) entries which have already arrived from the leader.
+
+        Notes:
+            At most FOLLOWER_WINDOW_BUFFER windows of entries are read ahead of the entries being applied.
+        '''
+        queue = asyncio.Queue(maxsize=FOLLOWER_WINDOW_SIZE * FOLLOWER_WINDOW_BUFFER)
+
+        errs = []
+
+        async def pump():
+            try:
+                async for item in genr:
+                    await queue.put(item)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                errs.append(e)
+
+            await queue.put(None)
+
+        task = self.schedCoro(pump())
+
+        try:
+
+            done = False
+            while not done:
+
+                window = [await queue.get()]
+                while len(window) < FOLLOWER_WINDOW_SIZE and not queue.empty():
+                    window.append(queue.get_nowait())
+
+                # the pump puts None after the last entry
+                if window[-1] is None:
+                    window.pop()
+                    done = True
+
+                if window:
+                    yield window
+
+            if errs:
+                raise errs[0]
+
+        finally:
+
+            task.cancel()
+
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _eatWindow(self, window):
+        '''
+        Record a window of (offs, item) entries from the leader and then apply them.
+
+        Notes:
+            The offset of the first entry in the window is saved with the entries, so recover() replays the whole
+            window if we crash before it is fully applied.  Consecutive "edits" entries for the same nexus are
+            applied with a single call to its batch handler.  Node edits are the only changes which are safe to
+            re-apply one at a time if the batch fails part way through.  Every other entry is applied on its own.
+        '''
+        async with self.applygate.applying():
+
+            offs = self._nexuslog.index()
+
+            self._nexuslog.save([item for _, item in window])
+            self._nexsmeta.set('applied', offs)
+
+            self._applying.add(offs)
+
+            [dist.update() for dist in tuple(self._mirrors)]
+
+            try:
+
+                for (nexsiden, event), group in itertools.groupby(window, key=lambda x: tuple(x[1][:2])):
+
+                    group = list(group)
+
+                    nexus = self._nexskids.get(nexsiden)
+                    batch = None
+                    if nexus is not None and event == 'edits' and len(group) > 1:
+                        batch = nexus._nexsbatch.get(event)
+
+                    if batch is not None:
 
                         try:
-                            retn = await self.eat(*args)
+                            retns = await batch(nexus, [(item[2], item[3]) for _, item in group])
+
+                        except asyncio.CancelledError:  # pragma: no cover
+                            raise
+
+                        except Exception:
+                            # fall back to applying each entry to capture individual errors
+                            logger.exception(f'Batch handler failed for {event} on {nexsiden}')
+
+                        else:
+                            [self._setResponse(item, retn=retn) for (_, item), retn in zip(group, retns)]
+                            continue
+
+                    for indx, item in group:
+
+                        try:
+                            retn = await self._apply(indx, item)
 
                         except asyncio.CancelledError:
                             raise
 
                         except Exception as e:
-                            if respfutu is not None:
-                                assert not respfutu.done()
-                                respfutu.set_exception(e)
-                            else:
-                                logger.exception(e)
+                            self._setResponse(item, exc=e)
 
                         else:
-                            if respfutu is not None:
-                                respfutu.set_result(retn)
+                            self._setResponse(item, retn=retn)
 
-            except asyncio.CancelledError: # pragma: no cover
-                return
+                self._nexsmeta.set('applied', self._nexuslog.index())
 
-            except Exception:
-                logger.exception('error in initCoreMirror loop')
+            finally:
+                self._applying.discard(offs)
 
-            self._ldrready.clear()
-            await self.waitfini(1)
+    def _setResponse(self, item, retn=None, exc=None):
+
+        respfutu = self._futures.get(item[4].get('resp'))
+        if respfutu is None:
+            if exc is not None:
+                logger.error('Error applying nexus change', exc_info=exc)
+            return
+
+        assert not respfutu.done()
+
+        if exc is not None:
+            respfutu.set_exception(exc)
+            return
+
+        respfutu.set_result(retn)
 
 class Pusher(s_base.Base, metaclass=RegMethType):
     '''
@@ -383,6 +713,7 @@ class Pusher(s_base.Base, metaclass=RegMethType):
 
         await s_base.Base.__anit__(self)
         self._nexshands: Dict[str, Tuple[Callable, bool]] = {}
+        self._nexsbatch: Dict[str, Callable] = {}
 
         self.nexsiden = iden
         self.nexsroot = None
@@ -393,6 +724,9 @@ class Pusher(s_base.Base, metaclass=RegMethType):
         for event, func, passoff in self._regclstupls:  # type: ignore
             self._nexshands[event] = func, passoff
 
+        for event, func in self._regclsbatch:  # type: ignore
+            self._nexsbatch[event] = func
+
     def setNexsRoot(self, nexsroot):
 
         nexsroot._nexskids[self.nexsiden] = self
@@ -440,6 +774,22 @@ class Pusher(s_base.Base, metaclass=RegMethType):
 
         return decorator
 
+    @classmethod
+    def onPushBatch(cls, event: str) -> Callable:
+        '''
+        Decorator that registers a method to apply consecutive log entries for a named event with a single call
+
+        Notes:
+            The method is passed a list of (args, kwargs) tuples and must return a list of results in the same order.
+            It is only used for "edits" entries by mirrors catching up with a leader, and it must be safe to re-apply
+            the entries one at a time if it raises an exception.  Events which use passoff are not supported.
+        '''
+        def decorator(func):
+            func._regbatch = (event, func)
+            return func
+
+        return decorator
+
     async def _push(self, event: str, *args: Any, **kwargs: Any) -> Any:
         '''
         Execute the change handler for the mesg
@@ -117,23 +117,35 @@ class Node:
     def iden(self):
         return s_common.ehex(self.buid)
 
-    def pack(self, dorepr=False):
+    def pack(self, dorepr=False, props=None, tags=None):
         '''
         Return the serializable/packed version of the node.
 
         Args:
             dorepr (bool): Include repr information for human readable versions of properties.
+            props (set): Only include the secondary or universal props with these relative names.
+            tags (tuple): Only include the tags (and their tag props) within these tag trees.
 
         Returns:
             (tuple): An (ndef, info) node tuple.
         '''
+        nodeprops = self.props
+        if props is not None:
+            nodeprops = {name: valu for name, valu in self.props.items() if name in props}
+
+        nodetags = self.tags
+        nodetagprops = self.tagprops
+        if tags is not None:
+            nodetags = {tag: valu for tag, valu in self.tags.items() if _inTagTrees(tag, tags)}
+            nodetagprops = {key: valu for key, valu in self.tagprops.items() if key[0] in nodetags}
+
         tagprops = collections.defaultdict(dict)
-        [tagprops[tag].__setitem__(prop, valu) for (tag, prop), valu in self.tagprops.items()]
+        [tagprops[tag].__setitem__(prop, valu) for (tag, prop), valu in nodetagprops.items()]
 
         node = (self.ndef, {
             'iden': self.iden(),
-            'tags': self.tags,
-            'props': self.props,
+            'tags': nodetags,
+            'props': nodeprops,
             'tagprops': tagprops,
             'nodedata': self.nodedata,
         })
@@ -144,8 +156,8 @@ class Node:
             if rval is not None and rval != self.ndef[1]:
                 node[1]['repr'] = self.repr()
 
-            node[1]['reprs'] = self.reprs()
-            node[1]['tagpropreprs'] = self.tagpropreprs()
+            node[1]['reprs'] = self._getPropReprs(nodeprops)
+            node[1]['tagpropreprs'] = self._getTagPropReprs(nodetagprops)
 
         return node
 
@@ -333,9 +345,13 @@ class Node:
         Return a dictionary of repr values for props whose repr is different than
         the system mode value.
         '''
+        return self._getPropReprs(self.props)
+
+    def _getPropReprs(self, props):
+
         reps = {}
 
-        for name, valu in self.props.items():
+        for name, valu in props.items():
 
             prop = self.form.prop(name)
             if prop is None:
@@ -354,9 +370,13 @@ class Node:
         Return a dictionary of repr values for tagprops whose repr is different than
         the system mode value.
         '''
+        return self._getTagPropReprs(self.tagprops)
+
+    def _getTagPropReprs(self, tagprops):
+
         reps = collections.defaultdict(dict)
 
-        for (tag, name), valu in self.tagprops.items():
+        for (tag, name), valu in tagprops.items():
 
             prop = self.form.modl.tagprop(name)
             if prop is None:
@@ -413,51 +433,10 @@ class Node:
             raise s_exc.IsRuntForm(mesg='Cannot add tags to runt nodes.',
                                    form=self.form.full, tag=tag)
 
-        path = s_chop.tagpath(tag)
-
-        name = '.'.join(path)
-
-        tagnode = await self.snap.addTagNode(name)
-
-        # implement tag renames...
-        isnow = tagnode.get('isnow')
-        if isnow:
-            await self.snap.warn(f'tag {name} is now {isnow}')
-            name = isnow
-            path = isnow.split('.')
-
-        if isinstance(valu, list):
-            valu = tuple(valu)
-
-        if valu != (None, None):
-            valu = self.snap.core.model.type('ival').norm(valu)[0]
-
-        curv = self.tags.get(name)
-        if curv == valu:
+        edits = await self.snap.getTagSetEdits(dict(self.tags), tag, valu=valu)
+        if not edits:
             return
 
-        edits = []
-        if curv is None:
-
-            tags = s_chop.tags(name)
-            for tag in tags[:-1]:
-
-                if self.tags.get(tag) is not None:
-                    continue
-
-                await self.snap.addTagNode(tag)
-
-                edits.append((s_layer.EDIT_TAG_SET, (tag, (None, None), None), ()))
-
-        else:
-            # merge values into one interval
-            valu = s_time.ival(*valu, *curv)
-
-        if valu == curv:
-            return
-
-        edits.append((s_layer.EDIT_TAG_SET, (name, valu, None), ()))
-
         nodeedit = (self.buid, self.form.name, edits)
 
         await self.snap.applyNodeEdit(nodeedit)
@@ -807,6 +786,42 @@ class Trace:
         self.nodes.add(path.node)
         self.edges.add((path.nodes[-2], path.nodes[-1]))
 
+def _inTagTrees(tag, trees):
+    for tree in trees:
+        if tag == tree or tag.startswith(tree + '.'):
+            return True
+    return False
+
+def getPackFields(fields):
+    '''
+    Parse a list of storm "fields" opt values into the props and tags arguments for Node.pack().
+
+    Args:
+        fields (list): A list of relative prop (":asn"), universal prop (".seen") or tag ("#foo.bar") names.
+
+    Returns:
+        (tuple): A (props, tags) tuple of a set of prop names and a tuple of tag names.
+    '''
+    props = set()
+    tags = []
+
+    for name in fields:
+
+        if not isinstance(name, str):
+            mesg = f'Storm fields must be strings: {name!r}'
+            raise s_exc.BadArg(mesg=mesg, name=name)
+
+        if name.startswith('#'):
+            tags.append(s_chop.tag(name[1:]))
+            continue
+
+        if name.startswith(':'):
+            name = name[1:]
+
+        props.add(name)
+
+    return props, tuple(tags)
+
 def props(pode):
     '''
     Get the props from the node.
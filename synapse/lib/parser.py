@@ -1,4 +1,5 @@
 import ast
+import hashlib
 import lark  # type: ignore
 import regex  # type: ignore
 
@@ -311,6 +312,9 @@ class AstConverter(lark.Transformer):
 with s_datfile.openDatFile('synapse.lib/storm.lark') as larkf:
     _grammar = larkf.read().decode()
 
+# persisted parse results are only valid for the grammar which produced them
+grammarhash = hashlib.sha256(_grammar.encode()).hexdigest()
+
 QueryParser = lark.Lark(_grammar, start='query', propagate_positions=True)
 StormCmdParser = lark.Lark(_grammar, start='stormcmdargs', propagate_positions=True)
 CmdrParser = lark.Lark(_grammar, start='cmdrargs', propagate_positions=True)
@@ -145,6 +145,30 @@ class SlabSeqn:
 
         return retn
 
+    async def cull(self, offs):
+        '''
+        Remove entries up to (and including) the given offset.
+
+        Note:
+            This does not change the next insert offset unless every entry is removed.
+        '''
+        retn = False
+
+        for lkey, _ in self.slab.scanByRange(s_common.int64en(0), s_common.int64en(offs), db=self.db):
+            retn = True
+            self.slab.delete(lkey, db=self.db)
+            await asyncio.sleep(0)
+
+        return retn
+
+    def first(self):
+
+        for lkey, lval in self.slab.scanByFull(db=self.db):
+            indx = s_common.int64un(lkey)
+            return indx, s_msgpack.un(lval)
+
+        return None
+
     def iterBack(self, offs):
         '''
         Iterate backwards over items in a sequence from a given offset.
@@ -12,15 +12,52 @@ import synapse.common as s_common
 
 import synapse.lib.coro as s_coro
 import synapse.lib.base as s_base
+import synapse.lib.chop as s_chop
 import synapse.lib.node as s_node
 import synapse.lib.cache as s_cache
 import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.types as s_types
 import synapse.lib.spooled as s_spooled
+import synapse.lib.time as s_time
 
 logger = logging.getLogger(__name__)
 
+# the number of lifted buids to join per batch of storage node reads
+JOIN_CHUNK_SIZE = 1000
+
+# the number of nodedefs compiled together by addNodes()
+ADD_NODES_CHUNK_SIZE = 1000
+
+# the max number of compiled node edits applied by addNodes() at once
+ADD_NODES_EDIT_SIZE = 100
+
+def _indxSortKey(lkey, buid):
+    # strip the layer specific abrv to merge sort by index bytes
+    return lkey[8:]
+
+def _floatSortKey(lkey, buid):
+    # negative floats are lifted in descending index byte order, so invert
+    # their bytes to merge sort by value in the same order as each layer
+    indx = lkey[8:]
+    if indx[0] & 0x80:
+        return (0, bytes(b ^ 0xff for b in indx))
+    return (1, indx)
+
+def _getIndxSortKey(cmprvals):
+    '''
+    Return the merge sort key for the index rows lifted by the given (cmpr, valu, stortype) comparisons.
+    '''
+    if all(stortype == s_layer.STOR_TYPE_FLOAT64 for (_, _, stortype) in cmprvals):
+        return _floatSortKey
+    return _indxSortKey
+
+def _buidSortKey(lkey, buid):
+    return buid
+
+def _ownsForm(layr, buid):
+    return layr.hasNodeForm(buid)
+
 class Snap(s_base.Base):
     '''
     A "snapshot" is a transaction across multiple Cortex layers.
@@ -114,6 +151,9 @@ class Snap(s_base.Base):
     async def iterStormPodes(self, text, opts=None, user=None):
         '''
         Yield packed node tuples for the given storm query text.
+
+        Notes:
+            The "fields" opt may be used to only pack the listed props and tags.
         '''
         if user is None:
             user = self.user
@@ -121,14 +161,21 @@ class Snap(s_base.Base):
         dorepr = False
         dopath = False
 
+        props = None
+        tags = None
+
         self.core._logStormQuery(text, user)
 
         if opts is not None:
             dorepr = opts.get('repr', False)
             dopath = opts.get('path', False)
 
+            fields = opts.get('fields')
+            if fields is not None:
+                props, tags = s_node.getPackFields(fields)
+
         async for node, path in self.storm(text, opts=opts, user=user):
-            pode = node.pack(dorepr=dorepr)
+            pode = node.pack(dorepr=dorepr, props=props, tags=tags)
             pode[1]['path'] = path.pack(path=dopath)
             yield pode
 
@@ -162,6 +209,17 @@ class Snap(s_base.Base):
     async def nodes(self, text, opts=None, user=None):
         return [n async for n in self.eval(text, opts=opts, user=user)]
 
+    async def count(self, text, opts=None, user=None):
+        '''
+        Return the number of nodes which result from a storm query.
+        '''
+        if user is None:
+            user = self.user
+
+        query = self.core.getStormQuery(text)
+        with self.getStormRuntime(opts=opts, user=user) as runt:
+            return await runt.countStormQuery(query)
+
     async def clearCache(self):
         self.tagcache.clear()
         self.buidcache.clear()
@@ -188,6 +246,20 @@ class Snap(s_base.Base):
         '''
         return await self._joinStorNode(buid, {})
 
+    async def getNodesByBuids(self, buids):
+        '''
+        Yield the nodes for a list of binary ids using batched storage node reads.
+
+        Args:
+            buids (list): A list of binary ids.
+
+        Yields:
+            (synapse.lib.node.Node): The nodes which exist, in the order of the given buids.
+        '''
+        for chunk in s_common.chunks(buids, JOIN_CHUNK_SIZE):
+            async for node in self._joinStorNodes(chunk):
+                yield node
+
     async def getNodeByNdef(self, ndef):
         '''
         Return a single Node by (form,valu) tuple.
@@ -208,10 +280,10 @@ class Snap(s_base.Base):
             mesg = f'No tag property named {name}'
             raise s_exc.NoSuchTagProp(name=name, mesg=mesg)
 
-        for layr in self.layers:
-            genr = layr.liftByTagProp(form, tag, name)
-            async for node in self._joinStorGenr(layr, genr):
-                yield node
+        genrs = [layr.liftByTagProp(form, tag, name) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTagProp(buid, tag, name)
+        async for node in self._joinLiftRows(genrs, owns):
+            yield node
 
     async def nodesByTagPropValu(self, form, tag, name, cmpr, valu):
 
@@ -225,12 +297,10 @@ class Snap(s_base.Base):
         if not cmprvals:
             return
 
-        for layr in self.layers:
-            genr = layr.liftByTagPropValu(form, tag, name, cmprvals)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['tagprops'].get((tag, prop.name)) != layr:
-                    continue
-                yield node
+        genrs = [layr.liftByTagPropValu(form, tag, name, cmprvals) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTagProp(buid, tag, prop.name)
+        async for node in self._joinLiftRows(genrs, owns):
+            yield node
 
     async def _joinStorNode(self, buid, cache):
 
@@ -304,6 +374,148 @@ class Snap(s_base.Base):
         await asyncio.sleep(0)
         return node
 
+    async def _joinLiftRows(self, genrs, owns, key=None, filt=None):
+        '''
+        Merge sort the (lkey, buid) index rows lifted from each layer and join
+        each node from the highest layer which owns the lifted value.
+
+        Args:
+            genrs (list): A list of index row generators in the same order as self.layers.
+            owns (function): A function which returns True if a layer has the lifted value for a buid.
+            key (function): An optional function to extract a merge sort key from an (lkey, buid) row.
+            filt (function): An optional async function which returns False to skip a buid.
+
+        Notes:
+            Rows which are overridden by a higher layer or rejected by the
+            filter are skipped before the node is joined, so each result is
+            only constructed once.
+
+        Yields:
+            (synapse.lib.node.Node): The lifted nodes in merge sort key order.
+        '''
+        buids = []
+        async for buid in self._iterLiftBuids(genrs, owns, key=key):
+
+            if filt is not None and not await filt(buid):
+                await asyncio.sleep(0)
+                continue
+
+            buids.append(buid)
+            if len(buids) >= JOIN_CHUNK_SIZE:
+                async for node in self._joinStorNodes(buids):
+                    yield node
+                buids.clear()
+
+        async for node in self._joinStorNodes(buids):
+            yield node
+
+    async def _iterLiftBuids(self, genrs, owns, key=None):
+        '''
+        Merge sort the (lkey, buid) index rows lifted from each layer and yield
+        the buid of each row which is not overridden by a higher layer.
+        '''
+        if key is None:
+            key = _indxSortKey
+
+        async def genrows(indx, genr):
+            async for lkey, buid in genr:
+                yield (key(lkey, buid), indx, buid)
+
+        rows = [genrows(indx, genr) for (indx, genr) in enumerate(genrs)]
+
+        async for _, indx, buid in s_common.merggenr(rows):
+
+            if any(owns(layr, buid) for layr in self.layers[indx + 1:]):
+                await asyncio.sleep(0)
+                continue
+
+            yield buid
+
+    async def _countLiftRows(self, genrs, owns, key=None):
+        '''
+        Count the nodes which would be joined from the given index rows without
+        constructing them.
+        '''
+        # in a single layer an index row implies the node is present
+        needform = owns is not _ownsForm and len(self.layers) > 1
+
+        count = 0
+        async for buid in self._iterLiftBuids(genrs, owns, key=key):
+
+            if needform and not self.hasNodeBuid(buid):
+                continue
+
+            count += 1
+
+        return count
+
+    async def getStorPropValu(self, buid, name):
+        '''
+        Return the value of a node prop from the highest layer which has it, without joining the node.
+
+        Args:
+            buid (bytes): The buid of the node.
+            name (str): The relative name of the prop.
+
+        Returns:
+            (obj): The stored prop value or None.
+        '''
+        for layr in reversed(self.layers):
+            valu = await layr.getNodeValu(buid, name)
+            if valu is not None:
+                return valu
+
+    def hasNodeBuid(self, buid):
+        '''
+        Return True if any layer in the view has the node form row for the buid.
+        '''
+        return any(layr.hasNodeForm(buid) for layr in self.layers)
+
+    async def hasPropValus(self, full, valus):
+        '''
+        Return True if a node exists where the prop has any of the given norm values.
+
+        Notes:
+            Only the index rows are read so no nodes are constructed.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
+
+        genrs, owns = self._getPropValusLift(prop, valus)
+
+        needform = owns is not _ownsForm and len(self.layers) > 1
+
+        async for buid in self._iterLiftBuids(genrs, owns):
+
+            if needform and not self.hasNodeBuid(buid):
+                continue
+
+            return True
+
+        return False
+
+    async def _joinStorNodes(self, buids):
+        '''
+        Join a batch of nodes using one sorted storage node read per layer.
+
+        Yields:
+            (synapse.lib.node.Node): The joined nodes in the order of the given buids.
+        '''
+        todo = [buid for buid in buids if buid not in self.livenodes]
+
+        caches = collections.defaultdict(dict)
+        if todo:
+            for layr in self.layers:
+                async for sode in layr.getStorNodes(todo):
+                    caches[sode[0]][layr.iden] = sode
+
+        for buid in buids:
+            node = await self._joinStorNode(buid, caches.get(buid, {}))
+            if node is not None:
+                yield node
+
     async def _joinStorGenr(self, layr, genr):
         cache = {}
         async for sode in genr:
@@ -318,7 +530,7 @@ class Snap(s_base.Base):
             async for node in self._joinStorGenr(layr, genr):
                 yield node
 
-    async def nodesByProp(self, full):
+    async def nodesByProp(self, full, filt=None):
 
         prop = self.core.model.prop(full)
         if prop is None:
@@ -332,44 +544,27 @@ class Snap(s_base.Base):
 
             return
 
-        if prop.isform:
-
-            for layr in self.layers:
-                genr = layr.liftByProp(prop.name, None)
-
-                async for node in self._joinStorGenr(layr, genr):
-
-                    # TODO merge sort rather than use bylayer
-                    if node.bylayer.get('ndef') != layr:
-                        continue
-
-                    yield node
-            return
-
-        if prop.isuniv:
+        genrs, owns = self._getPropLift(prop)
+        async for node in self._joinLiftRows(genrs, owns, filt=filt):
+            yield node
 
-            for layr in self.layers:
-                genr = layr.liftByProp(None, prop.name)
-                async for node in self._joinStorGenr(layr, genr):
-                    if node.bylayer['props'].get(prop.name) != layr:
-                        continue
-                    yield node
-            return
+    def _getPropLift(self, prop):
+        '''
+        Return the (genrs, owns) index row generators and ownership function to lift by a non-runt prop.
+        '''
+        if prop.isform:
+            genrs = [layr.liftByProp(prop.name, None) for layr in self.layers]
+            return genrs, _ownsForm
 
         formname = None
         if not prop.isuniv:
             formname = prop.form.name
 
-        # Prop is secondary prop
-
-        for layr in self.layers:
-            genr = layr.liftByProp(formname, prop.name)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['props'].get(prop.name) != layr:
-                    continue
-                yield node
+        genrs = [layr.liftByProp(formname, prop.name) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeProp(buid, prop.name)
+        return genrs, owns
 
-    async def nodesByPropValu(self, full, cmpr, valu):
+    async def nodesByPropValu(self, full, cmpr, valu, filt=None):
 
         if cmpr == 'type=':
             async for node in self.nodesByPropValu(full, '=', valu):
@@ -395,55 +590,227 @@ class Snap(s_base.Base):
                     yield node
             return
 
+        genrs, owns = self._getPropValuLift(prop, cmprvals)
+        async for node in self._joinLiftRows(genrs, owns, key=_getIndxSortKey(cmprvals), filt=filt):
+            yield node
+
+    def _getPropValuLift(self, prop, cmprvals):
+        '''
+        Return the (genrs, owns) index row generators and ownership function to lift by a non-runt prop value.
+        '''
         if prop.isform:
+            genrs = [layr.liftByFormValu(prop.name, cmprvals) for layr in self.layers]
+            return genrs, _ownsForm
 
-            for layr in self.layers:
-                genr = layr.liftByFormValu(prop.name, cmprvals)
+        formname = None
+        if not prop.isuniv:
+            formname = prop.form.name
 
-                async for node in self._joinStorGenr(layr, genr):
+        genrs = [layr.liftByPropValu(formname, prop.name, cmprvals) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeProp(buid, prop.name)
+        return genrs, owns
 
-                    # TODO merge sort rather than use bylayer
-                    if node.bylayer.get('ndef') != layr:
-                        continue
+    async def nodesByPropValus(self, full, valus):
+        '''
+        Yield the nodes where the prop has any of the given norm values.
 
-                    yield node
+        Args:
+            full (str): The full name of a non-runt prop or form.
+            valus (list): A list of normalized values to lift by equality.
 
-            return
+        Notes:
+            Each layer is read using a single ordered scan for the entire set
+            of values and results are yielded in index order.
 
-        if prop.isuniv:
+        Yields:
+            (synapse.lib.node.Node): The lifted nodes.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
 
-            for layr in self.layers:
-                genr = layr.liftByPropValu(None, prop.name, cmprvals)
-                async for node in self._joinStorGenr(layr, genr):
-                    if node.bylayer['props'].get(prop.name) != layr:
-                        continue
-                    yield node
+        genrs, owns = self._getPropValusLift(prop, valus)
+        async for node in self._joinLiftRows(genrs, owns):
+            yield node
 
-            return
+    def _getPropValusLift(self, prop, valus):
+        '''
+        Return the (genrs, owns) index row generators and ownership function to lift by a set of prop norm values.
+        '''
+        stortype = prop.type.stortype
 
-        for layr in self.layers:
-            genr = layr.liftByPropValu(prop.form.name, prop.name, cmprvals)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['props'].get(prop.name) != layr:
-                    continue
-                yield node
+        if prop.isform:
+            genrs = [layr.liftByFormValus(prop.name, valus, stortype) for layr in self.layers]
+            return genrs, _ownsForm
 
-    async def nodesByTag(self, tag, form=None):
-        for layr in self.layers:
-            genr = layr.liftByTag(tag, form=form)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['tags'].get(tag) != layr:
-                    continue
-                yield node
+        formname = None
+        if not prop.isuniv:
+            formname = prop.form.name
+
+        genrs = [layr.liftByPropValus(formname, prop.name, valus, stortype) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeProp(buid, prop.name)
+        return genrs, owns
+
+    async def nodesByTag(self, tag, form=None, filt=None):
+        '''
+        Yield the nodes with the given tag.
+
+        Notes:
+            The bytag index rows are ordered by the layer specific form abbreviation
+            which may not be compared across layers, so rows are merged by buid.
+            Nodes are yielded in buid order when a form is specified, otherwise
+            the rows of each layer are grouped by form and the order of the
+            merged nodes is unspecified.
+        '''
+        genrs = [layr.liftByTag(tag, form=form) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTag(buid, tag)
+        async for node in self._joinLiftRows(genrs, owns, key=_buidSortKey, filt=filt):
+            yield node
+
+    async def nodesByTagValu(self, tag, cmpr, valu, form=None, filt=None):
+        '''
+        Yield the nodes with the given tag whose interval matches the comparison.
 
-    async def nodesByTagValu(self, tag, cmpr, valu, form=None):
+        Notes:
+            Rows are merged by buid in the same order as nodesByTag().
+        '''
         norm, info = self.core.model.type('ival').norm(valu)
+        genrs = [layr.liftByTagValu(tag, cmpr, norm, form=form) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTag(buid, tag)
+        async for node in self._joinLiftRows(genrs, owns, key=_buidSortKey, filt=filt):
+            yield node
+
+    def getFormCount(self, form):
+        '''
+        Return the (upper bound) number of nodes of a form across the layers.
+        '''
+        return sum(layr.formcounts.get(form) for layr in self.layers)
+
+    def getPropCount(self, full):
+        '''
+        Return the (upper bound) number of nodes with a form specific prop across the layers.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
+
+        return sum(layr.getPropCount(prop.form.name, prop.name) for layr in self.layers)
+
+    def getTagCount(self, tag, form):
+        '''
+        Return the (upper bound) number of nodes of a form with a tag across the layers.
+        '''
+        return sum(layr.getTagCount(tag, form) for layr in self.layers)
+
+    async def getPropValuCount(self, full, cmpr, valu, limit=None):
+        '''
+        Return the (upper bound) number of nodes lifted by a prop value comparison.
+
+        Notes:
+            Counting stops once the limit is reached.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
+
+        if prop.isrunt or prop.isuniv:
+            return limit
+
+        cmprvals = prop.type.getStorCmprs(cmpr, valu)
+        if not cmprvals:
+            return 0
+
+        form = prop.name if prop.isform else prop.form.name
+        name = None if prop.isform else prop.name
+
+        count = 0
         for layr in self.layers:
-            genr = layr.liftByTagValu(tag, cmpr, norm, form=form)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['tags'].get(tag) != layr:
-                    continue
-                yield node
+
+            size = None
+            if limit is not None:
+                size = limit - count
+
+            count += await layr.getPropValuCount(form, name, cmprvals, limit=size)
+            if limit is not None and count >= limit:
+                break
+
+        return count
+
+    async def countByProp(self, full):
+        '''
+        Return the number of nodes which have the prop without joining them.
+
+        Notes:
+            A view with a single layer is answered from the maintained counters.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
+
+        if prop.isrunt:
+            mesg = f'Runt property "{full}" may not be counted from the indexes.'
+            raise s_exc.IsRuntForm(mesg=mesg, prop=full)
+
+        if len(self.layers) == 1:
+
+            layr = self.layers[0]
+
+            if prop.isform:
+                return layr.formcounts.get(prop.name)
+
+            if not prop.isuniv:
+                return layr.getPropCount(prop.form.name, prop.name)
+
+        genrs, owns = self._getPropLift(prop)
+        return await self._countLiftRows(genrs, owns)
+
+    async def countByPropValu(self, full, cmpr, valu):
+        '''
+        Return the number of nodes lifted by a prop value comparison without joining them.
+        '''
+        prop = self.core.model.prop(full)
+        if prop is None:
+            mesg = f'No property named "{full}".'
+            raise s_exc.NoSuchProp(mesg=mesg)
+
+        if prop.isrunt:
+            mesg = f'Runt property "{full}" may not be counted from the indexes.'
+            raise s_exc.IsRuntForm(mesg=mesg, prop=full)
+
+        cmprvals = prop.type.getStorCmprs(cmpr, valu)
+        if not cmprvals:
+            return 0
+
+        genrs, owns = self._getPropValuLift(prop, cmprvals)
+        return await self._countLiftRows(genrs, owns, key=_getIndxSortKey(cmprvals))
+
+    async def countByTag(self, tag, form=None):
+        '''
+        Return the number of nodes with a tag without joining them.
+
+        Notes:
+            A view with a single layer is answered from the maintained counters
+            when a form is specified.
+        '''
+        if form is not None and len(self.layers) == 1:
+            return self.layers[0].getTagCount(tag, form)
+
+        genrs = [layr.liftByTag(tag, form=form) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTag(buid, tag)
+        return await self._countLiftRows(genrs, owns, key=_buidSortKey)
+
+    async def countByTagValu(self, tag, cmpr, valu, form=None):
+        '''
+        Return the number of nodes lifted by a tag interval comparison without joining them.
+        '''
+        norm, info = self.core.model.type('ival').norm(valu)
+        genrs = [layr.liftByTagValu(tag, cmpr, norm, form=form) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeTag(buid, tag)
+        return await self._countLiftRows(genrs, owns, key=_buidSortKey)
 
     async def nodesByPropTypeValu(self, name, valu):
 
@@ -467,15 +834,13 @@ class Snap(s_base.Base):
             raise s_exc.BadTypeValu(mesg=mesg)
 
         cmprvals = prop.type.arraytype.getStorCmprs(cmpr, valu)
+        key = _getIndxSortKey(cmprvals)
 
         if prop.isform:
 
-            for layr in self.layers:
-                genr = layr.liftByPropArray(prop.name, None, cmprvals)
-                async for node in self._joinStorGenr(layr, genr):
-                    if node.bylayer['ndef'] != layr:
-                        continue
-                    yield node
+            genrs = [layr.liftByPropArray(prop.name, None, cmprvals) for layr in self.layers]
+            async for node in self._joinLiftRows(genrs, _ownsForm, key=key):
+                yield node
 
             return
 
@@ -483,12 +848,10 @@ class Snap(s_base.Base):
         if prop.form is not None:
             formname = prop.form.name
 
-        for layr in self.layers:
-            genr = layr.liftByPropArray(formname, prop.name, cmprvals)
-            async for node in self._joinStorGenr(layr, genr):
-                if node.bylayer['props'].get(prop.name) != layr:
-                    continue
-                yield node
+        genrs = [layr.liftByPropArray(formname, prop.name, cmprvals) for layr in self.layers]
+        owns = lambda layr, buid: layr.hasNodeProp(buid, prop.name)
+        async for node in self._joinLiftRows(genrs, owns, key=key):
+            yield node
 
     async def getNodeAdds(self, form, valu, props, addnode=True):
 
@@ -758,9 +1121,8 @@ class Snap(s_base.Base):
                 norm, info = form.type.norm(valu)
                 node = await self.getNodeByBuid(s_common.buid((form.name, norm)))
                 if node is not None:
-                    # TODO implement node.setNodeProps()
                     if props is not None:
-                        for p, v in props.items():
+                        for p, v in (await self._getNodeSetProps(node, props)).items():
                             await node.set(p, v)
                     return node
 
@@ -780,6 +1142,44 @@ class Snap(s_base.Base):
         # Adds is top-down, so the first node is what we want
         return nodes[0]
 
+    async def _getNodeSetProps(self, node, props):
+        '''
+        Return the normalized props which would change when setting props on an existing node.
+
+        Notes:
+            Values are merged with the current values as Node.set() does, and
+            props which would not change are omitted.
+        '''
+        setprops = {}
+        for name, valu in props.items():
+
+            prop = node.form.prop(name)
+            if prop is None:
+                raise s_exc.NoSuchProp(name=name, form=node.form.name)
+
+            try:
+                norm, _ = prop.type.norm(valu)
+            except Exception as e:
+                mesg = f'Bad property value: {prop.full}={valu!r}'
+                raise s_exc.BadTypeValu(mesg=mesg, name=prop.name, valu=valu, emesg=str(e))
+
+            curv = node.props.get(name)
+            if curv == norm:
+                continue
+
+            if curv is not None:
+
+                if prop.info.get('ro'):
+                    raise s_exc.ReadOnlyProp(name=prop.full)
+
+                norm = prop.type.merge(curv, norm)
+                if curv == norm:
+                    continue
+
+            setprops[name] = norm
+
+        return setprops
+
     async def addFeedNodes(self, name, items):
         '''
         Call a feed function and return what it returns (typically yields Node()s).
@@ -851,55 +1251,265 @@ class Snap(s_base.Base):
         Args:
             nodedefs (list): A list of nodedef tuples.
 
+        Notes:
+            The edits for each chunk of nodedefs, including their tags and
+            tag properties, are compiled together and applied to the write
+            layer in batches of up to ADD_NODES_EDIT_SIZE node edits.
+
         Returns:
             (list): A list of xact messages.
         '''
+        chunk = []
+        for nodedef in nodedefs:
+
+            chunk.append(nodedef)
+            if len(chunk) >= ADD_NODES_CHUNK_SIZE:
+                async for node in self._addNodeDefs(chunk):
+                    yield node
+                chunk = []
+
+        async for node in self._addNodeDefs(chunk):
+            yield node
+
+    async def _addNodeDefs(self, nodedefs):
+        '''
+        Compile the edits for a chunk of nodedefs and apply them in batches.
+        '''
+        if not nodedefs:
+            return
+
+        if self.readonly:
+            mesg = 'The snapshot is in read-only mode.'
+            raise s_exc.IsReadOnly(mesg=mesg)
+
+        todo = []
         for (formname, formvalu), forminfo in nodedefs:
+
             try:
-                props = forminfo.get('props')
+                form = self.core.model.form(formname)
+                if form is None:
+                    raise s_exc.NoSuchForm(name=formname)
+
+                if form.isrunt:
+                    raise s_exc.IsRuntForm(mesg='Cannot make runt nodes.', form=form.full, prop=formvalu)
+
+                norm, info = form.type.norm(formvalu)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
 
-                # remove any universal created props...
-                if props is not None:
-                    props.pop('.created', None)
+            except Exception as e:
+                await self._onNodeDefError(self.strict, formname, formvalu, forminfo, e)
+                continue
+
+            todo.append((form, norm, forminfo, s_common.buid((form.name, norm))))
+
+        # read any nodes which already exist using one batch read per layer
+        nodes = {}
+        async for node in self.getNodesByBuids([item[3] for item in todo]):
+            nodes[node.buid] = node
+
+        buids = []
+        nodeedits = []
+
+        # the current tags of each node are shared by nodedefs for the same node
+        tagsbybuid = {}
+
+        oldstrict = self.strict
+        self.strict = True
+
+        try:
+
+            for form, norm, forminfo, buid in todo:
+
+                # compiling a large chunk must not starve the ioloop
+                await asyncio.sleep(0)
+
+                node = nodes.get(buid)
+
+                tags = {}
+                if buid in tagsbybuid:
+                    tags.update(tagsbybuid[buid])
+                elif node is not None:
+                    tags.update(node.tags)
 
-                oldstrict = self.strict
-                self.strict = True
                 try:
-                    node = await self.addNode(formname, formvalu, props=props)
-                    if node is not None:
-                        tags = forminfo.get('tags')
-                        if tags is not None:
-                            for tag, asof in tags.items():
-                                await node.addTag(tag, valu=asof)
-
-                        tagprops = forminfo.get('tagprops', {})
-                        if tagprops is not None:
-                            for tag, props in tagprops.items():
-                                for prop, valu in props.items():
-                                    try:
-                                        await node.setTagProp(tag, prop, valu)
-                                    except s_exc.NoSuchTagProp:
-                                        mesg = \
-                                            f'Tagprop [{prop}] does not exist, cannot set it on [{formname}={formvalu}]'
-                                        logger.warning(mesg)
-                                        continue
+                    edits = await self._getNodeDefEdits(form, norm, forminfo, node, tags, strict=oldstrict)
+
+                except asyncio.CancelledError:  # pragma: no cover
+                    raise
 
                 except Exception as e:
-                    if not oldstrict:
-                        await self.warn(f'addNodes failed on {formname}, {formvalu}, {forminfo}: {e}')
-                        continue
+                    await self._onNodeDefError(oldstrict, form.name, norm, forminfo, e)
+                    continue
+
+                tagsbybuid[buid] = tags
+                nodeedits.extend(ne for ne in edits if ne[2])
+                buids.append(buid)
+
+        finally:
+            self.strict = oldstrict
+
+        for i in range(0, len(nodeedits), ADD_NODES_EDIT_SIZE):
+            for node in await self.applyNodeEdits(nodeedits[i:i + ADD_NODES_EDIT_SIZE]):
+                nodes[node.buid] = node
+
+        for buid in buids:
+            yield nodes.get(buid)
+
+    async def _getNodeDefEdits(self, form, norm, forminfo, node, tags, strict=False):
+        '''
+        Return the node edits to add/merge a nodedef with its tags and tag properties.
+
+        Args:
+            form (synapse.datamodel.Form): The form of the node.
+            norm (obj): The normalized primary property value.
+            forminfo (dict): The nodedef info with optional props, tags and tagprops.
+            node (synapse.lib.node.Node): The existing node or None.
+            tags (dict): The current tags of the node which is updated with any tags set.
+            strict (bool): Log errors for tags and tag properties rather than warning about them.
+
+        Notes:
+            The edits are constructed with the same semantics as adding the
+            node, then calling Node.addTag() and Node.setTagProp() on it.  A
+            tag or tag property which fails is skipped and the remaining edits
+            are kept.
+        '''
+        props = forminfo.get('props')
+        if props is None:
+            props = {}
+
+        # remove any universal created props...
+        props.pop('.created', None)
+
+        addnode = True
+
+        if node is not None and self.buidprefetch:
+            addnode = False
+            props = await self._getNodeSetProps(node, props)
+
+        nodeedits = await self.getNodeAdds(form, norm, props, addnode=addnode)
+
+        # Adds is top-down, so the first node edit is for the node itself
+        edits = nodeedits[0][2]
+
+        # a bad tag or tag prop is reported without dropping the rest of the nodedef
+        nodetags = forminfo.get('tags')
+        if nodetags is not None:
+            for tag, asof in nodetags.items():
+                try:
+                    edits.extend(await self._getNodeDefTagEdits(tags, tag, valu=asof))
+
+                except asyncio.CancelledError:  # pragma: no cover
                     raise
 
-                finally:
-                    self.strict = oldstrict
+                except Exception as e:
+                    await self._onNodeDefError(strict, form.name, norm, forminfo, e)
 
-                yield node
+        tagprops = forminfo.get('tagprops')
+        if tagprops is not None:
+            for tag, tprops in tagprops.items():
+                for name, valu in tprops.items():
 
-            except asyncio.CancelledError:  # pragma: no cover
-                raise
+                    try:
+
+                        if s_chop.tag(tag) not in tags:
+                            edits.extend(await self._getNodeDefTagEdits(tags, tag))
+
+                        prop = self.core.model.getTagProp(name)
+                        if prop is None:
+                            mesg = f'Tagprop [{name}] does not exist, cannot set it on [{form.name}={norm}]'
+                            logger.warning(mesg)
+                            continue
+
+                        try:
+                            tpnorm, _ = prop.type.norm(valu)
+                        except Exception as e:
+                            mesg = f'Bad property value: #{tag}:{prop.name}={valu!r}'
+                            raise s_exc.BadTypeValu(mesg=mesg, name=prop.name, valu=valu, emesg=str(e))
+
+                        edits.append((s_layer.EDIT_TAGPROP_SET, (tag, name, tpnorm, None, prop.type.stortype), ()))
+
+                    except asyncio.CancelledError:  # pragma: no cover
+                        raise
+
+                    except Exception as e:
+                        await self._onNodeDefError(strict, form.name, norm, forminfo, e)
+
+        return nodeedits
+
+    async def _getNodeDefTagEdits(self, tags, tag, valu=(None, None)):
+        # only update the current tags once all of the edits for the tag are known
+        newtags = dict(tags)
+        edits = await self.getTagSetEdits(newtags, tag, valu=valu)
+        tags.update(newtags)
+        return edits
+
+    async def _onNodeDefError(self, strict, formname, formvalu, forminfo, exc):
+        if not strict:
+            await self.warn(f'addNodes failed on {formname}, {formvalu}, {forminfo}: {exc}')
+            return
+
+        logger.exception(f'Error making node: [{formname}={formvalu}]')
+
+    async def getTagSetEdits(self, tags, tag, valu=(None, None)):
+        '''
+        Return the edits to add a tag to a node with the given current tags.
+
+        Args:
+            tags (dict): The current tags of the node which is updated with the new values.
+            tag (str): The tag to add.
+            valu: The optional tag value which must norm as a valid time interval.
+
+        Returns:
+            (list): A list of EDIT_TAG_SET edits which may be empty.
+        '''
+        path = s_chop.tagpath(tag)
+
+        name = '.'.join(path)
+
+        tagnode = await self.addTagNode(name)
+
+        # implement tag renames...
+        isnow = tagnode.get('isnow')
+        if isnow:
+            await self.warn(f'tag {name} is now {isnow}')
+            name = isnow
+
+        if isinstance(valu, list):
+            valu = tuple(valu)
+
+        if valu != (None, None):
+            valu = self.tagtype.norm(valu)[0]
+
+        curv = tags.get(name)
+        if curv == valu:
+            return []
+
+        edits = []
+        if curv is None:
+
+            for parent in s_chop.tags(name)[:-1]:
+
+                if tags.get(parent) is not None:
+                    continue
+
+                await self.addTagNode(parent)
+
+                tags[parent] = (None, None)
+                edits.append((s_layer.EDIT_TAG_SET, (parent, (None, None), None), ()))
+
+        else:
+            # merge values into one interval
+            valu = s_time.ival(*valu, *curv)
+
+        if valu == curv:
+            return edits
+
+        tags[name] = valu
+        edits.append((s_layer.EDIT_TAG_SET, (name, valu, None), ()))
 
-            except Exception:
-                logger.exception(f'Error making node: [{formname}={formvalu}]')
+        return edits
 
     async def getRuntNodes(self, full, valu=None, cmpr=None):
 
@@ -75,6 +75,12 @@ async def _innerloop(core, todo, done):
     if item is None:
         return
 
+    updates = item.get('updates')
+    if updates is not None:
+        ok = await core.applySpawnUpdates(updates)
+        await s_coro.executor(done.put, ok)
+        return True
+
     link = await s_link.fromspawn(item.get('link'))
 
     await s_daemon.t2call(link, storm, (core, item,), {})
@@ -125,7 +131,7 @@ def corework(spawninfo, todo, done):
 class SpawnProc(s_base.Base):
     '''
     '''
-    async def __anit__(self, core):
+    async def __anit__(self, core, spawninfo=None):
 
         await s_base.Base.__anit__(self)
 
@@ -133,6 +139,9 @@ class SpawnProc(s_base.Base):
         self.iden = s_common.guid()
         self.proc = None
 
+        # the offset in the SpawnPool update log this process has applied
+        self.offs = 0
+
         self.ready = asyncio.Event()
         self.mpctx = multiprocessing.get_context('spawn')
 
@@ -145,7 +154,9 @@ class SpawnProc(s_base.Base):
         self.procstat = None
         self.obsolete = False
 
-        spawninfo = await core.getSpawnInfo()
+        if spawninfo is None:
+            spawninfo = await core.getSpawnInfo()
+
         self.finievent = threading.Event()
 
         @s_common.firethread
@@ -221,12 +232,24 @@ class SpawnProc(s_base.Base):
 
         return await self.executor(doit)
 
+    async def update(self, updates):
+        '''
+        Apply a list of incremental (name, args) cortex updates to the process.
+
+        Returns:
+            bool: True if the process applied every update.
+        '''
+        return await self.xact({'updates': updates})
+
     def executor(self, func, *args, **kwargs):
         def real():
             return func(*args, **kwargs)
 
         return asyncio.get_running_loop().run_in_executor(self.threadpool, real)
 
+# take a new spawninfo snapshot rather than replay more updates than this to a new process
+SPAWN_SNAPSHOT_UPDATES = 100
+
 class SpawnPool(s_base.Base):
 
     async def __anit__(self, core):
@@ -236,22 +259,68 @@ class SpawnPool(s_base.Base):
         self.core = core
 
         self.poolsize = await core.getConfOpt('spawn:poolsize')
+        self.poolmin = min(await core.getConfOpt('spawn:poolsize:min'), self.poolsize)
 
         self.spawns = {}
         self.spawnq = collections.deque()
 
+        # a log of incremental updates which are replayed to existing processes
+        self.updates = []
+
+        # the update log offset of the first entry in self.updates
+        self.updatebase = 0
+
+        # the update log offsets of processes which are being constructed
+        self.newoffs = []
+
+        # the spawninfo snapshot used for new processes and its update log offset
+        self.spawninfo = None
+        self.spawnoffs = 0
+
+        # incremented when the processes are retired
+        self.spawngen = 0
+
+        self.fillevnt = asyncio.Event()
+
         async def fini():
             await self.kill()
 
         self.onfini(fini)
 
-    async def bump(self):
+        if self.poolmin:
+            self.fillevnt.set()
+            self.schedCoro(self._fillLoop())
+
+    async def bump(self, update=None):
+        '''
+        Bring the spawn processes up to date with a change in the Cortex.
+
+        Args:
+            update ((str, tuple)): An optional (name, args) update which existing processes apply incrementally.
+
+        Notes:
+            Without an update, all current processes are retired and the pool is refilled.
+        '''
+        if update is not None:
+            self.updates.append(update)
+            self._trimUpdates()
+            return
+
+        self.updatebase += len(self.updates)
+        self.updates.clear()
+        self.spawninfo = None
+        self.spawnoffs = self.updatebase
+        self.spawngen += 1
+
         if not self.spawns:
             return
+
         [await s.retire() for s in list(self.spawns.values())]
         [await s.fini() for s in self.spawnq]
         self.spawnq.clear()
 
+        self.fillevnt.set()
+
     async def kill(self):
         if not self.spawns:
             return
@@ -272,16 +341,144 @@ class SpawnPool(s_base.Base):
 
         proc = None
 
-        if self.spawnq:
+        while self.spawnq:
+
             proc = self.spawnq.popleft()
+            if await self._sync(proc):
+                break
+
+            await proc.fini()
+            proc = None
+
+        self.fillevnt.set()
 
         if proc is None:
             proc = await self._new()
 
+        # a warm process reads the layers right away so commit any pending writes for it
+        for layr in list(self.core.layers.values()):
+            for slab in (layr.layrslab, layr.dataslab):
+                if slab.dirty:
+                    await slab.sync()
+
         yield proc
 
         await self._put(proc)
 
+    async def storm(self, text, user, view, opts=None):
+        '''
+        Execute a storm query on behalf of the Cortex in a spawn process.
+
+        Args:
+            text (str): The storm query.
+            user (HiveUser): The user to run the query as.
+            view (View): The view to run the query in.
+            opts (dict): Additional storm opts.
+
+        Yields:
+            ((str,dict)): Storm messages.
+        '''
+        if opts is None:
+            opts = {}
+
+        link, sock = await s_link.linksock()
+
+        item = {
+            'link': {'info': {'unix': True}, 'sock': sock},
+            'view': view.iden,
+            'user': user.iden,
+            'storm': {
+                'opts': opts,
+                'query': text,
+            }
+        }
+
+        async with link:
+
+            proc = None
+            xact = None
+
+            try:
+
+                async with self.get() as proc:
+
+                    xact = self.schedCoro(proc.xact(item))
+
+                    while True:
+
+                        mesg = await link.rx()
+                        if mesg is None:
+                            raise s_exc.LinkShutDown(mesg='Spawn process closed the link.')
+
+                        if mesg[0] != 't2:yield':
+                            continue
+
+                        retn = mesg[1].get('retn')
+                        if retn is None:
+                            break
+
+                        yield s_common.result(retn)
+
+                    await xact
+
+            except (asyncio.CancelledError, GeneratorExit, Exception):
+
+                if xact is not None:
+                    xact.cancel()
+
+                if proc is not None and not self.isfini:
+                    await proc.fini()
+
+                raise
+
+            finally:
+                sock.close()
+
+    def _getUpdateOffs(self):
+        '''
+        Return the update log offset which the next update will be stored at.
+        '''
+        return self.updatebase + len(self.updates)
+
+    def _trimUpdates(self):
+        '''
+        Remove the updates which have been applied by every live process and the spawninfo snapshot.
+        '''
+        # a snapshot too far behind is never used again so it does not hold the log
+        if self._getUpdateOffs() - self.spawnoffs > SPAWN_SNAPSHOT_UPDATES:
+            self.spawninfo = None
+
+        offs = [p.offs for p in self.spawns.values() if not p.isfini and not p.obsolete]
+        offs.extend(self.newoffs)
+
+        if self.spawninfo is not None:
+            offs.append(self.spawnoffs)
+
+        minoffs = min(offs, default=self._getUpdateOffs())
+        if minoffs <= self.updatebase:
+            return
+
+        del self.updates[:minoffs - self.updatebase]
+        self.updatebase = minoffs
+
+    async def _sync(self, proc):
+        '''
+        Apply any incremental updates the process has not seen.
+        '''
+        if proc.isfini or proc.obsolete:
+            return False
+
+        offs = self._getUpdateOffs()
+        if proc.offs >= offs:
+            return True
+
+        if not await proc.update(self.updates[proc.offs - self.updatebase:offs - self.updatebase]):
+            return False
+
+        proc.offs = offs
+        self._trimUpdates()
+        return True
+
     async def _put(self, proc):
 
         if not proc.obsolete and len(self.spawnq) < self.poolsize:
@@ -290,20 +487,82 @@ class SpawnPool(s_base.Base):
 
         await proc.fini()
 
-    async def _new(self):
+    async def _fillLoop(self):
+        '''
+        Keep at least poolmin processes warmed up in the pool.
+        '''
+        while not self.isfini:
+
+            await self.fillevnt.wait()
+            self.fillevnt.clear()
+
+            try:
+
+                while not self.isfini and len(self.spawnq) < self.poolmin:
+                    proc = await self._new()
+                    await self._put(proc)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
 
-        proc = await SpawnProc.anit(self.core)
+            except Exception:  # pragma: no cover
+                logger.exception('Error warming spawn pool.')
+                await self.waitfini(timeout=1)
+                self.fillevnt.set()
 
-        logger.debug(f'Made new SpawnProc {proc}')
+    async def _new(self, fresh=False):
 
-        self.spawns[proc.iden] = proc
+        gen = self.spawngen
+
+        snap = fresh or self.spawninfo is None or self._getUpdateOffs() - self.spawnoffs > SPAWN_SNAPSHOT_UPDATES
+        if snap:
+            # updates made while we take the snapshot are replayed rather than missed
+            offs = self._getUpdateOffs()
+        else:
+            offs = self.spawnoffs
+            spawninfo = self.spawninfo
+
+        # keep the updates from offs until the process is tracked by the pool
+        self.newoffs.append(offs)
+
+        try:
+
+            if snap:
+                spawninfo = await self.core.getSpawnInfo()
+                if gen == self.spawngen:
+                    self.spawnoffs = offs
+                    self.spawninfo = spawninfo
+
+            proc = await SpawnProc.anit(self.core, spawninfo=spawninfo)
+            proc.offs = offs
+
+            # the pool was bumped while the process was starting
+            if gen != self.spawngen:
+                await proc.retire()
+
+            logger.debug(f'Made new SpawnProc {proc}')
+
+            self.spawns[proc.iden] = proc
+
+        finally:
+            self.newoffs.remove(offs)
 
         async def fini():
             self.spawns.pop(proc.iden, None)
+            self._trimUpdates()
 
         proc.onfini(fini)
 
-        return proc
+        if proc.obsolete or await self._sync(proc):
+            return proc
+
+        if fresh:
+            await proc.retire()
+            return proc
+
+        # the snapshot could not be brought up to date so take a new one
+        await proc.fini()
+        return await self._new(fresh=True)
 
 class SpawnCore(s_base.Base):
     '''
@@ -340,7 +599,24 @@ class SpawnCore(s_base.Base):
         self.model = s_datamodel.Model()
         self.model.addDataModels(spawninfo.get('model'))
 
+        # changes the Cortex ships to existing processes ( see SpawnPool.bump )
+        self.spawnupdates = {
+            'cmd:pop': self._popStormCmd,
+            'cmd:set': self._setStormCmd,
+            'pkg:drop': self._dropStormPkg,
+            'pkg:load': self.loadStormPkg,
+            'svc:add': self._addStormSvc,
+            'model:prop:add': self.model.addFormProp,
+            'model:prop:del': self.model.delFormProp,
+            'model:univ:add': self.model.addUnivProp,
+            'model:univ:del': self.model.delUnivProp,
+            'model:tagprop:add': self.model.addTagProp,
+            'model:tagprop:del': self.model.delTagProp,
+        }
+
         self.stormpkgs = {}     # name: pkgdef
+
+        await self._initStormQueryCache(readonly=True)
         await self._initStormCmds()
 
         for sdef in self.svcinfo:
@@ -449,9 +725,35 @@ class SpawnCore(s_base.Base):
 
         await self._dropStormPkg(pkgdef)
 
-    async def bumpSpawnPool(self):
+    async def bumpSpawnPool(self, update=None):
         pass
 
+    async def applySpawnUpdates(self, updates):
+        '''
+        Apply incremental (name, args) updates sent by the SpawnPool.
+
+        Returns:
+            bool: False if an update could not be applied and the process should be retired.
+        '''
+        for name, args in updates:
+
+            func = self.spawnupdates.get(name)
+            if func is None:
+                logger.warning(f'Unknown spawn update: {name}')
+                return False
+
+            try:
+                await s_coro.ornot(func, *args)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+
+            except Exception:
+                logger.exception(f'Error applying spawn update: {name}')
+                return False
+
+        return True
+
     async def getStormPkgs(self):
         return list(self.stormpkgs.values())
 
@@ -500,6 +802,7 @@ class SpawnCore(s_base.Base):
     _setStormSvc = s_cortex.Cortex._setStormSvc
     _confirmStormPkg = s_cortex.Cortex._confirmStormPkg
     _dropStormPkg = s_cortex.Cortex._dropStormPkg
+    _popStormCmd = s_cortex.Cortex._popStormCmd
     _reqStormCmd = s_cortex.Cortex._reqStormCmd
     _setStormCmd = s_cortex.Cortex._setStormCmd
     _tryLoadStormPkg = s_cortex.Cortex._tryLoadStormPkg
@@ -516,6 +819,9 @@ class SpawnCore(s_base.Base):
     loadStormPkg = s_cortex.Cortex.loadStormPkg
 
     _initStormCmds = s_cortex.Cortex._initStormCmds
+    _initStormQueryCache = s_cortex.Cortex._initStormQueryCache
+    _getCachedStormQuery = s_cortex.Cortex._getCachedStormQuery
+    _putCachedStormQuery = s_cortex.Cortex._putCachedStormQuery
     _initStormOpts = s_cortex.Cortex._initStormOpts
 
     _viewFromOpts = s_cortex.Cortex._viewFromOpts
@@ -102,3 +102,50 @@ class Set(Spooled):
             return
 
         self.realset.discard(valu)
+
+class Sorted(Spooled):
+    '''
+    A minimal sorter for unique (bytes, bytes) rows that will spool to a slab on large growth.
+    '''
+
+    async def __anit__(self, dirn=None, size=10000):
+        await Spooled.__anit__(self, dirn=dirn, size=size)
+        self.rows = []
+        self.rowsdb = None
+        self.len = 0
+
+    def __len__(self):
+        '''
+        Returns how many rows were added, regardless of whether in RAM or backed to slab
+        '''
+        if self.fallback:
+            return self.len
+
+        return len(self.rows)
+
+    async def add(self, lkey, lval):
+
+        if self.fallback:
+            self.slab.put(lkey, lval, dupdata=True, db=self.rowsdb)
+            self.len += 1
+            return
+
+        self.rows.append((lkey, lval))
+
+        if len(self.rows) >= self.size:
+            await self._initFallBack()
+            self.rowsdb = self.slab.initdb('rows', dupsort=True)
+            self.slab.putmulti(self.rows, dupdata=True, db=self.rowsdb)
+            self.len = len(self.rows)
+            self.rows.clear()
+
+    def items(self):
+        '''
+        Yield the (lkey, lval) rows in sorted order.
+        '''
+        if self.fallback:
+            yield from self.slab.scanByFull(db=self.rowsdb)
+            return
+
+        self.rows.sort()
+        yield from self.rows
@@ -35,6 +35,10 @@ When condition is tag:add or tag:del, you may optionally provide a form name
 to restrict the trigger to fire only on tags added or deleted from nodes of
 those forms.
 
+When --async is specified, trigger events are queued and the query is run
+later over batches of the queued nodes rather than inline with the edit.
+Async triggers are not supported for node:del.
+
 The added tag is provided to the query as an embedded variable '$tag'.
 
 Simple one level tag globbing is supported, only at the end after a period,
@@ -50,6 +54,9 @@ Examples:
 
     # Adds a tag #todo to every inet:ipv4 as it is tagged #aka
     trigger.add tag:add --form inet:ipv4 --tag aka --query {[ +#todo ]}
+
+    # Asynchronously adds a tag #todo to every inet:ipv4 as it is tagged #aka
+    trigger.add tag:add --form inet:ipv4 --tag aka --async --query {[ +#todo ]}
 '''
 
 addcrondescr = '''
@@ -203,6 +210,7 @@ reqValidDdef = s_config.getJsValidator({
         'user': {'type': 'string', 'pattern': s_config.re_iden},
         'iden': {'type': 'string', 'pattern': s_config.re_iden},
         'enabled': {'type': 'boolean', 'default': True},
+        'spawn': {'type': 'boolean'},
         'stormopts': {
             'oneOf': [
                 {'type': 'null'},
@@ -219,6 +227,7 @@ reqValidDdef = s_config.getJsValidator({
                 'spawn': {'type': 'boolean'},
                 'repr': {'type': 'boolean'},
                 'path': {'type': 'string'},
+                'fields': {'type': 'array', 'items': {'type': 'string'}},
                 'show': {'type': 'array', 'items': {'type': 'string'}}
             },
             'additionalProperties': True,
@@ -512,6 +521,8 @@ stormcmds = (
             ('--query', {'help': 'Query for the trigger to execute.', 'required': True}),
             ('--disabled', {'default': False, 'action': 'store_true',
                             'help': 'Create the trigger in disabled state.'}),
+            ('--async', {'default': False, 'action': 'store_true',
+                         'help': 'Queue trigger events and run the query over them in batches.'}),
         ),
         'storm': '''
             $trig = $lib.trigger.add($cmdopts)
@@ -629,6 +640,8 @@ stormcmds = (
             ('--daily', {'help': 'Fixed parameters for a daily job.'}),
             ('--monthly', {'help': 'Fixed parameters for a monthly job.'}),
             ('--yearly', {'help': 'Fixed parameters for a yearly job.'}),
+            ('--spawn', {'default': False, 'action': 'store_true',
+                         'help': 'Run the read-only query in a storm spawn process.'}),
         ),
         'storm': '''
             $cron = $lib.cron.add(query=$cmdopts.query,
@@ -640,7 +653,8 @@ stormcmds = (
                                   hourly=$cmdopts.hourly,
                                   daily=$cmdopts.daily,
                                   monthly=$cmdopts.monthly,
-                                  yearly=$cmdopts.yearly)
+                                  yearly=$cmdopts.yearly,
+                                  spawn=$cmdopts.spawn)
 
             $lib.print("Created cron job: {iden}", iden=$cron.iden)
         ''',
@@ -742,6 +756,8 @@ stormcmds = (
                 $lib.print('last start time: {laststart}', laststart=$job.laststart)
                 $lib.print('last end time:   {lastend}', lastend=$job.lastend)
                 $lib.print('last result:     {lastresult}', lastresult=$job.lastresult)
+                $lib.print('spawn:           {spawn}', spawn=$job.spawn)
+                $lib.print('run times:       {runtimes}', runtimes=$job.runtimes)
                 $lib.print('query:           {query}', query=$job.query)
 
                 if $job.recs {
@@ -950,6 +966,34 @@ class StormDmon(s_base.Base):
     def _getRunLog(self):
         return list(self.runlog)
 
+    async def _spawnRun(self, text, opts, view, dmonPrint, dmonWarn):
+        '''
+        Run the dmon query in a storm spawn process.
+        '''
+        if self.core.spawnpool is None:
+            mesg = 'The Cortex spawn pool is not initialized.'
+            raise s_exc.NotReady(mesg=mesg)
+
+        errinfo = None
+        self.err_evnt.clear()
+
+        async for mesg in self.core.spawnpool.storm(text, self.user, view, opts=dict(opts)):
+
+            if mesg[0] == 'node':
+                self.count += 1
+
+            elif mesg[0] == 'print':
+                dmonPrint(mesg)
+
+            elif mesg[0] == 'warn':
+                dmonWarn(mesg)
+
+            elif mesg[0] == 'err':
+                errinfo = mesg[1]
+
+        if errinfo is not None:
+            s_common.result((False, errinfo))
+
     async def _innr_run(self):
 
         s_scope.set('storm:dmon', self.iden)
@@ -976,21 +1020,26 @@ class StormDmon(s_base.Base):
             try:
 
                 self.status = 'running'
-                async with await self.core.snap(user=self.user, view=view) as snap:
 
-                    snap.on('warn', dmonWarn)
-                    snap.on('print', dmonPrint)
-                    self.err_evnt.clear()
+                if self.ddef.get('spawn'):
+                    await self._spawnRun(text, opts, view, dmonPrint, dmonWarn)
+
+                else:
+                    async with await self.core.snap(user=self.user, view=view) as snap:
 
-                    async for nodepath in snap.storm(text, opts=opts, user=self.user):
-                        # all storm tasks yield often to prevent latency
-                        self.count += 1
-                        await asyncio.sleep(0)
+                        snap.on('warn', dmonWarn)
+                        snap.on('print', dmonPrint)
+                        self.err_evnt.clear()
 
-                    logger.warning(f'Dmon query exited: {self.iden}')
+                        async for nodepath in snap.storm(text, opts=opts, user=self.user):
+                            # all storm tasks yield often to prevent latency
+                            self.count += 1
+                            await asyncio.sleep(0)
 
-                    self.status = 'exited'
-                    await self.waitfini(timeout=1)
+                logger.warning(f'Dmon query exited: {self.iden}')
+
+                self.status = 'exited'
+                await self.waitfini(timeout=1)
 
             except asyncio.CancelledError:
                 logger.warning(f'Dmon loop cancelled: ({self.iden})')
@@ -1181,6 +1230,27 @@ class Runtime:
                 self.tick()
                 yield node, path
 
+    async def countStormQuery(self, query):
+        '''
+        Return the number of nodes which result from the query.
+
+        Notes:
+            Pure lift queries are counted from the layer indexes without
+            constructing any nodes.
+        '''
+        with s_provenance.claim('storm', q=query.text, user=self.user.iden):
+            self.loadRuntVars(query)
+            count = await query.getLiftCount(self)
+
+        if count is not None:
+            return count
+
+        count = 0
+        async for _ in self.iterStormQuery(query):
+            count += 1
+
+        return count
+
     def canPropName(self, name):
         if name not in self.modulefuncs and name not in self.ctors:
             return True
@@ -15,6 +15,7 @@ import synapse.common as s_common
 import synapse.telepath as s_telepath
 
 import synapse.lib.ast as s_ast
+import synapse.lib.agenda as s_agenda
 import synapse.lib.coro as s_coro
 import synapse.lib.node as s_node
 import synapse.lib.time as s_time
@@ -182,11 +183,14 @@ class LibDmon(Lib):
         self.runt.user.confirm(('dmon', 'log'))
         return await self.runt.snap.core.getStormDmonLog(iden)
 
-    async def _libDmonAdd(self, quer, name='noname'):
+    async def _libDmonAdd(self, quer, name='noname', spawn=False):
         '''
         Add a storm dmon (persistent background task) to the cortex.
 
         $lib.dmon.add(${ myquery })
+
+        Notes:
+            If spawn is set, the read-only dmon query is run in a storm spawn process.
         '''
         self.runt.user.confirm(('dmon', 'add'))
 
@@ -205,6 +209,9 @@ class LibDmon(Lib):
             'stormopts': opts,
         }
 
+        if spawn:
+            ddef['spawn'] = True
+
         dmoniden = await self.runt.snap.core.addStormDmon(ddef)
         return dmoniden
 
@@ -420,6 +427,7 @@ class LibBytes(Lib):
     def addLibFuncs(self):
         self.locls.update({
             'put': self._libBytesPut,
+            'hashset': self._libBytesHashset,
         })
 
     async def _libBytesPut(self, byts):
@@ -442,6 +450,20 @@ class LibBytes(Lib):
 
         return (size, s_common.ehex(sha2))
 
+    async def _libBytesHashset(self, sha256):
+        '''
+        Return the hashes of a file in the axon.
+
+        Returns:
+            A dictionary of md5, sha1, sha256 and sha512 hex digests or $lib.null if they are not known.
+
+        Example:
+            $hashes = $lib.bytes.hashset($sha256)
+        '''
+        await self.runt.snap.core.getAxon()
+        todo = s_common.todo('hashset', s_common.uhex(sha256))
+        return await self.dyncall('axon', todo)
+
 class LibLift(Lib):
 
     def addLibFuncs(self):
@@ -1678,6 +1700,9 @@ class Layer(Prim):
             'get': self._methLayerGet,
             'pack': self._methLayerPack,
             'repr': self._methLayerRepr,
+            'addTrigramIndex': self._methLayerAddTrigramIndex,
+            'delTrigramIndex': self._methLayerDelTrigramIndex,
+            'getTrigramIndexes': self._methLayerGetTrigramIndexes,
         })
 
     async def _methLayerGet(self, name, defv=None):
@@ -1694,6 +1719,61 @@ class Layer(Prim):
     async def _methLayerPack(self):
         return self.valu
 
+    def _reqTrigramProp(self, name):
+        prop = self.runt.snap.core.model.prop(name)
+        if prop is None:
+            mesg = f'No property named {name}.'
+            raise s_exc.NoSuchProp(mesg=mesg, name=name)
+
+        if prop.isform:
+            return prop.name, None
+
+        if prop.isuniv:
+            mesg = 'Trigram indexes are not supported for universal props.'
+            raise s_exc.BadArg(mesg=mesg, name=name)
+
+        return prop.form.name, prop.name
+
+    async def _methLayerAddTrigramIndex(self, name):
+        '''
+        Add a trigram index to accelerate regex lifts for a form or prop.
+        '''
+        name = await toprim(name)
+        form, prop = self._reqTrigramProp(name)
+
+        useriden = self.runt.user.iden
+        layriden = self.valu.get('iden')
+        gatekeys = ((useriden, ('layer', 'set', 'trigram'), layriden),)
+        todo = s_common.todo('addTrigramIndex', form, prop=prop)
+        return await self.runt.dyncall(layriden, todo, gatekeys=gatekeys)
+
+    async def _methLayerDelTrigramIndex(self, name):
+        '''
+        Remove the trigram index for a form or prop.
+        '''
+        name = await toprim(name)
+        form, prop = self._reqTrigramProp(name)
+
+        useriden = self.runt.user.iden
+        layriden = self.valu.get('iden')
+        gatekeys = ((useriden, ('layer', 'set', 'trigram'), layriden),)
+        todo = s_common.todo('delTrigramIndex', form, prop=prop)
+        return await self.runt.dyncall(layriden, todo, gatekeys=gatekeys)
+
+    async def _methLayerGetTrigramIndexes(self):
+        '''
+        Return a list of the forms and props which have a trigram index.
+        '''
+        layriden = self.valu.get('iden')
+        todo = s_common.todo('getTrigramIndexes')
+        retn = []
+        for form, prop in await self.runt.dyncall(layriden, todo):
+            if prop is None:
+                retn.append(form)
+            else:
+                retn.append(f'{form}:{prop}')
+        return retn
+
     async def _methLayerRepr(self):
         iden = self.valu.get('iden')
         name = self.valu.get('name', 'unnamed')
@@ -2580,6 +2660,9 @@ class LibCron(Lib):
                 'creator': self.runt.user.iden
                 }
 
+        if kwargs.get('spawn'):
+            cdef['spawn'] = True
+
         todo = s_common.todo('addCronJob', cdef)
         gatekeys = ((self.runt.user.iden, ('cron', 'add'), None),)
         cdef = await self.dyncall('cortex', todo, gatekeys=gatekeys)
@@ -2749,6 +2832,23 @@ class CronJob(Prim):
         # but we don't want timezone to print out
         return datetime.datetime.utcfromtimestamp(ts).isoformat(timespec='minutes')
 
+    @staticmethod
+    def _formatRunTimes(runtimes):
+        retn = []
+        lowr = 0
+        for i, count in enumerate(runtimes):
+            if i < len(s_agenda.RUNTIME_BUCKETS):
+                uppr = s_agenda.RUNTIME_BUCKETS[i]
+                name = f'{lowr}-{uppr}s'
+                lowr = uppr
+            else:
+                name = f'>{lowr}s'
+
+            if count:
+                retn.append(f'{name}: {count}')
+
+        return ', '.join(retn) or '<None>'
+
     async def _methCronJobPprint(self):
 
         user = self.valu.get('username')
@@ -2770,6 +2870,8 @@ class CronJob(Prim):
             'lastend': 'Never' if lastend is None else self._formatTimestamp(lastend),
             'lastresult': self.valu.get('lastresult') or '<None>',
             'iserr': 'X' if result is not None and not result.startswith('finished successfully') else ' ',
+            'spawn': 'Y' if self.valu.get('spawn') else 'N',
+            'runtimes': self._formatRunTimes(self.valu.get('runtimes', ())),
             'recs': []
         }
 
@@ -41,6 +41,7 @@ TrigSchema = {
         'cond': {'enum': ['node:add', 'node:del', 'tag:add', 'tag:del', 'prop:set']},
         'storm': {'type': 'string'},
         'enabled': {'type': 'boolean'},
+        'async': {'type': 'boolean'},
     },
     'additionalProperties': True,
     'required': ['iden', 'user', 'storm', 'enabled'],
@@ -197,6 +198,8 @@ class Triggers:
             s_chop.validateTagMatch(tag)
         if prop is not None and cond != 'prop:set':
             raise s_exc.BadOptValu(mesg='prop parameter invalid')
+        if cond == 'node:del' and trig.tdef.get('async'):
+            raise s_exc.BadOptValu(mesg='async is not supported for node:del')
 
         if cond == 'node:add':
             self.nodeadd[form].append(trig)
@@ -297,7 +300,7 @@ class Trigger:
         '''
         Set one of the dynamic elements of the trigger definition.
         '''
-        assert name in ('enabled', 'storm', 'doc', 'name')
+        assert name in ('enabled', 'storm', 'doc', 'name', 'async')
 
         if valu == self.tdef.get(name):
             return
@@ -305,6 +308,9 @@ class Trigger:
         if name == 'storm':
             self.view.core.getStormQuery(valu)
 
+        if name == 'async' and valu and self.tdef.get('cond') == 'node:del':
+            raise s_exc.BadOptValu(mesg='async is not supported for node:del')
+
         self.tdef[name] = valu
         await self.view.trigdict.set(self.iden, self.tdef)
 
@@ -314,12 +320,20 @@ class Trigger:
     async def execute(self, node, vars=None):
         '''
         Actually execute the query
+
+        Note:
+            Triggers with the "async" option set are queued in the view of the
+            node and run later in batches by View.runTrigQueue().
         '''
         opts = {}
 
         if not self.tdef.get('enabled'):
             return
 
+        if self.tdef.get('async'):
+            await node.snap.view.addTrigQueue(self, node, vars=vars)
+            return
+
         if vars is not None:
             opts['vars'] = vars
 
@@ -345,6 +359,52 @@ class Trigger:
             except Exception:
                 logger.exception('Trigger encountered exception running storm query %s', storm)
 
+    async def executeBatch(self, view, ndefs, vars=None):
+        '''
+        Execute the query once over the given nodes lifted from the view.
+        '''
+        opts = {}
+
+        if not self.tdef.get('enabled'):
+            return
+
+        if vars is not None:
+            opts['vars'] = vars
+
+        useriden = self.tdef.get('user')
+
+        user = view.core.auth.user(useriden)
+        if user is None:
+            logger.warning('Unknown user %s in stored trigger', useriden)
+            return
+
+        tag = self.tdef.get('tag')
+        cond = self.tdef.get('cond')
+        form = self.tdef.get('form')
+        prop = self.tdef.get('prop')
+        storm = self.tdef.get('storm')
+
+        with s_provenance.claim('trig', cond=cond, form=form, tag=tag, prop=prop):
+
+            try:
+                query = view.core.getStormQuery(storm)
+
+                async with await view.snap(user=user) as snap:
+
+                    with snap.getStormRuntime(opts=opts, user=user) as runt:
+
+                        async def genr():
+                            buids = [s_common.buid(ndef) for ndef in ndefs]
+                            async for node in snap.getNodesByBuids(buids):
+                                yield node, runt.initPath(node)
+
+                        await s_common.aspin(runt.iterStormQuery(query, genr=genr()))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Trigger encountered exception running storm query %s', storm)
+
     def pack(self):
         tdef = self.tdef.copy()
 
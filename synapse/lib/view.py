@@ -17,6 +17,9 @@ import synapse.lib.stormtypes as s_stormtypes
 
 logger = logging.getLogger(__name__)
 
+# the max number of queued async trigger events to run per batch
+TRIG_QUEUE_BATCH = 1000
+
 reqValidVdef = s_config.getJsValidator({
     'type': 'object',
     'properties': {
@@ -91,6 +94,83 @@ class View(s_nexus.Pusher):  # type: ignore
         if parent is not None:
             self.parent = self.core.getView(parent)
 
+    async def initTrigQueue(self):
+        '''
+        Initialize the queue of async trigger events and start the worker which drains it.
+        '''
+        self.trigqueue = self.core.trigqueue
+
+        if not self.trigqueue.exists(self.iden):
+            await self.trigqueue.add(self.iden, {})
+
+        self.schedCoro(self.runTrigQueue())
+
+    async def addTrigQueue(self, trig, node, vars=None):
+        '''
+        Queue an async trigger event for a node in this view.
+        '''
+        await self.trigqueue.put(self.iden, (trig.view.iden, trig.iden, node.ndef, vars))
+
+    async def runTrigQueue(self):
+        '''
+        Run queued async trigger events in batches.
+
+        Events are grouped by trigger and vars so each trigger query runs once
+        over all of the nodes in the batch.  Entries are culled only after the
+        batch has been executed, or has failed.
+        '''
+        offs = 0
+
+        while not self.isfini:
+
+            items = []
+            async for item in self.trigqueue.gets(self.iden, offs, wait=True):
+                items.append(item)
+                break
+
+            # the queue only stops waiting without an item when it is fini
+            if not items:
+                return
+
+            nextoffs = items[-1][0] + 1
+            async for item in self.trigqueue.gets(self.iden, nextoffs, size=TRIG_QUEUE_BATCH - 1):
+                items.append(item)
+
+            try:
+                await self._runTrigBatch([item for _, item in items])
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception:
+                logger.exception(f'Failed to run async trigger batch in view {self.iden}')
+
+            offs = items[-1][0] + 1
+            await self.trigqueue.cull(self.iden, offs - 1)
+
+    async def _runTrigBatch(self, entries):
+
+        todo = collections.defaultdict(list)
+        for viewiden, trigiden, ndef, vars in entries:
+            if vars is not None:
+                vars = tuple(sorted(vars.items()))
+            todo[(viewiden, trigiden, vars)].append(ndef)
+
+        for (viewiden, trigiden, vars), ndefs in todo.items():
+
+            view = self.core.getView(viewiden)
+            if view is None:
+                continue
+
+            trig = view.triggers.get(trigiden)
+            if trig is None:
+                continue
+
+            if vars is not None:
+                vars = dict(vars)
+
+            await trig.executeBatch(self, ndefs, vars=vars)
+
     def isafork(self):
         return self.parent is not None
 
@@ -168,6 +248,19 @@ class View(s_nexus.Pusher):  # type: ignore
             async for node in snap.eval(text, opts=opts, user=user):
                 yield node
 
+    async def count(self, text, opts=None):
+        '''
+        Return the number of nodes which result from a storm query.
+        '''
+        opts = self.core._initStormOpts(opts)
+        user = self.core._userFromOpts(opts)
+
+        info = {'query': text, 'opts': opts}
+        await self.core.boss.promote('storm', user=user, info=info)
+
+        async with await self.snap(user=user) as snap:
+            return await snap.count(text, opts=opts, user=user)
+
     async def callStorm(self, text, opts=None):
         try:
 
@@ -651,6 +744,9 @@ class View(s_nexus.Pusher):  # type: ignore
         await self.fini()
         await self.node.pop()
 
+        if self.core.trigqueue.exists(self.iden):
+            await self.core.trigqueue.rem(self.iden)
+
     def getSpawnInfo(self):
         return {
             'iden': self.iden,
@@ -15,6 +15,7 @@ import synapse.common as s_common
 import synapse.lib.base as s_base
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.queue as s_queue
 import synapse.lib.certdir as s_certdir
 import synapse.lib.threads as s_threads
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 televers = (3, 0)
 
+# the number of t2:yields frames a server may send before the client returns credit
+T2_YIELDS_CREDIT = 8
+
 class Aware:
     '''
     The telepath.Aware mixin allows shared objects to
@@ -59,6 +63,53 @@ class Task:
         self.retn = retn
         self.done.set()
 
+class MuxTask:
+    '''
+    A telepath task v2 call multiplexed over the main Proxy link.
+
+    A MuxTask stands in for a pool link during the call. Messages for
+    the task are demultiplexed by the Proxy rxloop into its queue.
+    '''
+    def __init__(self, proxy):
+
+        self.proxy = proxy
+        self.iden = s_common.guid()
+
+        self.done = False
+        self.isfini = False
+
+        self.rxqu = asyncio.Queue()
+
+        proxy.muxtasks[self.iden] = self
+
+    async def tx(self, mesg):
+
+        if self.isfini:
+            raise s_exc.IsFini()
+
+        name, info = mesg
+        await self.proxy.link.tx((name, dict(info, task=self.iden)))
+
+    async def rx(self):
+        return await self.rxqu.get()
+
+    def feed(self, mesg):
+        self.rxqu.put_nowait(mesg)
+
+    async def fini(self):
+
+        if self.isfini:
+            return
+
+        self.isfini = True
+        self.rxqu.put_nowait(None)
+
+        self.proxy.muxtasks.pop(self.iden, None)
+
+        # let the server know we abandoned the task
+        if not self.done and not self.proxy.link.isfini:
+            await self.proxy.link.tx(('t2:cancel', {'task': self.iden}))
+
 class Share(s_base.Base):
     '''
     The telepath client side of a dynamically shared object.
@@ -255,6 +306,11 @@ class Proxy(s_base.Base):
         self.links = collections.deque()
         self._link_poolsize = 4
 
+        # multiplex task v2 calls over self.link if the server supports it
+        self.muxinfo = None
+        self.muxtasks = {}
+        self._link_mux = False
+
         self.synack = None
         self.syndone = asyncio.Event()
 
@@ -262,6 +318,13 @@ class Proxy(s_base.Base):
             'task:fini': self._onTaskFini,
             'share:data': self._onShareData,
             'share:fini': self._onShareFini,
+
+            # multiplexed task version 2 API
+            't2:fini': self._onTaskV2Mesg,
+            't2:genr': self._onTaskV2Mesg,
+            't2:share': self._onTaskV2Mesg,
+            't2:yield': self._onTaskV2Mesg,
+            't2:yields': self._onTaskV2Mesg,
         }
 
         async def fini():
@@ -274,6 +337,9 @@ class Proxy(s_base.Base):
                 task.reply(mesg)
                 del self.tasks[name]
 
+            for task in list(self.muxtasks.values()):
+                await task.fini()
+
             for link in self.links:
                 await link.fini()
 
@@ -346,8 +412,21 @@ class Proxy(s_base.Base):
 
         return link
 
+    async def getTaskLink(self):
+        '''
+        Get a link (or multiplexed task) for a task v2 call.
+        '''
+        if self._link_mux and self.muxinfo is not None:
+            return MuxTask(self)
+
+        return await self.getPoolLink()
+
     async def _putPoolLink(self, link):
 
+        if isinstance(link, MuxTask):
+            link.done = True
+            return await link.fini()
+
         if link.isfini:
             return
 
@@ -386,6 +465,16 @@ class Proxy(s_base.Base):
         share.txfini = False
         await share.fini()
 
+    async def _onTaskV2Mesg(self, mesg):
+
+        iden = mesg[1].get('task')
+
+        task = self.muxtasks.get(iden)
+        if task is None:
+            return
+
+        task.feed(mesg)
+
     async def _onShareData(self, mesg):
 
         data = mesg[1].get('data')
@@ -421,14 +510,16 @@ class Proxy(s_base.Base):
         mesg = ('t2:init', {
                 'todo': todo,
                 'name': name,
-                'sess': self.sess})
+                'sess': self.sess,
+                'yields': {'credit': T2_YIELDS_CREDIT}})
 
-        link = await self.getPoolLink()
+        link = await self.getTaskLink()
 
         await link.tx(mesg)
 
         mesg = await link.rx()
         if mesg is None:
+            await link.fini()
             raise s_exc.LinkShutDown(mesg='Remote peer disconnected')
 
         if mesg[0] == 't2:fini':
@@ -448,6 +539,18 @@ class Proxy(s_base.Base):
                         if mesg is None:
                             return
 
+                        if mesg[0] == 't2:yields':
+
+                            for byts in mesg[1].get('items'):
+                                yield s_msgpack.un(byts)
+
+                            # stop like t2:yield would if the link was shut down while we yielded
+                            if link.isfini:
+                                return
+
+                            await link.tx(('t2:credit', {'frames': 1}))
+                            continue
+
                         assert mesg[0] == 't2:yield'
 
                         retn = mesg[1].get('retn')
@@ -515,6 +618,7 @@ class Proxy(s_base.Base):
             raise s_exc.LinkShutDown(mesg=mesg)
 
         self.sess = self.synack[1].get('sess')
+        self.muxinfo = self.synack[1].get('mux')
         self.sharinfo = self.synack[1].get('sharinfo', {})
         self.methinfo = self.sharinfo.get('meths', {})
 
@@ -599,6 +703,7 @@ class Client(s_base.Base):
         'timeout': 10,
         'retrysleep': 0.2,
         'link_poolsize': 4,
+        'link_mux': False,
     }
 
     '''
@@ -685,6 +790,7 @@ class Client(s_base.Base):
 
         self._t_proxy.onfini(fini)
         self._t_proxy._link_poolsize = self._t_conf.get('link_poolsize', 4)
+        self._t_proxy._link_mux = self._t_conf.get('link_mux', self._t_proxy._link_mux)
 
         if self._t_onlink is not None:
             await self._t_onlink(self._t_proxy)
@@ -968,6 +1074,13 @@ async def openurl(url, **opts):
     prox = await Proxy.anit(link, name)
     prox.onfini(link)
 
+    # the mux option may be given as a url query parameter such as ?mux=1
+    mux = info.get('mux')
+    if mux is None:
+        mux = info.get('query', {}).get('mux')
+
+    prox._link_mux = bool(s_common.intify(mux))
+
     try:
         await prox.handshake(auth=auth)
 
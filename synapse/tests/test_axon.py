@@ -1,5 +1,7 @@
+import asyncio
 import hashlib
 import logging
+import threading
 import unittest.mock as mock
 
 import synapse.exc as s_exc
@@ -7,6 +9,8 @@ import synapse.axon as s_axon
 import synapse.common as s_common
 import synapse.telepath as s_telepath
 
+import synapse.lib.coro as s_coro
+
 import synapse.tests.utils as s_t_utils
 
 logger = logging.getLogger(__name__)
@@ -65,6 +69,18 @@ class AxonTest(s_t_utils.SynTest):
 
         self.true(await axon.has(asdfhash))
 
+        logger.info('Range read test')
+
+        async def getRange(sha256, offs=None, size=None):
+            return b''.join([byts async for byts in axon.get(sha256, offs=offs, size=size)])
+
+        self.eq(b'df', await getRange(asdfhash, offs=2, size=2))
+        self.eq(b'asdf', await getRange(asdfhash, offs=4))
+        self.eq(b'asd', await getRange(asdfhash, size=3))
+        self.eq(b'', await getRange(asdfhash, offs=100))
+        self.eq(b'', await getRange(asdfhash, offs=2, size=0))
+        await self.asyncraises(s_exc.BadArg, getRange(asdfhash, offs=-1))
+
         logger.info('bbufhash test')
 
         self.false(await axon.has(bbufhash))
@@ -79,6 +95,12 @@ class AxonTest(s_t_utils.SynTest):
         self.true(await axon.has(bbufhash))
         await self.check_blob(axon, bbufhash)
 
+        # range reads spanning and seeking past chunk boundaries
+        offs = s_axon.CHUNK_SIZE - 3
+        self.eq(bbuf[offs:offs + 10], await getRange(bbufhash, offs=offs, size=10))
+        self.eq(bbuf[offs + 10:], await getRange(bbufhash, offs=offs + 10))
+        self.eq(bbuf[-4:], await getRange(bbufhash, offs=len(bbuf) - 4, size=100))
+
         self.eq((), await axon.wants((bbufhash, asdfhash)))
 
         logger.info('put() / puts() tests')
@@ -89,6 +111,13 @@ class AxonTest(s_t_utils.SynTest):
         retn = await axon.puts([abuf, bbuf])
         self.eq(retn, (asdfretn, bbufretn))
 
+        hashes = await axon.hashset(asdfhash)
+        self.eq(hashes.get('sha256'), s_common.ehex(asdfhash))
+        self.eq(hashes.get('md5'), hashlib.md5(abuf).hexdigest())
+        self.eq(hashes.get('sha1'), hashlib.sha1(abuf).hexdigest())
+        self.eq(hashes.get('sha512'), hashlib.sha512(abuf).hexdigest())
+        self.none(await axon.hashset(pennhash))
+
         logger.info('History and metrics')
 
         items = [x async for x in axon.hashes(0)]
@@ -163,6 +192,23 @@ class AxonTest(s_t_utils.SynTest):
         self.eq(67108899, info.get('size:bytes'))
         self.eq(6, info.get('file:count'))
 
+        logger.info('Bulk puts test')
+        bulk = [b'bulk%d' % i for i in range(100)]
+        bulkhashes = [hashlib.sha256(b).digest() for b in bulk]
+
+        retn = await axon.puts(bulk + [abuf, bulk[0]])
+        self.eq(retn[:100], [(len(b), h) for b, h in zip(bulk, bulkhashes)])
+        self.eq(retn[100:], (asdfretn, (len(bulk[0]), bulkhashes[0])))
+
+        self.eq((), await axon.wants(bulkhashes))
+        self.eq(b'bulk42', b''.join([b async for b in axon.get(bulkhashes[42])]))
+        self.eq(b'lk4', b''.join([b async for b in axon.get(bulkhashes[42], offs=2, size=3)]))
+        self.eq(hashlib.md5(b'bulk7').hexdigest(), (await axon.hashset(bulkhashes[7])).get('md5'))
+
+        info = await axon.metrics()
+        self.eq(67108899 + sum(len(b) for b in bulk), info.get('size:bytes'))
+        self.eq(106, info.get('file:count'))
+
         # When testing a local axon, we want to ensure that the FD was in fact fini'd
         if isinstance(fd, s_axon.UpLoad):
             self.true(fd.fd.closed)
@@ -177,6 +223,42 @@ class AxonTest(s_t_utils.SynTest):
             async with axon.getLocalProxy() as prox:
                 await self.runAxonTestBase(prox)
 
+    async def test_axon_upload_cancel(self):
+
+        async with self.getTestAxon() as axon:
+
+            upfd = await s_axon.UpLoad.anit(axon)
+
+            hashing = threading.Event()
+            release = threading.Event()
+
+            def update(byts):
+                hashing.set()
+                release.wait()
+
+            with mock.patch.object(s_axon, 'HASH_THREAD_SIZE', 1):
+                with mock.patch.object(upfd.hashset, 'update', update):
+
+                    task = asyncio.create_task(upfd.write(abuf))
+
+                    try:
+                        self.true(await s_coro.executor(hashing.wait, 6))
+
+                        # the bytes are written before they are hashed in a thread
+                        self.eq(8, upfd.size)
+                        self.eq(8, upfd.fd.tell())
+
+                        # the upload may be closed while the thread is still hashing
+                        task.cancel()
+                        await upfd.fini()
+                        self.true(upfd.fd.closed)
+
+                    finally:
+                        release.set()
+
+                    with self.raises(asyncio.CancelledError):
+                        await task
+
     async def test_axon_perms(self):
         async with self.getTestAxon() as axon:
             user = await axon.auth.addUser('user')
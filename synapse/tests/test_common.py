@@ -231,6 +231,19 @@ class CommonTest(s_t_utils.SynTest):
         s_common.spin(gen)
         self.eq(data, [c for c in s])
 
+    async def test_common_merggenr(self):
+
+        async def genr(*items):
+            for item in items:
+                yield item
+
+        genrs = [genr(1, 4, 7), genr(), genr(2, 3, 8), genr(5)]
+        self.eq([1, 2, 3, 4, 5, 7, 8], [x async for x in s_common.merggenr(genrs)])
+
+        genrs = [genr(('b', 0), ('c', 0)), genr(('a', 1), ('b', 1))]
+        retn = [x async for x in s_common.merggenr(genrs, key=lambda x: x[0])]
+        self.eq([('a', 1), ('b', 0), ('b', 1), ('c', 0)], retn)
+
     def test_common_config(self):
 
         confdefs = (
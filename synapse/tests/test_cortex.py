@@ -13,6 +13,7 @@ import synapse.cortex as s_cortex
 import synapse.lib.coro as s_coro
 import synapse.lib.node as s_node
 import synapse.lib.layer as s_layer
+import synapse.lib.parser as s_parser
 import synapse.lib.version as s_version
 
 import synapse.tools.backup as s_tools_backup
@@ -44,6 +45,45 @@ class CortexTest(s_t_utils.SynTest):
             self.len(1, nodes)
             self.eq(nodes[0].ndef, ('inet:dns:a', ('woot.com', 0x01020304)))
 
+    async def test_cortex_storm_query_cache(self):
+
+        text = 'inet:ipv4=1.2.3.4 | limit 10'
+
+        with self.getTestDir() as dirn:
+
+            async with await s_cortex.Cortex.anit(dirn) as core:
+                query = core.getStormQuery(text)
+                self.eq(text, query.text)
+                self.nn(core.queryslab.get(s_common.buid(text), db=core.querydb))
+
+                # the AST memoized by the parser is shared by every cortex in the process
+                self.false(query is s_parser.parseQuery(text))
+
+            async with await s_cortex.Cortex.anit(dirn) as core:
+
+                # the persisted AST is used rather than parsing the query again
+                with patch('synapse.lib.parser.parseQuery') as parse:
+                    query = core.getStormQuery(text)
+                    parse.assert_not_called()
+
+                self.eq(text, query.text)
+                self.len(1, await core.nodes('[ inet:ipv4=1.2.3.4 ]'))
+                self.len(1, await core.nodes(text))
+
+                with patch('synapse.cortex.STORM_QUERY_CACHE_SIZE', 10):
+                    for i in range(20):
+                        core.getStormQuery(f'inet:ipv4={i}')
+                    self.le(core.queryslab.stat(db=core.querydb)['entries'], 10)
+
+                # queries which can not be packed are still parsed and run uncached
+                text = '$x=$(123456789012345678901234567890 + 1) return($x)'
+                self.eq(123456789012345678901234567891, await core.callStorm(text))
+                self.none(core.queryslab.get(s_common.buid(text), db=core.querydb))
+
+                query = core.getStormQuery(text)
+                self.false(query is s_parser.parseQuery(text))
+                self.false(hasattr(s_parser.parseQuery(text), 'core'))
+
     async def test_cortex_edges(self):
 
         async with self.getTestCore() as core:
@@ -3701,6 +3741,26 @@ class CortexBasicTest(s_t_utils.SynTest):
             mesgs = await core.stormlist(q)
             self.stormIsInPrint('1bar', mesgs)
 
+    async def test_cortex_snapshot_counts(self):
+
+        with self.getTestDir() as dirn:
+
+            path00 = s_common.gendir(dirn, 'core00')
+            path01 = s_common.genpath(dirn, 'core01')
+
+            async with await s_cortex.Cortex.anit(dirn=path00) as core00:
+
+                await core00.nodes('[ inet:ipv4=1.2.3.4 inet:ipv4=5.6.7.8 inet:fqdn=vertex.link ]')
+
+                # the hot counts have not been flushed by the sync loop yet
+                counts = await core00.getFormCounts()
+                self.eq(2, counts.get('inet:ipv4'))
+
+                await core00.saveSnapshot(path01)
+
+            async with await s_cortex.Cortex.anit(dirn=path01) as core01:
+                self.eq(counts, await core01.getFormCounts())
+
     async def test_cortex_mirror(self):
 
         with self.getTestDir() as dirn:
@@ -114,3 +114,32 @@ class CryoTest(s_t_utils.SynTest):
                 self.eq(tank.slab.mapsize, s_const.mebibyte * 64)
                 _, conf = await cryo.hive.get(('cryo', 'names', 'conftest'))
                 self.eq(conf, {'map_size': s_const.mebibyte * 64})
+
+    async def test_cryo_batches(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_cryotank.CryoTank.anit(dirn) as tank:
+
+                items = [{'foo': i, 'bar': 'x' * i} for i in range(10)]
+                items.append(('baz', 10))
+
+                await tank.puts(items)
+
+                batches = await alist(tank.batches(2, size=5, batch=2))
+                self.len(3, batches)
+
+                rows = [row for byts in batches for row in s_cryotank.unpackBatch(byts)]
+                self.eq(rows, [(i, items[i]) for i in range(2, 7)])
+
+                batches = await alist(tank.batches(8, batch=10, fields=('foo', 'newp')))
+                self.len(1, batches)
+                rows = s_cryotank.unpackBatch(batches[0])
+                self.eq(rows, [(8, {'foo': 8}), (9, {'foo': 9}), (10, ('baz', 10))])
+
+                self.len(0, await alist(tank.batches(0, size=0)))
+                self.len(0, await alist(tank.batches(20)))
+
+                iden = s_common.guid()
+                await alist(tank.batches(4, iden=iden))
+                self.eq(4, tank.getOffset(iden))
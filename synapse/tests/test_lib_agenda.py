@@ -182,6 +182,7 @@ class AgendaTest(s_t_utils.SynTest):
         with mock.patch.object(loop, 'time', looptime), mock.patch('time.time', timetime), self.getTestDir() as dirn:
             core = mock.Mock()
             core.eval = myeval
+            core.conf = {}
             core.slab = await s_lmdbslab.Slab.anit(dirn, map_size=s_t_utils.TEST_MAP_SIZE, readonly=False)
             db = core.slab.initdb('hive')
             core.hive = await s_hive.SlabHive.anit(core.slab, db=db)
@@ -495,3 +496,70 @@ class AgendaTest(s_t_utils.SynTest):
 
                 await newb.addRule((True, ('cron', 'del')))
                 await proxy.delCronJob(cron1_iden)
+
+    async def test_agenda_limits(self):
+
+        conf = {'cron:maxjobs': 2, 'cron:maxjobs:user': 1}
+        async with self.getTestCore(conf=conf) as core:
+
+            root = await core.auth.getUserByName('root')
+            visi = await core.auth.addUser('visi')
+            newb = await core.auth.addUser('newb')
+
+            appts = []
+            for user in (root, root, visi, newb):
+                cdef = {'storm': 'inet:ipv4', 'reqs': {'hour': 2}, 'creator': user.iden}
+                cdef = await core.addCronJob(cdef)
+                appts.append(await core.agenda.get(cdef.get('iden')))
+
+            evnt = asyncio.Event()
+            started = []
+
+            async def runJobQuery(user, appt):
+                started.append(appt.iden)
+                await evnt.wait()
+
+            with mock.patch.object(core.agenda, '_runJobQuery', runJobQuery):
+
+                tasks = [
+                    core.schedCoro(core.agenda._runJob(root, appts[0])),
+                    core.schedCoro(core.agenda._runJob(root, appts[1])),
+                    core.schedCoro(core.agenda._runJob(visi, appts[2])),
+                    core.schedCoro(core.agenda._runJob(newb, appts[3])),
+                ]
+
+                await asyncio.sleep(0.1)
+
+                # the second root job waits on the user limit and newb waits on the global limit
+                self.eq(started, [appts[0].iden, appts[2].iden])
+                self.true(all(appt.isrunning for appt in appts))
+
+                evnt.set()
+                await asyncio.gather(*tasks)
+
+                self.sorteq(started, [appt.iden for appt in appts])
+                self.false(any(appt.isrunning for appt in appts))
+
+    async def test_agenda_runtimes(self):
+
+        async with self.getTestCore() as core:
+
+            msgs = await core.stormlist('cron.add --hourly 30 --spawn {inet:ipv4}')
+            self.stormIsInPrint('Created cron job', msgs)
+
+            appt = core.agenda.list()[0][1]
+            self.true(appt.spawn)
+            self.eq(appt.runtimes, [0] * (len(s_agenda.RUNTIME_BUCKETS) + 1))
+
+            appt.addRunTime(0.5)
+            appt.addRunTime(30)
+            appt.addRunTime(99999)
+            self.eq(appt.runtimes, [1, 0, 1, 0, 0, 0, 0, 1])
+
+            newp = s_agenda._Appt.unpack(core.agenda, appt.pack())
+            self.true(newp.spawn)
+            self.eq(newp.runtimes, appt.runtimes)
+
+            msgs = await core.stormlist(f'cron.stat {appt.iden[:6]}')
+            self.stormIsInPrint('spawn:           Y', msgs)
+            self.stormIsInPrint('run times:       0-1s: 1, 10-60s: 1, >14400s: 1', msgs)
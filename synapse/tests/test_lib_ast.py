@@ -1,9 +1,12 @@
 import json
+import asyncio
+from unittest import mock
 
 import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.ast as s_ast
+import synapse.lib.snap as s_snap
 
 import synapse.tests.utils as s_test
 
@@ -477,6 +480,282 @@ class AstTest(s_test.SynTest):
             self.len(1, nodes)
             self.eq('geo:nloc', nodes[0].ndef[0])
 
+    async def test_ast_pivot_window(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('[ inet:dns:a=(woot.com, 1.2.3.4) inet:dns:a=(woot.com, 5.6.7.8) ]')
+            await core.nodes('[ inet:dns:a=(vertex.link, 1.2.3.4) inet:dns:a=(newp.com, 9.9.9.9) ]')
+
+            with mock.patch('synapse.lib.ast.PIVOT_WINDOW_SIZE', 2):
+
+                nodes = await core.nodes('inet:fqdn=woot.com inet:fqdn=vertex.link -> inet:dns:a')
+                self.len(3, nodes)
+
+                nodes = await core.nodes('inet:ipv4=1.2.3.4 -> inet:dns:a -> inet:fqdn')
+                self.sorteq(['vertex.link', 'woot.com'], [n.ndef[1] for n in nodes])
+
+                # each inbound node is forked into its own path even when the pivot values are deduplicated
+                q = 'inet:dns:a:fqdn=woot.com $ipv4=:ipv4 :fqdn -> inet:fqdn $lib.print("ipv4={x}", x=$ipv4)'
+                msgs = await core.stormlist(q)
+                self.len(2, [m for m in msgs if m[0] == 'node'])
+                self.stormIsInPrint(f'ipv4={0x01020304}', msgs)
+                self.stormIsInPrint(f'ipv4={0x05060708}', msgs)
+
+                nodes = await core.nodes('inet:fqdn=woot.com <- * +inet:dns:a')
+                self.len(2, nodes)
+
+                nodes = await core.nodes('inet:ipv4 -+> inet:dns:a')
+                self.len(7, nodes)
+
+            # upstream edits do not run far ahead of the window being filled
+            async with await core.snap() as snap:
+                for i in range(40):
+                    await snap.addNode('inet:dns:a', ('seen.com', i))
+
+            with mock.patch('synapse.lib.ast.PIVOT_WINDOW_SIZE', 10):
+
+                # the inbound nodes may only run ahead of the window while downstream is slow
+                q = 'inet:ipv4 [ +#seen ] -> inet:dns:a | sleep 0.2 | limit 2'
+                self.len(2, await core.nodes(q))
+                self.le(len(await core.nodes('#seen')), 12)
+
+            # pivots are not held back while the inbound nodes are slow to arrive
+            await core.nodes('queue.add pivq')
+            await core.nodes('$lib.queue.get(pivq).put(woot.com)')
+
+            q = 'for ($offs, $fqdn) in $lib.queue.get(pivq).gets(wait=$lib.true) { inet:fqdn=$fqdn } -> inet:dns:a'
+            genr = core.storm(q)
+
+            async def nextnode():
+                async for mesg in genr:
+                    if mesg[0] == 'node':
+                        return mesg[1]
+
+            nodes = [await asyncio.wait_for(nextnode(), timeout=5) for _ in range(2)]
+            self.sorteq([0x01020304, 0x05060708], [n[1]['props']['ipv4'] for n in nodes])
+
+            await genr.aclose()
+
+            # the inbound generator is cleaned up before the pivot returns and its errors are raised
+            async with await core.snap() as snap:
+                with snap.getStormRuntime() as runt:
+
+                    node = await snap.getNodeByNdef(('inet:fqdn', 'woot.com'))
+                    oper = s_ast.PivotOper(isjoin=True)
+
+                    async def addfunc(window, node, path):
+                        pass
+
+                    closed = []
+
+                    async def inbound():
+                        try:
+                            yield node, None
+                            await asyncio.Event().wait()
+                        finally:
+                            await asyncio.sleep(0)
+                            closed.append(True)
+
+                    pivs = oper.runPivotWindows(runt, inbound(), addfunc)
+                    async for item in pivs:
+                        break
+
+                    await pivs.aclose()
+                    self.eq([True], closed)
+
+                    async def failing():
+                        yield node, None
+                        raise s_exc.BadArg(mesg='newp')
+
+                    with self.raises(s_exc.BadArg):
+                        [item async for item in oper.runPivotWindows(runt, failing(), addfunc)]
+
+    async def test_ast_lift_planner(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('''
+                for $asn in (0, 1, 2, 3) {
+                    for $i in (0, 1, 2, 3, 4) { [ inet:ipv4=$($i * 4 + $asn) :asn=$asn ] }
+                }
+            ''')
+            await core.nodes('inet:ipv4=1 inet:ipv4=2 [ +#rare.tag :loc=us ]')
+            await core.nodes('inet:ipv4=3 [ +#rare.tag ]')
+
+            layr = core.getLayer()
+            self.eq(20, layr.getPropCount('inet:ipv4', 'asn'))
+            self.eq(3, layr.getTagCount('rare.tag', 'inet:ipv4'))
+
+            q = s_ast.LiftProp.getLiftPlan
+
+            lifts = []
+            async def getLiftPlan(self, runt, form, hints, filt=None):
+                genr = await q(self, runt, form, hints, filt=filt)
+                lifts.append(genr.__name__)
+                return genr
+
+            with mock.patch('synapse.lib.ast.LiftProp.getLiftPlan', getLiftPlan):
+
+                nodes = await core.nodes('inet:ipv4 +#rare.tag +:asn=1')
+                self.eq([1], [n.ndef[1] for n in nodes])
+                self.eq(['nodesByTag'], lifts)
+
+                lifts.clear()
+                nodes = await core.nodes('inet:ipv4 +:asn=3 +:loc=us')
+                self.eq([], nodes)
+                self.eq(['nodesByPropValu'], lifts)
+
+                lifts.clear()
+                nodes = await core.nodes('inet:ipv4 +:loc')
+                self.sorteq([1, 2], [n.ndef[1] for n in nodes])
+                self.eq(['nodesByProp'], lifts)
+
+                # the form lift remains the most selective
+                lifts.clear()
+                nodes = await core.nodes('inet:ipv4 +:asn>=0')
+                self.len(20, nodes)
+                self.eq(['nodesByProp'], lifts)
+
+                # a probe which reaches the sample limit does not replace the form lift
+                with mock.patch('synapse.lib.ast.PLAN_PROBE_LIMIT', 3):
+
+                    lifts.clear()
+                    nodes = await core.nodes('inet:ipv4 +:asn=1')
+                    self.len(5, nodes)
+                    self.eq(['nodesByProp'], lifts)
+
+                    # a later hint which is under the limit may still be used
+                    lifts.clear()
+                    nodes = await core.nodes('inet:ipv4 +:asn=1 +:loc=us')
+                    self.eq([1], [n.ndef[1] for n in nodes])
+                    self.eq(['nodesByPropValu'], lifts)
+
+                # hints are not used through a non-filter operation
+                lifts.clear()
+                nodes = await core.nodes('inet:ipv4 | limit 5 | +#rare.tag')
+                self.eq([], lifts)
+
+                # and conditions may combine hints with an or which has none
+                nodes = await core.nodes('inet:ipv4 +(:asn=1 and (:loc or #rare.tag))')
+                self.eq([1], [n.ndef[1] for n in nodes])
+
+                nodes = await core.nodes('inet:ipv4 +(#rare.tag and (:asn=1 or :asn=2))')
+                self.sorteq([1, 2], [n.ndef[1] for n in nodes])
+
+            await core.nodes('inet:ipv4=1 [ -#rare.tag -:loc ]')
+            self.eq(2, layr.getTagCount('rare.tag', 'inet:ipv4'))
+            self.eq(1, layr.getPropCount('inet:ipv4', 'loc'))
+
+            await self.asyncraises(s_exc.BadTypeValu, core.nodes('inet:ipv4 +:asn=newp'))
+
+    async def test_ast_lift_count(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('$i = 0 while $($i < 20) { [ inet:fqdn=$lib.str.format("{i}.foo.com", i=$i) ] $i = $($i + 1) }')
+            await core.nodes('inet:fqdn=1.foo.com inet:fqdn=2.foo.com [ +#rare ]')
+            await core.nodes('[ inet:dns:a=(1.foo.com, 1.2.3.4) ]')
+
+            joins = []
+            join = s_snap.Snap._joinStorNodes
+
+            async def joinStorNodes(self, buids):
+                joins.extend(buids)
+                async for node in join(self, buids):
+                    yield node
+
+            with mock.patch('synapse.lib.snap.Snap._joinStorNodes', joinStorNodes):
+
+                # the 20 fqdns plus the auto created foo.com and com nodes
+                self.eq(22, await core.count('inet:fqdn'))
+                self.eq(21, await core.count('inet:fqdn:zone=foo.com | count'))
+                self.eq(20, await core.count('inet:fqdn=*.foo.com'))
+                self.eq(2, await core.count('#rare'))
+                self.eq(2, await core.count('inet:fqdn#rare'))
+                self.eq(1, await core.count('inet:dns:a:fqdn=$fqdn', opts={'vars': {'fqdn': '1.foo.com'}}))
+                self.eq(0, await core.count('inet:fqdn:zone=newp.com'))
+                self.eq([], joins)
+
+                # anything other than a lone lift is run to be counted
+                self.eq(1, await core.count('inet:fqdn:zone=foo.com +{ -> inet:dns:a }'))
+                self.len(21, joins)
+
+                joins.clear()
+                self.eq(1, await core.count('inet:fqdn#rare +{ -> inet:dns:a }'))
+                self.len(2, joins)
+
+                joins.clear()
+                self.eq(3, await core.count('inet:fqdn:zone=foo.com | limit 3'))
+
+                # the inbound nodes are yielded before the lifted nodes
+                opts = {'ndefs': [('inet:fqdn', 'foo.com')]}
+                self.eq(23, await core.count('inet:fqdn', opts=opts))
+                self.len(23, await core.nodes('inet:fqdn', opts=opts))
+
+            nodes = await core.nodes('inet:fqdn:zone=foo.com -{ -> inet:dns:a }')
+            self.len(20, nodes)
+
+            nodes = await core.nodes('inet:dns:a +{ :fqdn -> inet:fqdn } +{ -> * } -{ :ipv4 -> inet:asn }')
+            self.len(1, nodes)
+
+            # join pivots still yield the inbound node
+            nodes = await core.nodes('inet:fqdn=3.foo.com +{ -+> inet:dns:a }')
+            self.len(1, nodes)
+
+            await self.asyncraises(s_exc.NoSuchProp, core.count('inet:newp'))
+
+    async def test_ast_filter_pushdown(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('$i = 0 while $($i < 20) { [ inet:fqdn=$lib.str.format("{i}.foo.com", i=$i) ] $i = $($i + 1) }')
+            await core.nodes('$i = 0 while $($i < 3) { [ inet:fqdn=$lib.str.format("{i}.bar.com", i=$i) ] $i = $($i + 1) }')
+            await core.nodes('inet:fqdn=1.foo.com inet:fqdn=2.bar.com [ +#rare ]')
+
+            joins = []
+            join = s_snap.Snap._joinStorNodes
+
+            async def joinStorNodes(self, buids):
+                joins.extend(buids)
+                async for node in join(self, buids):
+                    yield node
+
+            with mock.patch('synapse.lib.snap.Snap._joinStorNodes', joinStorNodes):
+
+                # the three bar.com subdomains plus bar.com itself
+                nodes = await core.nodes('inet:fqdn +(:zone=bar.com or :zone=baz.com)')
+                self.len(4, nodes)
+                self.len(4, joins)
+
+                joins.clear()
+                nodes = await core.nodes('inet:fqdn#rare -:zone=foo.com')
+                self.eq(['2.bar.com'], [n.ndef[1] for n in nodes])
+                self.len(1, joins)
+
+                joins.clear()
+                nodes = await core.nodes('inet:fqdn=*.foo.com +:zone +inet:fqdn:zone=bar.com')
+                self.len(0, nodes)
+                self.len(0, joins)
+
+                # filters which require the node stop the pushdown
+                joins.clear()
+                nodes = await core.nodes('inet:fqdn=*.bar.com +#rare +:zone=foo.com')
+                self.len(0, nodes)
+                self.len(3, joins)
+
+                joins.clear()
+                nodes = await core.nodes('inet:fqdn#rare +:zone=$zone', opts={'vars': {'zone': 'foo.com'}})
+                self.len(1, nodes)
+                self.len(2, joins)
+
+            # bad values are still only raised by filtering a node
+            nodes = await core.nodes('inet:fqdn:zone=newp.com +:zone="@@"')
+            self.len(0, nodes)
+
+            with self.raises(s_exc.BadTypeValu):
+                await core.nodes('inet:fqdn#rare +:zone="@@"')
+
     async def test_ast_lift_filt_array(self):
 
         async with self.getTestCore() as core:
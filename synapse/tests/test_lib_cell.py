@@ -1,11 +1,14 @@
 import os
 import asyncio
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 import synapse.telepath as s_telepath
 
 import synapse.lib.cell as s_cell
+import synapse.lib.lmdbslab as s_lmdbslab
 
 import synapse.tests.utils as s_t_utils
 
@@ -437,6 +440,123 @@ class CellTest(s_t_utils.SynTest):
                 self.false(yielded)
                 self.eq(data, [])
 
+    async def test_cell_snapshot(self):
+
+        with self.getTestDir() as dirn:
+
+            dir0 = s_common.genpath(dirn, 'cell00')
+            dir1 = s_common.genpath(dirn, 'cell01')
+
+            conf = {'nexslog:en': True}
+            async with await s_cell.Cell.anit(dir0, conf=conf) as cell00:
+
+                await cell00.auth.addUser('visi')
+
+                offs = cell00.nexsroot.getSnapOffs()
+                self.eq(offs, await cell00.saveSnapshot(s_common.genpath(dirn, 'snap00')))
+
+                # the mirror starts from the snapshot and tails the log
+                url = cell00.getLocalUrl()
+                await s_cell.bootMirror(url, dir1)
+
+                with self.raises(s_exc.BadArg):
+                    await s_cell.bootMirror(url, dir1)
+
+                await cell00.auth.addUser('newp')
+
+                async with await s_cell.Cell.anit(dir1, conf=conf) as cell01:
+
+                    self.eq(cell00.iden, cell01.iden)
+                    self.nn(await cell01.auth.getUserByName('visi'))
+                    self.eq(offs, cell01.nexsroot._nexuslog.index())
+
+                    await cell01.nexsroot.setLeader(url, cell01.iden)
+                    await cell01.nexsroot._nexuslog.waitForOffset(cell00.nexsroot._nexuslog.index() - 1, timeout=6)
+                    self.nn(await cell01.auth.getUserByName('newp'))
+
+                    acks = cell00.getNexusAcks()
+                    self.eq(acks, {cell01.nexsroot.getMirrorIden(): offs})
+
+                    # entries the mirror has not acknowledged are retained
+                    self.eq(offs - 1, await cell00.cullNexsLog())
+
+                    cell00.delNexusAck(cell01.nexsroot.getMirrorIden())
+                    self.lt(offs - 1, await cell00.cullNexsLog())
+
+                # a snapshot taken while changes are being made contains exactly the changes before its offset
+                names = [f'user{i:02d}' for i in range(20)]
+                dir2 = s_common.genpath(dirn, 'snap02')
+
+                for name in names[:10]:
+                    await cell00.auth.addUser(name)
+
+                tasks = []
+                begin = s_lmdbslab.SnapCopy.begin
+
+                async def beginAndAdd(self):
+                    # changes made while the snapshot is starting wait until its transactions are open
+                    tasks.extend(asyncio.create_task(cell00.auth.addUser(name)) for name in names[10:])
+                    await asyncio.sleep(0)
+                    return await begin(self)
+
+                with mock.patch('synapse.lib.lmdbslab.SnapCopy.begin', beginAndAdd):
+                    offs = await cell00.saveSnapshot(dir2)
+
+                await asyncio.gather(*tasks)
+
+                before = set()
+                for indx, item in cell00.nexsroot._nexuslog.iter(0):
+                    if indx < offs:
+                        before.update(name for name in names if name in str(item[2]))
+
+                self.len(10, before)
+
+                async with await s_cell.Cell.anit(dir2, conf=conf) as cell02:
+                    self.eq(offs, cell02.nexsroot._nexuslog.index())
+                    self.eq(offs, cell02.nexsroot._nexsmeta.get('applied'))
+
+                    users = set()
+                    for name in names:
+                        if await cell02.auth.getUserByName(name) is not None:
+                            users.add(name)
+
+                    self.eq(before, users)
+
+    async def test_cell_mirror_noack(self):
+
+        with self.getTestDir() as dirn:
+
+            dir0 = s_common.genpath(dirn, 'cell00')
+            dir1 = s_common.genpath(dirn, 'cell01')
+
+            conf = {'nexslog:en': True}
+            async with await s_cell.Cell.anit(dir0, conf=conf) as cell00:
+
+                await cell00.auth.addUser('visi')
+
+                url = cell00.getLocalUrl()
+                await s_cell.bootMirror(url, dir1)
+
+                # a leader from before mirror acks were added
+                with mock.patch.object(s_cell.CellApi, 'setNexusAck', None):
+
+                    async with await s_cell.Cell.anit(dir1, conf=conf) as cell01:
+
+                        with self.getLoggerStream('synapse.lib.nexus') as stream:
+
+                            await cell01.nexsroot.setLeader(url, cell01.iden)
+                            await cell00.auth.addUser('newp')
+
+                            # the mirror keeps following the leader without acking
+                            await cell01.nexsroot._nexuslog.waitForOffset(cell00.nexsroot._nexuslog.index() - 1, timeout=6)
+                            self.nn(await cell01.auth.getUserByName('newp'))
+                            self.eq({}, cell00.getNexusAcks())
+
+                        stream.seek(0)
+                        mesgs = stream.read()
+                        self.isin('does not support mirror acks', mesgs)
+                        self.notin('error in initCoreMirror loop', mesgs)
+
     async def test_cell_authv2(self):
 
         async with self.getTestCore() as core:
@@ -5,9 +5,11 @@ import lark  # type: ignore
 
 import synapse.exc as s_exc
 
+import synapse.lib.ast as s_ast
 import synapse.lib.parser as s_parser
 import synapse.lib.datfile as s_datfile
 import synapse.lib.grammar as s_grammar
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_t_utils
 
@@ -1071,6 +1073,15 @@ class GrammarTest(s_t_utils.SynTest):
             tree = parser.query()
             self.eq(str(tree), _ParseResults[i])
 
+    def test_parser_pack(self):
+
+        for i, query in enumerate(_Queries):
+            item = s_msgpack.un(s_msgpack.en(s_parser.parseQuery(query).pack()))
+            self.eq(str(s_ast.unpack(item)), _ParseResults[i])
+
+        with self.raises(s_exc.BadArg):
+            s_ast.unpack(('Parser', {}, ()))
+
     def test_cmdrargs(self):
         q = '''add {inet:fqdn | graph 2 --filter { -#nope } } inet:f-M +1 { [ graph:node='*' :type=m1]}'''
         correct = (
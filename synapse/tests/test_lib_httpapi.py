@@ -3,8 +3,10 @@ import asyncio
 import aiohttp
 
 import synapse.lib.httpapi as s_httpapi
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_tests
+from synapse.tests.utils import alist
 
 class HttpApiTest(s_tests.SynTest):
 
@@ -770,6 +772,44 @@ class HttpApiTest(s_tests.SynTest):
 
                     self.eq(0x01020304, node[0][1])
 
+                # clients may negotiate a buffered msgpack stream
+                body = {'query': '[ inet:ipv4=1.2.3.4 inet:ipv4=5.6.7.8 ]'}
+                headers = {'Accept': 'application/json, application/x-msgpack; q=0.9'}
+
+                async with sess.post(f'https://localhost:{port}/api/v1/storm/nodes', json=body, headers=headers) as resp:
+
+                    self.eq(s_httpapi.MSGPACK_CONTENT_TYPE, resp.headers.get('Content-Type'))
+
+                    unpk = s_msgpack.Unpk()
+                    podes = [item for byts, x in await alist(resp.content.iter_chunks()) for size, item in unpk.feed(byts)]
+                    self.eq((0x01020304, 0x05060708), [pode[0][1] for pode in podes])
+
+                async with sess.post(f'https://localhost:{port}/api/v1/storm', json=body, headers=headers) as resp:
+
+                    self.eq(s_httpapi.MSGPACK_CONTENT_TYPE, resp.headers.get('Content-Type'))
+
+                    unpk = s_msgpack.Unpk()
+                    mesgs = [item for byts, x in await alist(resp.content.iter_chunks()) for size, item in unpk.feed(byts)]
+                    self.eq('init', mesgs[0][0])
+                    self.eq('fini', mesgs[-1][0])
+                    self.len(2, [m for m in mesgs if m[0] == 'node'])
+
+                # buffered messages are flushed while the query is waiting
+                await core.nodes('$lib.queue.add(hold)')
+                body = {'query': '($offs, $valu) = $lib.queue.get(hold).get() $lib.print($valu)'}
+
+                async with sess.post(f'https://localhost:{port}/api/v1/storm', json=body, headers=headers) as resp:
+
+                    unpk = s_msgpack.Unpk()
+                    mesgs = [item for size, item in unpk.feed(await asyncio.wait_for(resp.content.readany(), timeout=5))]
+                    self.eq('init', mesgs[0][0])
+
+                    await core.nodes('$lib.queue.get(hold).put(released)')
+
+                    mesgs.extend([item for byts, x in await alist(resp.content.iter_chunks()) for size, item in unpk.feed(byts)])
+                    self.isin(('print', {'mesg': 'released'}), mesgs)
+                    self.eq('fini', mesgs[-1][0])
+
     async def test_healthcheck(self):
         async with self.getTestCore() as core:
             # Run http instead of https for this test
@@ -1,6 +1,9 @@
 import math
 import asyncio
 import contextlib
+from unittest import mock
+
+import regex
 
 import synapse.exc as s_exc
 import synapse.common as s_common
@@ -531,59 +534,59 @@ class LayerTest(s_t_utils.SynTest):
                 layr.layrslab.put(key[0], val, db=tmpdb)
 
             # = -99999.9
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '=', -99999.9)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '=', -99999.9)]
             self.eq(retn, [-99999.9])
 
             # <= -99999.9
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '<=', -99999.9)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '<=', -99999.9)]
             self.eq(retn, [-math.inf, -99999.9])
 
             # < -99999.9
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '<', -99999.9)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '<', -99999.9)]
             self.eq(retn, [-math.inf])
 
             # > 99999.9
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '>', 99999.9)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '>', 99999.9)]
             self.eq(retn, [math.inf])
 
             # >= 99999.9
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '>=', 99999.9)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '>=', 99999.9)]
             self.eq(retn, [99999.9, math.inf])
 
             # <= 0.0
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '<=', 0.0)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '<=', 0.0)]
             self.eq(retn, [-math.inf, -99999.9, -42.1, -0.0000000001, -0.0, 0.0])
 
             # >= -0.0
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '>=', -0.0)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '>=', -0.0)]
             self.eq(retn, [-0.0, 0.0, 0.000001, 42.1, 99999.9, math.inf])
 
             # >= -42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '>=', -42.1)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '>=', -42.1)]
             self.eq(retn, [-42.1, -0.0000000001, -0.0, 0.0, 0.000001, 42.1, 99999.9, math.inf])
 
             # > -42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '>', -42.1)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '>', -42.1)]
             self.eq(retn, [-0.0000000001, -0.0, 0.0, 0.000001, 42.1, 99999.9, math.inf])
 
             # < 42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '<', 42.1)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '<', 42.1)]
             self.eq(retn, [-math.inf, -99999.9, -42.1, -0.0000000001, -0.0, 0.0, 0.000001])
 
             # <= 42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, '<=', 42.1)]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, '<=', 42.1)]
             self.eq(retn, [-math.inf, -99999.9, -42.1, -0.0000000001, -0.0, 0.0, 0.000001, 42.1])
 
             # -42.1 to 42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, 'range=', (-42.1, 42.1))]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, 'range=', (-42.1, 42.1))]
             self.eq(retn, [-42.1, -0.0000000001, -0.0, 0.0, 0.000001, 42.1])
 
             # 1 to 42.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, 'range=', (1.0, 42.1))]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, 'range=', (1.0, 42.1))]
             self.eq(retn, [42.1])
 
             # -99999.9 to -0.1
-            retn = [s_msgpack.un(valu) async for valu in stor.indxBy(indxby, 'range=', (-99999.9, -0.1))]
+            retn = [s_msgpack.un(buid) async for _, buid in stor.indxBy(indxby, 'range=', (-99999.9, -0.1))]
             self.eq(retn, [-99999.9, -42.1])
 
             # <= NaN
@@ -747,6 +750,41 @@ class LayerTest(s_t_utils.SynTest):
                     for nodeedit in layr.nodeeditlog.sliceBack(lastoffs, 2):
                         self.eq(meta, nodeedit[1][1])
 
+                    # consecutive edits entries may be applied (and logged) in a single pass
+                    await layr.truncate()
+
+                    offs = layr.nodeeditlog.index()
+                    results = await layr._storNodeEditsBatch([((nodeedits, meta), {}) for nodeedits in editlist])
+                    self.len(len(editlist), results)
+                    self.eq(offs + len(editlist), layr.nodeeditlog.index())
+
+                    # the entries applied before a failing entry are still logged
+                    await layr.truncate()
+
+                    offs = layr.nodeeditlog.index()
+                    apply = layr._applyNodeEdits
+
+                    async def applyNodeEdits(nodeedits):
+                        if nodeedits is editlist[1]:
+                            raise s_exc.SynErr(mesg='newp')
+                        return await apply(nodeedits)
+
+                    with mock.patch.object(layr, '_applyNodeEdits', applyNodeEdits):
+                        with self.raises(s_exc.SynErr):
+                            await layr._storNodeEditsBatch([((nodeedits, meta), {}) for nodeedits in editlist])
+
+                    self.eq(offs + 1, layr.nodeeditlog.index())
+                    self.eq(editlist[0][0][0], layr.nodeeditlog.last()[1][0][0][0])
+
+                    await layr._storNodeEditsBatch([((nodeedits, meta), {}) for nodeedits in editlist])
+
+                    nodelist1 = []
+                    nodelist1.extend(await core1.nodes('test:str'))
+                    nodelist1.extend(await core1.nodes('inet:ipv4'))
+
+                    nodelist1 = [node.pack() for node in nodelist1]
+                    self.eq(nodelist0, nodelist1)
+
     async def test_layer_form_by_buid(self):
 
         async with self.getTestCore() as core:
@@ -850,6 +888,19 @@ class LayerTest(s_t_utils.SynTest):
             self.false(await layr.hasTagProp('score'))
             nodes = await core.nodes('[test:str=bar +#test:score=100]')
 
+            buids = [buid, nodes[0].buid, s_common.buid(('test:str', 'newp'))]
+            layr.buidcache.clear()
+
+            sodes = [sode async for sode in layr.getStorNodes(buids)]
+            self.eq([s[0] for s in sodes], sorted(buids))
+
+            sodes = dict(sodes)
+            self.eq(('test:str', 'foo'), sodes[buid]['ndef'])
+            self.eq((1420070400000, 1451606400000), sodes[buid]['props']['.seen'])
+            self.eq(100, sodes[nodes[0].buid]['tagprops'][('test', 'score')])
+            self.none(sodes[buids[2]].get('ndef'))
+            self.eq(sodes[buid], (await layr.getStorNode(buid))[1])
+
     async def test_layer_no_extra_logging(self):
 
         async with self.getTestCore() as core:
@@ -872,3 +923,236 @@ class LayerTest(s_t_utils.SynTest):
             await core.nodes('.created | delnode --force')
             nodes = await core.nodes('.created')
             self.len(0, nodes)
+
+    async def test_layer_del_array_prop(self):
+        '''
+        Regression test
+        '''
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+
+            await core.nodes('[ test:arrayprop="*" :ints=(1, 2) ]')
+            self.len(1, await core.nodes('test:arrayprop:ints*[=2]'))
+            self.len(2, list(layr.layrslab.scanByFull(db=layr.byarray)))
+
+            # deleting the prop removes its array index rows
+            await core.nodes('test:arrayprop [ -:ints ]')
+            self.len(0, await core.nodes('test:arrayprop:ints*[=2]'))
+            self.len(0, list(layr.layrslab.scanByFull(db=layr.byarray)))
+
+    def test_layer_regx_trigrams(self):
+
+        def trigs(text):
+            return s_layer.getRegxTrigrams(regex.compile(text))
+
+        self.eq(trigs('evil'), {b'evi', b'vil'})
+        self.eq(trigs('^ab(cd)e$'), {b'abc', b'bcd', b'cde'})
+        self.eq(trigs('foo.*bar'), {b'foo', b'bar'})
+        self.eq(trigs('x(?:abc)+y'), {b'abc'})
+        self.eq(trigs('ev?il'), set())
+
+        # no literals may be required from these
+        self.eq(trigs('abc|def'), set())
+        self.eq(trigs('(?i)evil'), set())
+        self.eq(trigs('a(?i:bcd)e'), set())
+        self.eq(trigs(r'\p{L}evil'), set())
+
+        # regex module only syntax is not misread as literals
+        self.eq(trigs('(?:foobar){e<=1}'), set())
+        self.eq(trigs('foobar{e}'), set())
+        self.eq(trigs('foo[[:alpha:]]bar'), set())
+        self.eq(trigs('(?|(foo)|(bar))baz'), set())
+        self.eq(trigs('foo{1,2}bar'), {b'bar'})
+
+    async def test_layer_trigram_lift(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+
+            await core.nodes('[ test:str=foobar test:str=evilcorp test:str=notevil :tick=2020 ]')
+            await core.nodes('[ inet:dns:a=(evil.com, 1.2.3.4) inet:dns:a=(good.com, 1.2.3.4) ]')
+
+            self.eq([], await core.callStorm('return($lib.layer.get().getTrigramIndexes())'))
+
+            self.true(await core.callStorm('return($lib.layer.get().addTrigramIndex(test:str))'))
+            self.false(await core.callStorm('return($lib.layer.get().addTrigramIndex(test:str))'))
+            self.true(await core.callStorm('return($lib.layer.get().addTrigramIndex(inet:dns:a:fqdn))'))
+
+            idxs = await core.callStorm('return($lib.layer.get().getTrigramIndexes())')
+            self.sorteq(idxs, ('test:str', 'inet:dns:a:fqdn'))
+
+            await self.asyncraises(s_exc.NoSuchProp, core.nodes('$lib.layer.get().addTrigramIndex(newp:newp)'))
+            await self.asyncraises(s_exc.BadArg, core.nodes('$lib.layer.get().addTrigramIndex(".seen")'))
+
+            await core.nodes('[ test:str=moreevil ]')
+
+            nodes = await core.nodes('test:str~=evil')
+            self.eq(['evilcorp', 'moreevil', 'notevil'], [n.ndef[1] for n in nodes])
+
+            self.len(1, await core.nodes('test:str~="^evil"'))
+            self.len(1, await core.nodes('inet:dns:a:fqdn~="^evil"'))
+
+            await core.nodes('[ test:str=fooxar test:str=fooxbar ]')
+
+            nodes = await core.nodes('test:str~="(?:foobar){e<=1}"')
+            self.eq(['foobar', 'fooxar', 'fooxbar'], [n.ndef[1] for n in nodes])
+
+            nodes = await core.nodes('test:str~="foo[[:alpha:]]bar"')
+            self.eq(['fooxbar'], [n.ndef[1] for n in nodes])
+
+            await core.nodes('test:str=fooxar test:str=fooxbar | delnode')
+
+            # only the rarest posting list is scanned
+            abrv = layr.getPropAbrv('test:str', None)
+            trigs = s_layer.getTrigrams('evilc')
+            self.eq(3, layr.layrslab.countdups(abrv + 'evi'.encode(), db=layr.bytrigram))
+
+            scanned = []
+            scanByDups = layr.layrslab.scanByDups
+
+            def scanlog(lkey, db=None):
+                scanned.append(lkey)
+                return scanByDups(lkey, db=db)
+
+            with mock.patch.object(layr.layrslab, 'scanByDups', scanlog):
+                buids = await alist(layr.iterTrigramBuids(abrv, trigs))
+
+            self.eq(buids, [s_common.buid(('test:str', 'evilcorp'))])
+            self.len(1, scanned)
+            self.eq(1, layr.layrslab.countdups(scanned[0], db=layr.bytrigram))
+
+            self.eq([], await alist(layr.iterTrigramBuids(abrv, s_layer.getTrigrams('newp'))))
+
+            # too many candidates to sort in memory are spooled to disk and still lifted by the index
+            with mock.patch.object(s_layer, 'LIFT_SORT_MAX', 1):
+                with mock.patch.object(layr.layrslab, 'scanByDups', scanlog):
+                    scanned.clear()
+                    nodes = await core.nodes('test:str~=evil')
+                    self.eq(['evilcorp', 'moreevil', 'notevil'], [n.ndef[1] for n in nodes])
+                    self.len(1, scanned)
+
+            # fall back to a full scan when no trigrams may be extracted
+            self.len(4, await core.nodes('test:str~="(?i)EVIL|foo"'))
+
+            await core.nodes('test:str=evilcorp | delnode')
+            await core.nodes('inet:dns:a=(evil.com, 1.2.3.4) | delnode')
+            self.len(2, await core.nodes('test:str~=evil'))
+            self.len(0, await core.nodes('inet:dns:a:fqdn~=evil'))
+
+            self.true(await core.callStorm('return($lib.layer.get().delTrigramIndex(test:str))'))
+            self.false(await core.callStorm('return($lib.layer.get().delTrigramIndex(test:str))'))
+            self.len(2, await core.nodes('test:str~=evil'))
+
+            abrv = layr.getPropAbrv('test:str', None)
+            self.len(0, list(layr.layrslab.scanByPref(abrv, db=layr.bytrigram)))
+
+    async def test_layer_tag_ival_index(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            self.true(layr.tagivals)
+
+            await core.nodes('[ test:str=foo +#cno.threat=(2010, 2012) ]')
+            await core.nodes('[ test:str=bar +#cno.threat=(2015, 2020) ]')
+            await core.nodes('[ test:int=10 +#cno.threat=(2018, 2019) ]')
+            await core.nodes('[ test:int=20 +#cno.threat ]')
+
+            self.len(2, await core.nodes('#cno.threat@=2018'))
+            self.len(1, await core.nodes('test:int#cno.threat@=2018'))
+            self.len(1, await core.nodes('#cno.threat@=(2011, 2014)'))
+            self.len(3, await core.nodes('#cno.threat@=(2000, 2030)'))
+
+            async def lift(cmpr, valu, form=None):
+                norm = core.model.type('ival').norm(valu)[0]
+                return [buid async for _, buid in layr.liftByTagValu('cno.threat', cmpr, norm, form=form)]
+
+            self.len(1, await lift('=', ('2015', '2020')))
+
+            # lifts and filters agree on the comparators supported by the ival type
+            for cmpr, valu in (('@=', '2018'), ('@=', '(2011, 2014)'), ('=', '(2015, 2020)')):
+                lifted = await core.nodes(f'#cno.threat{cmpr}{valu}')
+                filted = await core.nodes(f'.created +#cno.threat{cmpr}{valu}')
+                self.eq({n.buid for n in lifted}, {n.buid for n in filted})
+
+            for cmpr in ('<', '>'):
+                await self.asyncraises(s_exc.NoSuchCmpr, core.nodes(f'#cno.threat{cmpr}2012'))
+                await self.asyncraises(s_exc.NoSuchCmpr, core.nodes(f'.created +#cno.threat{cmpr}2012'))
+
+            await self.asyncraises(s_exc.NoSuchCmpr, lift('range=', ('2014', '2020')))
+
+            # merged and removed intervals are updated in the index
+            await core.nodes('test:str=foo [ +#cno.threat=2019 ]')
+            self.len(3, await core.nodes('#cno.threat@=2018'))
+
+            await core.nodes('test:str=bar [ -#cno.threat ]')
+            self.len(2, await core.nodes('#cno.threat@=2018'))
+            self.len(0, await lift('=', ('2015', '2020')))
+
+            # the index matches the results of the full scan
+            for cmpr, valu in (('@=', '2018'), ('@=', ('2000', '2030')), ('=', ('2010', '2012'))):
+                rows = await lift(cmpr, valu)
+                layr.tagivals = False
+                self.eq(rows, await lift(cmpr, valu))
+                layr.tagivals = True
+
+                # too many rows to sort in memory are spooled to disk
+                with mock.patch.object(s_layer, 'LIFT_SORT_MAX', 1):
+                    self.eq(rows, await lift(cmpr, valu))
+
+    def test_layer_latlong_zord(self):
+
+        stor = s_layer.StorTypeLatLon(None)
+
+        for latlong in ((0, 0), (90, 180), (-90, -180), (12.345678, -98.7654321)):
+            indx = stor._getLatLonIndx(latlong)
+            lonint = int.from_bytes(indx[:5], 'big')
+            latint = int.from_bytes(indx[5:], 'big')
+            self.eq((lonint, latint), stor.getZordValu(stor.getZordIndx(latlong)))
+
+        # every point in the box is within one of the ranges
+        ranges = stor.getZordRanges(1000, 5000, 3000, 9000)
+        self.le(len(ranges), s_layer.ZORD_CELLS * 2)
+        self.eq(ranges, sorted(ranges))
+
+        for lonint, latint in ((1000, 3000), (5000, 9000), (1000, 9000), (2500, 4000)):
+            latlong = ((latint - stor.latspace) / stor.scale, (lonint - stor.lonspace) / stor.scale)
+            zord = int.from_bytes(stor.getZordIndx(latlong), 'big')
+            self.true(any(zmin <= zord <= zmax for zmin, zmax in ranges))
+
+    async def test_layer_latlong_near(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            self.true(layr.latlongs)
+
+            await core.nodes('[ geo:place=* :latlong=(0, 0) ]')
+            await core.nodes('[ geo:place=* :latlong=(0.5, 0.5) ]')
+            await core.nodes('[ geo:place=* :latlong=(40, 0) ]')
+            await core.nodes('[ geo:place=* :latlong=(-0.5, 179.9) ]')
+
+            self.len(2, await core.nodes('geo:place:latlong*near=((0, 0), 100km)'))
+            self.len(1, await core.nodes('geo:place:latlong*near=((0, 0), 10km)'))
+            self.len(1, await core.nodes('geo:place:latlong*near=((-0.5, 179.9), 1km)'))
+
+            await core.nodes('geo:place:latlong=(0.5, 0.5) [ :latlong=(40.1, 0) ]')
+            self.len(1, await core.nodes('geo:place:latlong*near=((0, 0), 100km)'))
+            self.len(2, await core.nodes('geo:place:latlong*near=((40, 0), 100km)'))
+
+            await core.nodes('geo:place:latlong=(0, 0) [ -:latlong ]')
+            self.len(0, await core.nodes('geo:place:latlong*near=((0, 0), 100km)'))
+
+            # the index matches the results of the lon range scan
+            stor = layr.stortypes[s_layer.STOR_TYPE_LATLONG]
+            for valu in (((40, 0), 100000000), ((0, 0), 10000000000)):
+                rows = await alist(stor.indxByProp('geo:place', 'latlong', 'near=', valu))
+                layr.latlongs = False
+                self.eq(rows, await alist(stor.indxByProp('geo:place', 'latlong', 'near=', valu)))
+                layr.latlongs = True
+
+                # too many rows to sort in memory are spooled to disk
+                with mock.patch.object(s_layer, 'LIFT_SORT_MAX', 1):
+                    self.eq(rows, await alist(stor.indxByProp('geo:place', 'latlong', 'near=', valu)))
@@ -1,4 +1,5 @@
 import os
+import lmdb
 import asyncio
 import pathlib
 import multiprocessing
@@ -7,7 +8,9 @@ import synapse.common as s_common
 
 from unittest.mock import patch
 
+import synapse.lib.coro as s_coro
 import synapse.lib.const as s_const
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.thisplat as s_thisplat
 
@@ -122,12 +125,22 @@ class LmdbSlabTest(s_t_utils.SynTest):
             items = list(slab.scanByPref(b'\x00', db=foo))
             self.eq(items, ((b'\x00\x01', b'hehe'), (b'\x00\x02', b'haha')))
 
+            items = list(slab.scanByPrefs((b'\x00\x02', b'\x00\x03', b'\x01'), db=foo))
+            self.eq(items, ((b'\x00\x02', b'\x00\x02', b'haha'), (b'\x01', b'\x01\x03', b'hoho')))
+
+            items = list(slab.scanByPrefs((b'\x00\x01', b'\xff'), db=foo))
+            self.eq(items, ((b'\x00\x01', b'\x00\x01', b'hehe'),))
+
             items = list(slab.scanByRange(b'\x00\x02', b'\x01\x03', db=foo))
             self.eq(items, ((b'\x00\x02', b'haha'), (b'\x01\x03', b'hoho')))
 
             items = list(slab.scanByDups(b'\x00\x02', db=bar))
             self.eq(items, ((b'\x00\x02', b'haha'), (b'\x00\x02', b'visi'), (b'\x00\x02', b'zomg')))
 
+            items = list(slab.scanByKeys((b'\x00', b'\x00\x02', b'\x00\x03'), db=bar))
+            self.eq(items, ((b'\x00\x02', b'haha'), (b'\x00\x02', b'visi'), (b'\x00\x02', b'zomg'),
+                            (b'\x00\x03', b'hoho')))
+
             items = list(slab.scanByDups(b'\x00\x04', db=bar))
             self.eq(items, ())
 
@@ -289,6 +302,128 @@ class LmdbSlabTest(s_t_utils.SynTest):
                 self.eq(my_maxsize, newdb.mapsize)
                 self.eq(my_maxsize, newdb.maxsize)
 
+    async def test_lmdbslab_snapcopy(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+            copypath = os.path.join(dirn, 'copy.lmdb')
+
+            # databases which are not opened by this process are copied too
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+                hidedb = slab.initdb('hide')
+                slab.put(b'\x00', b'hehe', db=hidedb)
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                testdb = slab.initdb('test')
+                dupsdb = slab.initdb('dups', dupsort=True)
+
+                for i in range(10):
+                    slab.put(i.to_bytes(1, 'big'), b'asdf', db=testdb)
+                    slab.put(b'\x01', i.to_bytes(1, 'big'), db=dupsdb)
+
+                slab.put(b'\xff', b'haha')
+
+                await slab.sync()
+
+                async with await s_lmdbslab.SnapCopy.anit() as snapcopy:
+
+                    snapcopy.add(slab, copypath)
+
+                    await snapcopy.begin()
+
+                    # the copy holds no transaction on the slab itself
+                    self.eq(0, slab.readgate.readers)
+
+                    # changes committed after the transactions began are not copied
+                    slab.put(b'\x0a', b'newp', db=testdb)
+                    slab.put(b'\x01', b'\x0a', db=dupsdb)
+                    slab.initdb('newp')
+                    await slab.sync()
+
+                    # the map may be grown while the copy is running
+                    slab._handle_mapfull()
+
+                    await snapcopy.wait()
+
+            async with await s_lmdbslab.Slab.anit(copypath) as copy:
+
+                self.false(copy.dbexists('newp'))
+
+                hidedb = copy.initdb('hide')
+                testdb = copy.initdb('test')
+                dupsdb = copy.initdb('dups', dupsort=True)
+
+                self.eq(b'hehe', copy.get(b'\x00', db=hidedb))
+                self.eq(b'haha', copy.get(b'\xff'))
+                self.eq([(i.to_bytes(1, 'big'), b'asdf') for i in range(10)], list(copy.scanByFull(db=testdb)))
+                self.eq([(b'\x01', i.to_bytes(1, 'big')) for i in range(10)], list(copy.scanByFull(db=dupsdb)))
+
+            # a copy which fails is raised from the caller
+            async with await s_lmdbslab.SnapCopy.anit() as snapcopy:
+                snapcopy.slabs.append((os.path.join(dirn, 'newp.lmdb'), 100000, 128, copypath))
+                await self.asyncraises(lmdb.Error, snapcopy.begin())
+
+    async def test_lmdbslab_scanthread(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                testdb = slab.initdb('test')
+                dupsdb = slab.initdb('dups', dupsort=True)
+
+                for i in range(10):
+                    slab.put(b'\x00' + i.to_bytes(1, 'big'), b'asdf', db=testdb)
+                    slab.put(b'\x00', i.to_bytes(1, 'big'), db=dupsdb)
+                    slab.put(b'\x01', i.to_bytes(1, 'big'), db=dupsdb)
+
+                slab.put(b'\x01\x00', b'qwer', db=testdb)
+
+                # uncommitted writes are committed and read in read-only transactions
+                self.true(slab.dirty)
+
+                with patch('synapse.lib.lmdbslab.SCAN_CHUNKSIZE', 3):
+
+                    with patch.object(slab, '_scanChunk', wraps=slab._scanChunk) as chunk:
+                        rows = [r async for r in slab.scanByPrefThread(b'\x00', db=testdb)]
+                        self.eq(4, chunk.call_count)
+
+                    self.eq(rows, list(slab.scanByPref(b'\x00', db=testdb)))
+                    self.len(10, rows)
+                    self.false(slab.dirty)
+
+                    rows = [r async for r in slab.scanByPrefThread(b'\x00', db=testdb)]
+                    self.eq(rows, list(slab.scanByPref(b'\x00', db=testdb)))
+                    self.len(10, rows)
+
+                    rows = [r async for r in slab.scanByPrefThread(b'\x01', db=dupsdb)]
+                    self.eq(rows, [(b'\x01', i.to_bytes(1, 'big')) for i in range(10)])
+
+                    rows = [r async for r in slab.scanByRangeThread(b'\x00\x08', b'\x01\x00', db=testdb)]
+                    self.eq(rows, [(b'\x00\x08', b'asdf'), (b'\x00\x09', b'asdf'), (b'\x01\x00', b'qwer')])
+
+                    rows = [r async for r in slab.scanByPrefThread(b'\x02', db=testdb)]
+                    self.eq(rows, [])
+
+                    # a dirty slab which was committed for a recent scan is read from the write transaction
+                    slab.put(b'\x00\x0a', b'asdf', db=testdb)
+
+                    with patch.object(slab, '_scanChunk', wraps=slab._scanChunk) as chunk:
+                        rows = [r async for r in slab.scanByPrefThread(b'\x00', db=testdb)]
+                        self.eq(0, chunk.call_count)
+
+                    self.len(11, rows)
+                    self.true(slab.dirty)
+
+                    with patch('synapse.lib.lmdbslab.SCAN_SYNC_PERIOD', 0):
+                        rows = [r async for r in slab.scanByRangeThread(b'\x00\x09', b'\x00\x0a', db=testdb)]
+                        self.eq(rows, [(b'\x00\x09', b'asdf'), (b'\x00\x0a', b'asdf')])
+                        self.false(slab.dirty)
+
     async def test_lmdbslab_scanbump(self):
 
         with self.getTestDir() as dirn:
@@ -933,6 +1068,130 @@ class LmdbSlabTest(s_t_utils.SynTest):
 
                 self.false(mque.exists('woot'))
 
+    async def test_lmdb_multiqueue_batch(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                mque = await slab.getMultiQueue('test')
+
+                await mque.add('woot', {})
+                await mque.add('hehe', {})
+
+                self.eq(0, await mque.puts('woot', range(25000)))
+                self.eq(0, await mque.puts('hehe', ('haha',)))
+                self.eq(25000, await mque.puts('woot', (x for x in ('foo', 'bar'))))
+                self.eq(25002, await mque.puts('woot', ()))
+
+                self.eq(25002, mque.size('woot'))
+                self.eq(25002, mque.offset('woot'))
+
+                # cull in multiple chunks without touching the other queue
+                await mque.cull('woot', 22000)
+                self.eq(3001, mque.size('woot'))
+                self.eq(((22001, 22001),), [x async for x in mque.gets('woot', 0, size=1)])
+                self.eq(((0, 'haha'),), [x async for x in mque.gets('hehe', 0)])
+
+                await mque.cull('woot', 30000)
+                self.eq(0, mque.size('woot'))
+                self.eq(25002, mque.offset('woot'))
+
+                self.eq(25002, await mque.puts('woot', ('baz', 'faz')))
+
+                # counts which lag the queued items are recovered on load
+                mque.sizes.set('woot', 0)
+                mque.offsets.set('woot', 0)
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                mque = await slab.getMultiQueue('test')
+
+                self.eq(2, mque.size('woot'))
+                self.eq(25004, mque.offset('woot'))
+                self.eq(1, mque.size('hehe'))
+                self.eq(1, mque.offset('hehe'))
+
+                await mque.rem('woot')
+                self.false(mque.exists('woot'))
+
+                await mque.add('woot', {})
+                self.eq(0, mque.size('woot'))
+                self.eq(0, mque.offset('woot'))
+
+    async def test_lmdb_multiqueue_migr(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                # the sizes and offsets used to be stored in SlabDicts
+                abrv = slab.getNameAbrv('test:abrv')
+                qdata = slab.initdb('test:qdata')
+                queues = s_lmdbslab.SlabDict(slab, db=slab.initdb('test:meta'))
+                sizes = s_lmdbslab.SlabDict(slab, db=slab.initdb('test:sizes'))
+                offsets = s_lmdbslab.SlabDict(slab, db=slab.initdb('test:offs'))
+
+                abrv.setBytsToAbrv(b'woot')
+                queues.set('woot', {})
+                sizes.set('woot', 2)
+                offsets.set('woot', 12)
+
+                qabrv = abrv.nameToAbrv('woot')
+                slab.put(qabrv + s_common.int64en(10), s_msgpack.en('hehe'), db=qdata)
+                slab.put(qabrv + s_common.int64en(11), s_msgpack.en('haha'), db=qdata)
+
+                abrv.setBytsToAbrv(b'empty')
+                queues.set('empty', {})
+                sizes.set('empty', 0)
+                offsets.set('empty', 20)
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                mque = await slab.getMultiQueue('test')
+
+                self.false(slab.dbexists('test:sizes'))
+                self.false(slab.dbexists('test:offs'))
+
+                self.eq(2, mque.size('woot'))
+                self.eq(12, mque.offset('woot'))
+                self.eq(0, mque.size('empty'))
+                self.eq(20, mque.offset('empty'))
+
+                self.eq(12, await mque.put('woot', 'hoho'))
+                self.eq(20, await mque.put('empty', 'hoho'))
+
+                items = [x async for x in mque.gets('woot', 0)]
+                self.eq(((10, 'hehe'), (11, 'haha'), (12, 'hoho')), items)
+
+    async def test_lmdbslab_delbyrange(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+
+                foo = slab.initdb('foo')
+                bar = slab.initdb('bar', dupsort=True)
+
+                slab.putmulti([(b'\x00' + bytes([i]), b'haha') for i in range(10)], db=foo)
+                slab.putmulti([(b'\x01' + bytes([i]), b'hehe') for i in range(10)], db=foo)
+
+                self.eq(0, slab.delByRange(b'\x02\x00', b'\x02\xff', db=foo))
+                self.eq(2, slab.delByRange(b'\x00\x00', b'\x00\x05', limit=2, db=foo))
+                self.eq(4, slab.delByRange(b'\x00\x00', b'\x00\x05', db=foo))
+                self.eq(14, slab.delByRange(b'\x00\x00', b'\xff', db=foo))
+                self.eq((), tuple(slab.scanByFull(db=foo)))
+
+                slab.putmulti([(b'hehe', b'haha'), (b'hehe', b'hoho'), (b'hoho', b'haha')], dupdata=True, db=bar)
+                self.eq(1, slab.delByRange(b'hehe', b'hehe', db=bar))
+                self.eq(((b'hoho', b'haha'),), tuple(slab.scanByFull(db=bar)))
+
     async def test_slababrv(self):
         with self.getTestDir() as dirn:
 
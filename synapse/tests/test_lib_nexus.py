@@ -1,3 +1,7 @@
+import asyncio
+
+from unittest import mock
+
 import synapse.exc as s_exc
 
 import synapse.lib.nexus as s_nexus
@@ -52,6 +56,41 @@ class SampleNexus2(SampleNexus):
     async def _thing2handler(self):
         return self
 
+class BatchNexus(s_nexus.Pusher):
+
+    async def __anit__(self, iden, nexsroot=None):
+        await s_nexus.Pusher.__anit__(self, iden=iden, nexsroot=nexsroot)
+        self.batches = []
+        self.applied = []
+
+    @s_nexus.Pusher.onPushAuto('edits')
+    async def addThing(self, valu):
+        if valu == 'bad':
+            raise s_exc.BadArg(mesg='bad thing')
+        self.applied.append(valu)
+        return valu
+
+    @s_nexus.Pusher.onPushAuto('other')
+    async def addOther(self, valu):
+        self.applied.append(valu)
+        return valu
+
+    @s_nexus.Pusher.onPushBatch('edits')
+    async def _addThings(self, items):
+        valus = [args[0] for args, kwargs in items]
+        if 'bad' in valus:
+            raise s_exc.BadArg(mesg='bad thing')
+        self.batches.append(valus)
+        self.applied.extend(valus)
+        return valus
+
+    @s_nexus.Pusher.onPushBatch('other')
+    async def _addOthers(self, items):
+        valus = [args[0] for args, kwargs in items]
+        self.batches.append(valus)
+        self.applied.extend(valus)
+        return valus
+
 class NexusTest(s_t_utils.SynTest):
     async def test_nexus(self):
         with self.getTestDir() as dirn:
@@ -88,6 +127,198 @@ class NexusTest(s_t_utils.SynTest):
                     stream.seek(0)
                     self.isin('while replaying log', stream.read())
 
+    async def test_nexus_cull(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_nexus.NexsRoot.anit(dirn) as nexsroot, \
+                    await SampleNexus.anit(1, nexsroot=nexsroot) as nexus1:
+
+                for i in range(10):
+                    await nexus1.doathing({'specialpush': 0})
+
+                self.eq(10, nexsroot.getSnapOffs())
+
+                # entries which a mirror has not applied are retained
+                nexsroot.setMirrorAck('mirr00', 4)
+                self.eq({'mirr00': 4}, nexsroot.getMirrorAcks())
+
+                self.eq(3, await nexsroot.cull(8))
+                self.eq(4, nexsroot._nexuslog.first()[0])
+
+                self.len(6, list(nexsroot._nexuslog.iter(0)))
+
+                with self.raises(s_exc.BadArg):
+                    [item async for item in nexsroot.iter(2)]
+
+                # the last entry is always retained for recover()
+                nexsroot.delMirrorAck('mirr00')
+                self.eq(8, await nexsroot.cull(100))
+                self.eq(9, nexsroot._nexuslog.first()[0])
+                self.eq(-1, await nexsroot.cull(100))
+
+                self.eq('foo', await nexus1.doathing({'specialpush': 0}))
+                self.eq(11, nexsroot.getSnapOffs())
+
+                self.nn(nexsroot.getMirrorIden())
+                self.eq(nexsroot.getMirrorIden(), nexsroot.getMirrorIden())
+
+    async def test_nexus_eat_window(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_nexus.NexsRoot.anit(dirn) as nexsroot, \
+                    await BatchNexus.anit('batch', nexsroot=nexsroot) as nexus:
+
+                with nexsroot._getResponseFuture() as (iden0, futu0), \
+                        nexsroot._getResponseFuture() as (iden1, futu1):
+
+                    window = [
+                        (0, ('batch', 'edits', ['a'], {}, {})),
+                        (1, ('batch', 'edits', ['b'], {}, {'resp': iden0})),
+                        (2, ('batch', 'auto:newp', [], {}, {})),
+                        (3, ('batch', 'edits', ['c'], {}, {})),
+                        (4, ('batch', 'edits', ['bad'], {}, {'resp': iden1})),
+                        (5, ('batch', 'edits', ['d'], {}, {})),
+                        (6, ('batch', 'other', ['e'], {}, {})),
+                        (7, ('batch', 'other', ['f'], {}, {})),
+                    ]
+
+                    with self.getLoggerStream('synapse.lib.nexus') as stream:
+                        await nexsroot._eatWindow(window)
+
+                    # consecutive edits are applied in a single call unless the batch fails
+                    self.eq(nexus.batches, [['a', 'b']])
+                    self.eq(nexus.applied, ['a', 'b', 'c', 'd', 'e', 'f'])
+
+                    self.eq('b', futu0.result())
+                    self.isinstance(futu1.exception(), s_exc.BadArg)
+
+                    stream.seek(0)
+                    self.isin('Batch handler failed', stream.read())
+
+                self.eq(8, nexsroot._nexuslog.index())
+                self.eq(('batch', 'edits', ('c',), {}, {}), nexsroot._nexuslog.get(3))
+                self.eq(8, nexsroot._nexsmeta.get('applied'))
+
+                # entries are recorded before they are applied
+                async def crash(self_, items):
+                    self.eq(10, nexsroot._nexuslog.index())
+                    self.eq(8, nexsroot._nexsmeta.get('applied'))
+                    raise asyncio.CancelledError()
+
+                nexus._nexsbatch['edits'] = crash
+
+                window = [
+                    (8, ('batch', 'edits', ['g'], {}, {})),
+                    (9, ('batch', 'edits', ['h'], {}, {})),
+                ]
+                with self.raises(asyncio.CancelledError):
+                    await nexsroot._eatWindow(window)
+
+                self.eq(8, nexsroot.getSnapOffs())
+
+                # the whole window which was not fully applied is replayed
+                nexus.applied.clear()
+                await nexsroot.recover()
+                self.eq(nexus.applied, ['g', 'h'])
+                self.eq(10, nexsroot._nexsmeta.get('applied'))
+
+                nexus.applied.clear()
+                await nexsroot.recover()
+                self.eq(nexus.applied, [])
+
+                # once it is a leader, only the last entry is replayed
+                self.eq('i', await nexus.addOther('i'))
+                self.none(nexsroot._nexsmeta.get('applied'))
+
+                nexus.applied.clear()
+                await nexsroot.recover()
+                self.eq(nexus.applied, ['i'])
+
+    async def test_nexus_follow_windows(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_nexus.NexsRoot.anit(dirn) as nexsroot:
+
+                async def genr():
+                    for i in range(5):
+                        yield i
+
+                with mock.patch('synapse.lib.nexus.FOLLOWER_WINDOW_SIZE', 2):
+                    windows = [w async for w in nexsroot._iterFollowWindows(genr())]
+
+                self.eq([0, 1, 2, 3, 4], [i for w in windows for i in w])
+                self.true(all(len(w) <= 2 for w in windows))
+
+                async def genrerr():
+                    yield 0
+                    raise s_exc.LinkShutDown(mesg='gone')
+
+                with self.raises(s_exc.LinkShutDown):
+                    [w async for w in nexsroot._iterFollowWindows(genrerr())]
+
+                produced = []
+
+                async def genrbig():
+                    for i in range(100):
+                        produced.append(i)
+                        yield i
+
+                # entries are only read a bounded number of windows ahead of the consumer
+                with mock.patch('synapse.lib.nexus.FOLLOWER_WINDOW_SIZE', 2):
+                    with mock.patch('synapse.lib.nexus.FOLLOWER_WINDOW_BUFFER', 2):
+                        windows = nexsroot._iterFollowWindows(genrbig())
+                        self.nn(await windows.__anext__())
+                        await asyncio.sleep(0.1)
+                        self.le(len(produced), 8)
+                        await windows.aclose()
+
+    async def test_nexus_applygate(self):
+
+        gate = s_nexus.ApplyGate()
+
+        # any number of changes may be applied at once
+        async with gate.applying():
+            async with gate.applying():
+                self.eq(2, gate.appliers)
+
+        applied = asyncio.Event()
+        release = asyncio.Event()
+
+        async def apply():
+            async with gate.applying():
+                applied.set()
+                await release.wait()
+
+        task = asyncio.create_task(apply())
+        await applied.wait()
+
+        # exclusive waits for changes being applied and blocks new ones
+        locked = asyncio.Event()
+
+        async def exclusive():
+            async with gate.exclusive():
+                locked.set()
+                await asyncio.sleep(0.1)
+                self.eq(0, gate.appliers)
+
+        extask = asyncio.create_task(exclusive())
+        await asyncio.sleep(0.01)
+        self.false(locked.is_set())
+
+        release.set()
+        await task
+        await locked.wait()
+
+        async def applied2():
+            async with gate.applying():
+                return gate.appliers
+
+        self.eq(1, await applied2())
+        self.true(extask.done())
+
     async def test_nexus_no_logging(self):
         '''
         Pushers/NexsRoot works with donexslog=False
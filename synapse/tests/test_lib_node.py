@@ -65,6 +65,41 @@ class NodeTest(s_t_utils.SynTest):
                 self.none(reprs.get('.newp'))
                 self.eq(tagpropreprs, {'foo': {'score': '10'}})
 
+    async def test_pack_fields(self):
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+            await core.nodes('[ test:str=cool :tick=2020 +#foo.bar:score=10 +#foo.bar.baz +#hehe:score=20 ]')
+
+            opts = {'repr': True, 'fields': [':tick', '.created', '#foo.bar']}
+            msgs = await core.stormlist('test:str', opts=opts)
+            pode = [m[1] for m in msgs if m[0] == 'node'][0]
+
+            self.eq(('test:str', 'cool'), pode[0])
+            self.eq(('.created', 'tick'), tuple(sorted(pode[1]['props'].keys())))
+            self.eq(('.created', 'tick'), tuple(sorted(pode[1]['reprs'].keys())))
+            self.eq(('foo.bar', 'foo.bar.baz'), tuple(sorted(pode[1]['tags'].keys())))
+            self.eq({'foo.bar': {'score': 10}}, pode[1]['tagprops'])
+            self.eq({'foo.bar': {'score': '10'}}, pode[1]['tagpropreprs'])
+            self.nn(pode[1].get('path'))
+
+            # no fields only packs the ndef
+            msgs = await core.stormlist('test:str', opts={'fields': []})
+            pode = [m[1] for m in msgs if m[0] == 'node'][0]
+            self.eq({}, pode[1]['props'])
+            self.eq({}, pode[1]['tags'])
+            self.eq({}, pode[1]['tagprops'])
+
+            nodes = await core.nodes('test:str')
+            self.eq(nodes[0].pack()[1]['tags'], {'foo': (None, None), 'foo.bar': (None, None),
+                                                 'foo.bar.baz': (None, None), 'hehe': (None, None)})
+            self.eq({'hehe': {'score': 20}}, nodes[0].pack(props=(), tags=('hehe',))[1]['tagprops'])
+
+            msgs = await core.stormlist('test:str', opts={'fields': [10]})
+            errs = [m[1] for m in msgs if m[0] == 'err']
+            self.eq('BadArg', errs[0][0])
+
     async def test_set(self):
         form = 'test:str'
         valu = 'cool'
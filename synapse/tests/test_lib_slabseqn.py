@@ -94,3 +94,31 @@ class SlabSeqn(s_t_utils.SynTest):
             await task
 
             await slab.fini()
+
+    async def test_slab_seqn_cull(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path, map_size=1000000) as slab:
+
+                seqn = s_slabseqn.SlabSeqn(slab, 'seqn:test')
+                self.none(seqn.first())
+                self.false(await seqn.cull(10))
+
+                seqn.save(('foo', 10, 20, 30))
+                self.eq((0, 'foo'), seqn.first())
+
+                self.true(await seqn.cull(1))
+                self.eq((2, 20), seqn.first())
+                self.eq(((2, 20), (3, 30)), tuple(seqn.iter(0)))
+
+                # culling does not change the next insert offset
+                self.eq(4, seqn.index())
+                self.eq(4, seqn.add('bar'))
+
+            async with await s_lmdbslab.Slab.anit(path, map_size=1000000) as slab:
+                seqn = s_slabseqn.SlabSeqn(slab, 'seqn:test')
+                self.eq(5, seqn.index())
+                self.eq((2, 20), seqn.first())
@@ -3,10 +3,13 @@ import random
 import asyncio
 import contextlib
 import collections
+from unittest import mock
 
 import synapse.exc as s_exc
+import synapse.common as s_common
 
 import synapse.lib.coro as s_coro
+import synapse.lib.layer as s_layer
 
 from synapse.tests.utils import alist
 import synapse.tests.utils as s_t_utils
@@ -132,6 +135,73 @@ class SnapTest(s_t_utils.SynTest):
                 self.eq(node2, node)
                 self.nn(node2.get('baz'))
 
+    async def test_addNodesBatch(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('[ test:str=foo test:str=bar +#hehe.haha=(2015, 2016) ]')
+            await core.addTagProp('score', ('int', {}), {})
+
+            calls = []
+            stor = s_layer.Layer.storNodeEdits
+
+            async def storNodeEdits(self, nodeedits, meta):
+                calls.append(nodeedits)
+                return await stor(self, nodeedits, meta)
+
+            ndefs = [(('test:str', f'v{i}'), {'props': {'tick': i}, 'tags': {'hehe.haha': (None, None), 'rofl': (2019, 2020)},
+                                              'tagprops': {'hehe': {'score': i}}}) for i in range(20)]
+            ndefs.extend((
+                (('test:str', 'foo'), {'tags': {'hehe.haha': (2010, 2011)}}),
+                (('test:str', 'bar'), {'tags': {'hehe': (None, None)}}),
+                (('test:int', 'newp'), {}),
+                (('test:str', 'baz'), {'tagprops': {'hehe': {'newp': 10}}}),
+                (('test:str', 'qux'), {'tags': {'hehe': 'newp', 'rofl': (None, None)}, 'tagprops': {'rofl': {'score': 'newp'}}}),
+            ))
+
+            async with await core.snap() as snap:
+
+                snap.strict = False
+
+                # populate the tag node cache
+                await snap.addTagNode('hehe')
+                await snap.addTagNode('hehe.haha')
+                await snap.addTagNode('rofl')
+
+                with mock.patch('synapse.lib.layer.Layer.storNodeEdits', storNodeEdits):
+                    with mock.patch('synapse.lib.snap.ADD_NODES_EDIT_SIZE', 10):
+                        nodes = await alist(snap.addNodes(ndefs))
+
+            # the nodes, tags and tag props are stored in batches of node edits
+            self.eq([10, 10, 4], [len(c) for c in calls])
+
+            self.len(24, nodes)
+            self.eq(('test:str', 'v3'), nodes[3].ndef)
+            self.eq(3, nodes[3].get('tick'))
+            self.eq((None, None), nodes[3].getTag('hehe'))
+            self.eq((2019, 2020), nodes[3].getTag('rofl'))
+            self.eq(3, nodes[3].getTagProp('hehe', 'score'))
+            self.eq(('test:str', 'qux'), nodes[23].ndef)
+
+            # tag intervals on existing nodes are merged
+            nodes = await core.nodes('test:str=foo')
+            self.eq((2010, 1451606400000), nodes[0].getTag('hehe.haha'))
+
+            nodes = await core.nodes('test:str=bar')
+            self.eq((1420070400000, 1451606400000), nodes[0].getTag('hehe.haha'))
+            self.eq((None, None), nodes[0].getTag('hehe'))
+
+            self.len(21, await core.nodes('test:str#rofl'))
+            self.len(20, await core.nodes('#hehe:score'))
+            self.len(1, await core.nodes('test:str=baz +#hehe'))
+            self.len(0, await core.nodes('test:int'))
+
+            # a bad tag or tag prop does not drop the rest of the nodedef
+            nodes = await core.nodes('test:str=qux')
+            self.none(nodes[0].getTag('hehe'))
+            self.eq((None, None), nodes[0].getTag('rofl'))
+            self.none(nodes[0].getTagProp('rofl', 'score'))
+
     async def test_addNodesAuto(self):
         '''
         Secondary props that are forms when set make nodes
@@ -367,6 +437,62 @@ class SnapTest(s_t_utils.SynTest):
             self.len(1, await alist(view0.eval('[ inet:ipv4=1.2.3.4 :asn=99 ]')))
             self.len(0, await alist(view1.eval('inet:ipv4:asn=99')))
 
+    async def test_cortex_lift_layers_merge(self):
+        '''
+        Test that lifts across layers are merged in index order and masked values are skipped
+        '''
+        async with self._getTestCoreMultiLayer() as (view0, view1):
+
+            await alist(view0.eval('[ inet:ipv4=1.2.3.1 :asn=10 ]'))
+            await alist(view0.eval('[ inet:ipv4=1.2.3.3 :asn=30 +#foo ]'))
+            await alist(view1.eval('[ inet:ipv4=1.2.3.2 :asn=20 ]'))
+            await alist(view1.eval('[ inet:ipv4=1.2.3.4 :asn=5 +#foo ]'))
+            await alist(view1.eval('inet:ipv4=1.2.3.3 [ :asn=40 ]'))
+
+            nodes = await alist(view1.eval('inet:ipv4'))
+            self.eq([n.ndef[1] for n in nodes], [0x01020301, 0x01020302, 0x01020303, 0x01020304])
+
+            nodes = await alist(view1.eval('inet:ipv4:asn'))
+            self.eq([n.get('asn') for n in nodes], [5, 10, 20, 40])
+
+            nodes = await alist(view1.eval('inet:ipv4:asn>=10'))
+            self.eq([n.get('asn') for n in nodes], [10, 20, 40])
+
+            nodes = await alist(view1.eval('inet:ipv4:asn=30'))
+            self.len(0, nodes)
+
+            nodes = await alist(view1.eval('#foo'))
+            self.eq(set([n.ndef[1] for n in nodes]), {0x01020303, 0x01020304})
+
+            layr0 = view0.layers[0]
+
+            rows = [r async for r in layr0.liftByProp('inet:ipv4', 'asn')]
+            self.len(2, rows)
+            self.true(all(len(lkey) == 16 and len(buid) == 32 for (lkey, buid) in rows))
+
+            buid = s_common.buid(('inet:ipv4', 0x01020303))
+            self.true(layr0.hasNodeForm(buid))
+            self.true(layr0.hasNodeProp(buid, 'asn'))
+            self.true(layr0.hasNodeTag(buid, 'foo'))
+            self.false(layr0.hasNodeTag(buid, 'bar'))
+            self.false(layr0.hasNodeTagProp(buid, 'foo', 'score'))
+            self.false(layr0.hasNodeForm(s_common.buid(('inet:ipv4', 0x01020302))))
+
+            # negative floats are merged in value order
+            await alist(view0.eval('[ test:float=-5.5 test:float=-1.5 test:float=2.5 ]'))
+            await alist(view1.eval('[ test:float=-3.5 test:float=-0.0 test:float=1.5 ]'))
+
+            nodes = await alist(view1.eval('test:float<3'))
+            self.eq([n.ndef[1] for n in nodes], [-5.5, -3.5, -1.5, -0.0, 1.5, 2.5])
+
+            nodes = await alist(view1.eval('test:float>=-4'))
+            self.eq([n.ndef[1] for n in nodes], [-3.5, -1.5, -0.0, 1.5, 2.5])
+
+            nodes = await alist(view1.eval('test:float*range=(-6, -1)'))
+            self.eq([n.ndef[1] for n in nodes], [-5.5, -3.5, -1.5])
+
+            self.eq(3, await view1.core.count('test:float*range=(-6, -1)', opts={'view': view1.iden}))
+
     async def test_cortex_lift_bytype(self):
         async with self.getTestCore() as core:
             await core.nodes('[ inet:dns:a=(vertex.link, 1.2.3.4) ]')
@@ -97,6 +97,31 @@ class CoreSpawnTest(s_test.SynTest):
                     todo.put(None)
                     self.none(await s_spawn._innerloop(core, todo, done))
 
+                    # Test incremental updates sent by the SpawnPool
+                    pkgdef = {
+                        'name': 'updpkg',
+                        'version': (0, 0, 1),
+                        'commands': ({'name': 'updcmd', 'storm': '$lib.print(updated)'},),
+                    }
+                    todo.put({'updates': [
+                        ('model:tagprop:add', ('score', ('int', {}), {})),
+                        ('pkg:load', (pkgdef,)),
+                    ]})
+                    self.true(await s_spawn._innerloop(core, todo, done))
+                    self.true(done.get(timeout=12))
+                    self.nn(core.model.getTagProp('score'))
+                    self.nn(core.getStormCmd('updcmd'))
+
+                    todo.put({'updates': [('pkg:drop', (pkgdef,)), ('model:tagprop:del', ('score',))]})
+                    self.true(await s_spawn._innerloop(core, todo, done))
+                    self.true(done.get(timeout=12))
+                    self.none(core.model.getTagProp('score'))
+                    self.none(core.getStormCmd('updcmd'))
+
+                    todo.put({'updates': [('newp', ())]})
+                    self.true(await s_spawn._innerloop(core, todo, done))
+                    self.false(done.get(timeout=12))
+
                     # Test a real item with a link associated with it. This ends
                     # up getting a bunch of telepath message directly.
                     todo_item = item.copy()
@@ -246,19 +271,29 @@ class CoreSpawnTest(s_test.SynTest):
                 fire_data = fires[0].get('data')
                 self.ne(fire_data.get('tick'), fire_data.get('tock'))
 
-                # Add a stormpkg - this should fini the spawnpool spawnprocs
+                # Add a stormpkg - this is shipped to the existing spawnprocs
                 procs = [p for p in core.spawnpool.spawns.values()]
                 self.isin(len(procs), (1, 2, 3))
 
                 await core.addStormPkg(pkgdef)
 
+                # Test a pure storm commands
+                msgs = await prox.storm('inet:fqdn=vertex.link | passthrough', opts=opts).list()
+                self.stormIsInPrint("('inet:fqdn', 'vertex.link')", msgs)
+
+                for proc in procs:
+                    self.false(proc.isfini)
+
+                self.len(len(procs), core.spawnpool.spawns)
+
+                # A full bump ( such as for a layer change ) still retires the spawnprocs
+                await core.bumpSpawnPool()
                 for proc in procs:
                     self.true(await proc.waitfini(6))
 
                 self.len(0, core.spawnpool.spawnq)
                 self.len(0, core.spawnpool.spawns)
 
-                # Test a pure storm commands
                 msgs = await prox.storm('inet:fqdn=vertex.link | passthrough', opts=opts).list()
                 self.stormIsInPrint("('inet:fqdn', 'vertex.link')", msgs)
 
@@ -594,6 +629,78 @@ class CoreSpawnTest(s_test.SynTest):
             msgs = await prox.storm('inet:ipv4#foo.bar:added', opts=opts).list()
             self.len(3, msgs)
 
+            # writes which have not been committed by the sync loop are visible to a reused process
+            await core.nodes('[ inet:ipv4=5.6.7.8 ]')
+            msgs = await prox.storm('inet:ipv4=5.6.7.8', opts=opts).list()
+            self.len(3, msgs)
+
+    async def test_spawn_pool_warm(self):
+
+        conf = {'spawn:poolsize': 4, 'spawn:poolsize:min': 2}
+        async with self.getTestCoreAndProxy(conf=conf) as (core, prox):
+
+            opts = {'spawn': True}
+
+            async def waitwarm():
+                for _ in range(60):
+                    if len(core.spawnpool.spawnq) >= 2:
+                        return True
+                    await asyncio.sleep(0.5)
+                return False
+
+            self.true(await waitwarm())
+            procs = list(core.spawnpool.spawnq)
+
+            # model changes are shipped to the warm processes
+            await core.addTagProp('score', ('int', {}), {})
+            await core.nodes('[ test:int=10 +#foo:score=20 ]')
+            await s_lmdbslab.Slab.syncLoopOnce()
+
+            msgs = await prox.storm('test:int#foo:score=20', opts=opts).list()
+            podes = [m[1] for m in msgs if m[0] == 'node']
+            self.len(1, podes)
+
+            for proc in procs:
+                self.false(proc.isfini)
+
+            # the update log is trimmed once every holder has applied it
+            pool = core.spawnpool
+            self.gt(len(pool.updates), 0)
+
+            # wait for the processes which are still starting to join the pool
+            for _ in range(60):
+                if not pool.newoffs and len(pool.spawnq) == len(pool.spawns):
+                    break
+                await asyncio.sleep(0.5)
+
+            for proc in list(pool.spawnq):
+                self.true(await pool._sync(proc))
+
+            pool.spawninfo = None
+            pool._trimUpdates()
+            self.len(0, pool.updates)
+            self.eq(pool.updatebase, pool._getUpdateOffs())
+
+            # later updates are still shipped to the warm processes
+            await core.addTagProp('rank', ('int', {}), {})
+            await core.nodes('[ test:int=10 +#foo:rank=30 ]')
+            await s_lmdbslab.Slab.syncLoopOnce()
+
+            msgs = await prox.storm('test:int#foo:rank=30', opts=opts).list()
+            podes = [m[1] for m in msgs if m[0] == 'node']
+            self.len(1, podes)
+
+            for proc in procs:
+                self.false(proc.isfini)
+
+            # a full bump retires the processes and the pool is refilled
+            await core.bumpSpawnPool()
+            for proc in procs:
+                self.true(await proc.waitfini(6))
+
+            self.true(await waitwarm())
+            self.len(2, core.spawnpool.spawns)
+
     async def test_spawn_dmon_cmds(self):
         '''
         Copied from test-cortex_storm_lib_dmon_cmds
@@ -623,6 +730,73 @@ class CoreSpawnTest(s_test.SynTest):
 
             msgs = await prox.storm('$lib.dmon.del($ddef.iden)').list()
 
+    async def test_spawn_cron_dmon(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('$lib.queue.add(dmon)')
+            await core.nodes('[ inet:ipv4=1.2.3.4 inet:ipv4=5.6.7.8 ]')
+            await s_lmdbslab.Slab.syncLoopOnce()
+
+            # cron jobs may run in a spawn process
+            cdef = {'storm': 'inet:ipv4', 'reqs': {'hour': 2}, 'spawn': True,
+                    'creator': core.auth.rootuser.iden}
+            cdef = await core.addCronJob(cdef)
+
+            appt = await core.agenda.get(cdef.get('iden'))
+            await core.agenda._runJob(core.auth.rootuser, appt)
+            self.eq(appt.lastresult, 'finished successfully with 2 nodes')
+            self.eq(1, sum(appt.runtimes))
+
+            # spawned storm is read-only
+            await core.agenda.mod(appt.iden, '[ inet:ipv4=9.9.9.9 ]')
+            await core.agenda._runJob(core.auth.rootuser, appt)
+            self.isin('raised exception', appt.lastresult)
+            self.eq(2, sum(appt.runtimes))
+
+            # without a spawn pool the job fails with a clear error
+            spawnpool = core.spawnpool
+            core.spawnpool = None
+            await core.agenda._runJob(core.auth.rootuser, appt)
+            core.spawnpool = spawnpool
+            self.isin('spawn pool is not initialized', appt.lastresult)
+
+            # so are dmons
+            await core.nodes('''
+                $lib.dmon.add(${
+                    $lib.print(spawned)
+                    inet:ipv4
+                    $lib.queue.get(dmon).put($node.repr())
+                }, name=spawndmon, spawn=$lib.true)
+            ''')
+
+            msgs = await core.stormlist('for ($offs, $item) in $lib.queue.get(dmon).gets(size=2) { $lib.print($item) }')
+            self.stormIsInPrint('1.2.3.4', msgs)
+            self.stormIsInPrint('5.6.7.8', msgs)
+
+            ddef = (await core.getStormDmons())[0]
+            self.true(ddef.get('spawn'))
+            self.isin(('print', {'mesg': 'spawned'}), [m[1] for m in core.stormdmons.getDmonRunlog(ddef['iden'])])
+
+    async def test_spawn_dmon_boot(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCore(dirn=dirn) as core:
+                await core.nodes('$lib.queue.add(dmon)')
+                await core.nodes('[ inet:ipv4=1.2.3.4 ]')
+                await core.nodes('$lib.dmon.add(${ inet:ipv4 $lib.queue.get(dmon).put($node.repr()) }, spawn=$lib.true)')
+                msgs = await core.stormlist('for ($offs, $item) in $lib.queue.get(dmon).gets(size=1) { $lib.print($item) }')
+                self.stormIsInPrint('1.2.3.4', msgs)
+
+            # spawn dmons started at boot run once the spawn pool exists
+            async with self.getTestCore(dirn=dirn) as core:
+                msgs = await core.stormlist('for ($offs, $item) in $lib.queue.get(dmon).gets(1, size=1) { $lib.print($item) }')
+                self.stormIsInPrint('1.2.3.4', msgs)
+
+                ddef = (await core.getStormDmons())[0]
+                self.eq('running', core.stormdmons.getDmon(ddef['iden']).status)
+
     async def test_spawn_forked_view(self):
         async with self.getTestCoreAndProxy() as (core, prox):
             await core.nodes('[ test:str=1234 ]')
@@ -54,3 +54,28 @@ class SpooledTest(s_test.SynTest):
                 await sset.add(30)
                 self.true(os.path.isdir(sset.slabpath))
                 self.true(os.path.abspath(sset.slabpath).startswith(dirn))
+
+    async def test_spooled_sorted(self):
+
+        rows = [(i.to_bytes(2, 'big'), b'\x01') for i in reversed(range(5))]
+        rows.append((b'\x00\x02', b'\x00'))
+
+        async with await s_spooled.Sorted.anit(size=3) as srtd:
+
+            await srtd.add(*rows[0])
+            await srtd.add(*rows[1])
+            self.false(srtd.fallback)
+            self.eq(sorted(rows[:2]), list(srtd.items()))
+
+            # Trigger fallback
+            [await srtd.add(*row) for row in rows[2:]]
+            self.true(srtd.fallback)
+            self.len(6, srtd)
+
+            self.eq(sorted(rows), list(srtd.items()))
+            self.true(os.path.isdir(srtd.slabpath))
+
+        self.false(os.path.isdir(srtd.slabpath))
+
+        async with await s_spooled.Sorted.anit() as srtd:
+            self.eq([], list(srtd.items()))
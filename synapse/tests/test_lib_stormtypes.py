@@ -1343,6 +1343,11 @@ class StormTypesTest(s_test.SynTest):
             byts = b''.join([b async for b in core.axon.get(bkey)])
             self.eq(b'asdfasdf', byts)
 
+            text = 'return($lib.bytes.hashset(2413fb3709b05939f04cf2e92f7d0897fc2596f9ad0b8a9ea855c7bfebaae892))'
+            hashes = await core.callStorm(text)
+            self.eq('6a204bd89f3c8348afd5c77c717a097a', hashes.get('md5'))
+            self.eq('2413fb3709b05939f04cf2e92f7d0897fc2596f9ad0b8a9ea855c7bfebaae892', hashes.get('sha256'))
+
             # Allow bytes to be directly decoded as a string
             opts = {'vars': {'buf': 'hehe'.encode()}}
             nodes = await core.nodes('$valu=$buf.decode() [test:str=$valu]', opts)
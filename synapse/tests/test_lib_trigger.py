@@ -1,3 +1,5 @@
+import asyncio
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
@@ -203,6 +205,68 @@ class TrigTest(s_t_utils.SynTest):
             await self.asyncraises(s_exc.NoSuchIden, view.delTrigger('newp'))
             await self.asyncraises(s_exc.NoSuchIden, view.setTriggerInfo('newp', 'enabled', True))
 
+    async def test_trigger_async(self):
+
+        async with self.getTestCore() as core:
+
+            view = core.view
+
+            async def waitQueueEmpty():
+                for _ in range(100):
+                    if core.trigqueue.size(view.iden) == 0:
+                        return
+                    await asyncio.sleep(0.1)
+                raise AssertionError('async trigger queue was not drained')
+
+            await core.nodes('$lib.queue.add(runs)')
+
+            storm = 'init { $lib.queue.get(runs).put($tag) } [ +#done ]'
+            tdef = {'cond': 'tag:add', 'tag': 'foo', 'storm': storm, 'async': True}
+            tdef = await view.addTrigger(tdef)
+
+            # the edit does not run the trigger inline
+            nodes = await core.nodes('[ test:str=inline +#foo ]')
+            self.nn(nodes[0].tags.get('foo'))
+            self.none(nodes[0].tags.get('done'))
+
+            await waitQueueEmpty()
+            self.len(1, await core.nodes('test:str=inline +#done'))
+            self.eq(1, await core.callStorm('return($lib.queue.get(runs).size())'))
+
+            # queued events are run as a single batch over all the nodes
+            await core.nodes('[ test:str=a test:str=b test:str=c ]')
+
+            trigiden = tdef.get('iden')
+            items = [(view.iden, trigiden, ('test:str', valu), {'tag': 'foo'}) for valu in 'abc']
+            await core.trigqueue.puts(view.iden, items)
+
+            await waitQueueEmpty()
+            self.len(4, await core.nodes('test:str +#done'))
+            self.eq(2, await core.callStorm('return($lib.queue.get(runs).size())'))
+
+            # a batch which fails is logged and the worker moves on
+            await core.trigqueue.puts(view.iden, [('newp',)])
+            await waitQueueEmpty()
+
+            await core.nodes('[ test:str=d ]')
+            await core.trigqueue.puts(view.iden, [(view.iden, trigiden, ('test:str', 'd'), {'tag': 'foo'})])
+
+            await waitQueueEmpty()
+            self.len(5, await core.nodes('test:str +#done'))
+
+            # async node:del triggers are not supported
+            tdef = {'cond': 'node:del', 'form': 'test:str', 'storm': '[ +#del ]', 'async': True}
+            await self.asyncraises(s_exc.BadOptValu, view.addTrigger(tdef))
+
+            tdef = await view.addTrigger({'cond': 'node:del', 'form': 'test:str', 'storm': '[ +#del ]'})
+            await self.asyncraises(s_exc.BadOptValu, view.setTriggerInfo(tdef['iden'], 'async', True))
+
+            # the queue for a view is removed with the view
+            vdef = await core.addView({'layers': (view.layers[0].iden,)})
+            self.true(core.trigqueue.exists(vdef['iden']))
+            await core.delView(vdef['iden'])
+            self.false(core.trigqueue.exists(vdef['iden']))
+
     async def test_trigger_delete(self):
 
         async with self.getTestCore() as core:
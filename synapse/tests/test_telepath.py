@@ -5,6 +5,7 @@ import socket
 import asyncio
 import logging
 import threading
+import unittest.mock as mock
 
 logger = logging.getLogger(__name__)
 
@@ -442,6 +443,148 @@ class TeleTest(s_t_utils.SynTest):
 
             await self.asyncraises(s_exc.IsFini, asyncio.wait_for(task, timeout=2))
 
+    async def test_telepath_yields(self):
+
+        class Genrs:
+
+            async def agenr(self, x):
+                for i in range(x):
+                    yield {'i': i}
+
+            def genr(self, x):
+                for i in range(x):
+                    yield ('i', i)
+
+            async def boom(self, x):
+                for i in range(x):
+                    yield i
+                raise s_exc.BadArg(mesg='boom')
+
+        count = s_daemon.T2_YIELDS_COUNT * s_telepath.T2_YIELDS_CREDIT * 2 + 3
+
+        async with self.getTestDmon() as dmon:
+
+            dmon.share('genrs', Genrs())
+
+            async with await s_telepath.openurl('tcp://127.0.0.1/genrs', port=dmon.addr[1]) as prox:
+
+                self.eq([{'i': i} for i in range(count)], [x async for x in prox.agenr(count)])
+                self.eq([('i', i) for i in range(count)], await (await prox.genr(count)).list())
+                self.eq([], [x async for x in prox.agenr(0)])
+
+                items = []
+                with self.raises(s_exc.BadArg):
+                    async for item in prox.boom(10):
+                        items.append(item)
+                self.eq(list(range(10)), items)
+
+                # a client which does not offer credit receives one t2:yield per item
+                with mock.patch('synapse.telepath.T2_YIELDS_CREDIT', None):
+                    self.eq([{'i': i} for i in range(10)], [x async for x in prox.agenr(10)])
+
+                # breaking out of a batched generator leaves the pool link usable
+                async for item in prox.agenr(count):
+                    break
+                self.eq([{'i': 0}], [x async for x in prox.agenr(1)])
+
+        # credit is only returned for frames which have been sent
+        class Link:
+            async def tx(self, mesg):
+                pass
+
+        yields = s_daemon.T2Yields(Link(), 2)
+
+        await yields.add(0)
+        await yields.flush()
+
+        yields.release(10)
+        self.eq(0, yields.unacked)
+
+        await yields.credit.acquire()
+        await yields.credit.acquire()
+        self.true(yields.credit.locked())
+
+    async def test_telepath_mux(self):
+
+        class Muxed:
+
+            def __init__(self):
+                self.running = 0
+                self.maxrunning = 0
+                self.genrfini = asyncio.Event()
+
+            async def echo(self, x):
+                self.running += 1
+                self.maxrunning = max(self.maxrunning, self.running)
+                await asyncio.sleep(0.01)
+                self.running -= 1
+                return x
+
+            async def agenr(self, x):
+                for i in range(x):
+                    yield i
+
+            async def forever(self):
+                try:
+                    while True:
+                        yield 'haha'
+                        await asyncio.sleep(0.01)
+                finally:
+                    self.genrfini.set()
+
+        muxed = Muxed()
+
+        async with self.getTestDmon() as dmon:
+
+            dmon.share('muxed', muxed)
+
+            url = f'tcp://127.0.0.1:{dmon.addr[1]}/muxed'
+
+            with mock.patch('synapse.daemon.T2_MUX_TASKS', 4):
+
+                async with await s_telepath.openurl(url, mux=True) as prox:
+
+                    self.eq({'tasks': 4}, prox.muxinfo)
+
+                    retn = await asyncio.gather(*[prox.echo(i) for i in range(20)])
+                    self.eq(list(range(20)), retn)
+
+                    # the calls shared the main link and were limited per session
+                    self.len(0, prox.links)
+                    self.eq(4, muxed.maxrunning)
+
+                    async def genr(x):
+                        return [i async for i in prox.agenr(x)]
+
+                    count = s_daemon.T2_YIELDS_COUNT * s_telepath.T2_YIELDS_CREDIT * 2
+                    retn = await asyncio.gather(genr(count), genr(10), prox.echo('hehe'))
+                    self.eq([list(range(count)), list(range(10)), 'hehe'], retn)
+
+                    await self.asyncraises(s_exc.NoSuchMeth, prox.newp())
+
+                    # abandoning a generator cancels the remote task
+                    async for item in prox.forever():
+                        break
+
+                    self.true(await s_coro.event_wait(muxed.genrfini, timeout=2))
+                    self.len(0, prox.muxtasks)
+
+                    self.eq('hoho', await prox.echo('hoho'))
+                    self.len(0, prox.links)
+
+                # without the option calls still use the link pool
+                async with await s_telepath.openurl(url) as prox:
+                    self.eq('hoho', await prox.echo('hoho'))
+                    self.len(1, prox.links)
+
+                async with await s_telepath.openurl(url + '?mux=0') as prox:
+                    self.eq('hoho', await prox.echo('hoho'))
+                    self.len(1, prox.links)
+
+                async with await s_telepath.openurl(url + '?mux=1') as prox:
+                    self.eq('hoho', await prox.echo('hoho'))
+                    self.len(0, prox.links)
+
     async def test_telepath_blocking(self):
         ''' Make sure that async methods on the same proxy don't block each other '''
 